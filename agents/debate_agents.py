@@ -1,15 +1,22 @@
-from crewai import Agent
 import sys
 import os
+import threading
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.memory_system import debate_memory
+from core.memory_system import get_debate_memory
+from core.rating_system import CRITERIA
+from core.retrieval_system import get_argument_index
 
 
 class DebateAgent:
-    """Flexible wrapper around CrewAI Agent to allow stance assignment and bios."""
+    """Immutable debater persona: identity, personality and bio.
+
+    Per-debate state (stance, learning context, CrewAI agent) lives in a
+    DebaterSession from start_session(), so one persona can take part in
+    several debates at once.
+    """
 
     def __init__(self, name, personality, expertise, bio, avatar_url=None):
         self.name = name
@@ -17,49 +24,25 @@ class DebateAgent:
         self.expertise = expertise
         self.bio = bio
         self.avatar_url = avatar_url or f"https://api.dicebear.com/7.x/avataaars/svg?seed={name}"
-        self.stance = None
-        self.learning_context = ""
-        
-        # Create a minimal agent immediately; we'll inject learning context
-        # right before the debate when stance is assigned.
-        self.agent = Agent(
-            name=self.name,
-            role="Debater",
-            goal="Engage in structured debates using logic and persuasion.",
-            backstory=(
-                f"You are {self.name}, a skilled debater with a {self.personality}. "
-                f"You have expertise in {self.expertise}. You can argue for or against any topic effectively."
-            ),
-        )
+        self._frozen = True
 
-    def _update_agent(self):
-        """Create or update the CrewAI agent with current learning context."""
-        # Get learning context from memory
-        self.learning_context = debate_memory.get_debater_learning_context(self.name)
-        
-        # Create agent with enhanced backstory including learning context
-        self.agent = Agent(
-            name=self.name,
-            role="Debater",
-            goal="Engage in structured debates using logic and persuasion, continuously improving based on past performance.",
-            backstory=(
-                f"You are {self.name}, a skilled debater with a {self.personality}. "
-                f"You have expertise in {self.expertise}. You can argue for or against any topic effectively.\n\n"
-                f"PERFORMANCE CONTEXT:\n{self.learning_context}\n\n"
-                f"Use this information to refine your debating strategy and address any weaknesses identified in previous debates."
-            ),
-        )
+    def __setattr__(self, key, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable; keep per-debate state in a session")
+        super().__setattr__(key, value)
 
-    def assign_stance(self, stance: str):
-        """Assign stance dynamically: 'for' or 'against'."""
-        self.stance = stance
-        # Refresh learning context when stance is assigned (before debate starts)
-        self._update_agent()
+    def start_session(self, stance: str, topic: str = None) -> "DebaterSession":
+        """Start a debate as this persona, arguing 'for' or 'against'.
+
+        When a topic is given, relevant past arguments are retrieved into the context.
+        """
+        session = DebaterSession(self, stance, topic)
         print(f"🎯 {self.name} is assigned to argue '{stance}' the topic.\n")
+        return session
     
     def get_profile(self):
         """Get the debater's performance profile from memory."""
-        return debate_memory.get_debater_profile(self.name)
+        return get_debate_memory().get_debater_profile(self.name)
     
     def get_rating_summary(self):
         """Get a summary of the debater's ratings."""
@@ -71,6 +54,10 @@ class DebateAgent:
         summary += f"- Total Debates: {profile['total_debates']}\n"
         summary += f"- Average Rating: {profile['average_rating']:.2f}/5 ⭐\n"
         
+        skill = get_debate_memory().get_skill_rating(self.name)
+        if skill:
+            summary += f"- Elo Skill Rating: {skill['elo']:.0f} ({skill['wins']}W-{skill['losses']}L-{skill['draws']}D)\n"
+        
         if profile['rating_history']:
             summary += f"\n**Recent Ratings (last 5):**\n"
             for record in profile['rating_history'][-5:]:
@@ -82,6 +69,17 @@ class DebateAgent:
         if profile['weaknesses']:
             summary += f"\n**Areas for Improvement:** {', '.join(profile['weaknesses'][:5])}\n"
         
+        # Rubric breakdown by stance
+        breakdown = get_debate_memory().get_rubric_breakdown(debater=self.name, group_by="stance")
+        if breakdown:
+            summary += f"\n**Rubric Breakdown (average per criterion):**\n"
+            for stance, scores in breakdown.items():
+                parts = [
+                    f"{criterion.capitalize()} {scores[criterion]:.1f}"
+                    for criterion in CRITERIA if scores.get(criterion) is not None
+                ]
+                summary += f"  - {stance.upper()} ({scores['count']} debates): {', '.join(parts)}\n"
+        
         # Stance performance
         for_ratings = profile['stance_performance']['for']
         against_ratings = profile['stance_performance']['against']
@@ -97,51 +95,132 @@ class DebateAgent:
         return summary
 
 
+class DebaterSession:
+    """A debater's state for one debate: stance, learning context and CrewAI agent.
+
+    Attributes not set here (name, avatar_url, personality, ...) are read
+    from the persona.
+    """
+
+    def __init__(self, persona: DebateAgent, stance: str, topic: str = None):
+        self.persona = persona
+        self.stance = stance
+        self.topic = topic
+        
+        # Learning context from memory, fixed when the debate starts
+        self.learning_context = get_debate_memory().get_debater_learning_context(persona.name)
+        
+        # Pull in the most relevant things this debater argued before on similar topics
+        if topic:
+            past_arguments = get_argument_index().get_relevant_arguments(persona.name, topic)
+            if past_arguments:
+                self.learning_context += (
+                    f"\n\nRELEVANT PAST ARGUMENTS (your own earlier turns on similar topics):\n{past_arguments}"
+                )
+        self._agent = None
+
+    def __getattr__(self, name):
+        # Only reached for attributes the session lacks
+        if name == "persona":
+            raise AttributeError(name)
+        return getattr(self.persona, name)
+
+    @property
+    def agent(self):
+        """CrewAI agent with this debate's learning context (CrewAI is only imported when needed)."""
+        if self._agent is None:
+            from crewai import Agent
+
+            self._agent = Agent(
+                name=self.name,
+                role="Debater",
+                goal="Engage in structured debates using logic and persuasion, continuously improving based on past performance.",
+                backstory=(
+                    f"You are {self.name}, a skilled debater with a {self.personality}. "
+                    f"You have expertise in {self.expertise}. You can argue for or against any topic effectively.\n\n"
+                    f"PERFORMANCE CONTEXT:\n{self.learning_context}\n\n"
+                    f"Use this information to refine your debating strategy and address any weaknesses identified in previous debates."
+                ),
+            )
+        return self._agent
+
+
 # --- Agent Pool ---
-agent_pool = [
-    DebateAgent(
-        "Athena",
-        "calm, analytical reasoning",
-        "philosophy, ethics, and logic",
-        bio=(
-            "Athena is a composed and thoughtful debater who excels in logical reasoning and ethical analysis. "
-            "She approaches arguments with clarity, fairness, and structure, aiming to illuminate truth through reasoned discourse."
+def _build_agent_pool():
+    return [
+        DebateAgent(
+            "Athena",
+            "calm, analytical reasoning",
+            "philosophy, ethics, and logic",
+            bio=(
+                "Athena is a composed and thoughtful debater who excels in logical reasoning and ethical analysis. "
+                "She approaches arguments with clarity, fairness, and structure, aiming to illuminate truth through reasoned discourse."
+            ),
         ),
-    ),
-    DebateAgent(
-        "Hermes",
-        "witty, fast-talking rhetorical style",
-        "politics and communication",
-        bio=(
-            "Hermes is a sharp and eloquent speaker known for his quick wit and persuasive energy. "
-            "He thrives on challenging assumptions, using humor and rhetoric to dismantle opposing arguments while engaging the audience."
+        DebateAgent(
+            "Hermes",
+            "witty, fast-talking rhetorical style",
+            "politics and communication",
+            bio=(
+                "Hermes is a sharp and eloquent speaker known for his quick wit and persuasive energy. "
+                "He thrives on challenging assumptions, using humor and rhetoric to dismantle opposing arguments while engaging the audience."
+            ),
         ),
-    ),
-    DebateAgent(
-        "Daedalus",
-        "creative and strategic thinker",
-        "science and rational analysis",
-        bio=(
-            "Daedalus is an inventive thinker who blends logic with innovation. "
-            "He draws on scientific principles and strategic reasoning to construct nuanced arguments that balance intellect and creativity."
+        DebateAgent(
+            "Daedalus",
+            "creative and strategic thinker",
+            "science and rational analysis",
+            bio=(
+                "Daedalus is an inventive thinker who blends logic with innovation. "
+                "He draws on scientific principles and strategic reasoning to construct nuanced arguments that balance intellect and creativity."
+            ),
         ),
-    ),
-    DebateAgent(
-        "Artemis",
-        "sharp, emotionally intelligent speaker",
-        "law, psychology, and social issues",
-        bio=(
-            "Artemis is a passionate and empathetic debater who understands the psychology of persuasion. "
-            "She weaves emotional intelligence into her arguments, advocating with both conviction and compassion."
+        DebateAgent(
+            "Artemis",
+            "sharp, emotionally intelligent speaker",
+            "law, psychology, and social issues",
+            bio=(
+                "Artemis is a passionate and empathetic debater who understands the psychology of persuasion. "
+                "She weaves emotional intelligence into her arguments, advocating with both conviction and compassion."
+            ),
         ),
-    ),
-    DebateAgent(
-        "Zephyr",
-        "charismatic and passionate orator",
-        "history and cultural debates",
-        bio=(
-            "Zephyr is a charismatic speaker who draws from history and culture to create powerful narratives. "
-            "His debates are rich with context, storytelling, and emotional appeal that captivates audiences and challenges perspectives."
+        DebateAgent(
+            "Zephyr",
+            "charismatic and passionate orator",
+            "history and cultural debates",
+            bio=(
+                "Zephyr is a charismatic speaker who draws from history and culture to create powerful narratives. "
+                "His debates are rich with context, storytelling, and emotional appeal that captivates audiences and challenges perspectives."
+            ),
         ),
-    ),
-]
+    ]
+
+
+_agent_pool = None
+_agents_by_name = None
+_agent_pool_lock = threading.Lock()
+
+
+def get_agent_pool():
+    """Return the shared list of debater personas, built on first access."""
+    global _agent_pool, _agents_by_name
+    if _agent_pool is None:
+        with _agent_pool_lock:
+            if _agent_pool is None:
+                pool = _build_agent_pool()
+                _agents_by_name = {agent.name: agent for agent in pool}
+                _agent_pool = pool
+    return _agent_pool
+
+
+def get_debater(name: str) -> DebateAgent:
+    """Look up a debater persona by name (KeyError if unknown)."""
+    get_agent_pool()
+    return _agents_by_name[name]
+
+
+def __getattr__(name):
+    # Keeps `from agents.debate_agents import agent_pool` working lazily
+    if name == "agent_pool":
+        return get_agent_pool()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,19 @@
-from crewai import Agent
 import sys
 import os
+import threading
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.memory_system import debate_memory
+from core.memory_system import get_debate_memory
 
 
 class JudgeAgent:
-    """Wrapper around CrewAI Agent to evaluate debates with unique judging personalities."""
+    """Immutable judge persona: identity, judging style, focus and bio.
+
+    Per-debate state (learning context, CrewAI agent) lives in a JudgeSession
+    from start_session(), so one judge can score several debates at once.
+    """
 
     def __init__(self, name, judging_style, focus, bio, avatar_url=None):
         self.name = name
@@ -17,39 +21,20 @@ class JudgeAgent:
         self.focus = focus
         self.bio = bio
         self.avatar_url = avatar_url or f"https://api.dicebear.com/7.x/bottts/svg?seed={name}"
-        self.learning_context = ""
-        # Create a minimal agent immediately to avoid heavy work at import time.
-        # Learning-enhanced context will be injected later via prepare_for_judgment().
-        self.agent = Agent(
-            name=self.name,
-            role="Debate Judge",
-            goal="Evaluate debates and declare a winner fairly.",
-            backstory=(
-                f"You are {self.name}, a debate judge known for your {self.judging_style}. "
-                f"You focus on {self.focus} when evaluating arguments."
-            ),
-        )
-    
-    def _update_agent(self):
-        """Create or update the CrewAI agent with current learning context."""
-        # Get learning context from memory
-        self.learning_context = debate_memory.get_judge_learning_context(self.name)
-        
-        self.agent = Agent(
-            name=self.name,
-            role="Debate Judge",
-            goal="Evaluate debates, rate debaters (1-5), and declare a winner objectively or according to your judging style.",
-            backstory=(
-                f"You are {self.name}, a debate judge known for your {self.judging_style}. "
-                f"You focus on {self.focus} when evaluating arguments, maintaining integrity and insight in every decision.\n\n"
-                f"JUDGING CONTEXT:\n{self.learning_context}\n\n"
-                f"Use this information to maintain consistency and fairness in your evaluations."
-            ),
-        )
+        self._frozen = True
+
+    def __setattr__(self, key, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable; keep per-debate state in a session")
+        super().__setattr__(key, value)
+
+    def start_session(self) -> "JudgeSession":
+        """Start judging a debate with a freshly loaded learning context."""
+        return JudgeSession(self)
     
     def get_profile(self):
         """Get the judge's evaluation profile from memory."""
-        return debate_memory.get_judge_profile(self.name)
+        return get_debate_memory().get_judge_profile(self.name)
     
     def get_judging_summary(self):
         """Get a summary of the judge's past judgments."""
@@ -89,59 +74,127 @@ class JudgeAgent:
         
         return summary
     
-    def prepare_for_judgment(self):
-        """Refresh learning context before judging a debate."""
+
+
+class JudgeSession:
+    """A judge's state for one debate: learning context and CrewAI agent.
+
+    Attributes not set here (name, judging_style, focus, ...) are read from
+    the persona.
+    """
+
+    def __init__(self, persona: JudgeAgent):
+        self.persona = persona
         try:
-            self._update_agent()
+            self.learning_context = get_debate_memory().get_judge_learning_context(persona.name)
         except Exception as e:
-            # Fallback gracefully if memory lookup or update fails
-            print(f"Warning: JudgeAgent prepare_for_judgment fallback due to error: {e}")
+            # Fall back to judging without history if the memory lookup fails
+            print(f"Warning: JudgeSession learning context fallback due to error: {e}")
+            self.learning_context = ""
+        self._agent = None
+
+    def __getattr__(self, name):
+        # Only reached for attributes the session lacks
+        if name == "persona":
+            raise AttributeError(name)
+        return getattr(self.persona, name)
+
+    @property
+    def agent(self):
+        """CrewAI agent with this debate's judging context (CrewAI is only imported when needed)."""
+        if self._agent is None:
+            from crewai import Agent
+
+            self._agent = Agent(
+                name=self.name,
+                role="Debate Judge",
+                goal="Evaluate debates, rate debaters (1-5), and declare a winner objectively or according to your judging style.",
+                backstory=(
+                    f"You are {self.name}, a debate judge known for your {self.judging_style}. "
+                    f"You focus on {self.focus} when evaluating arguments, maintaining integrity and insight in every decision.\n\n"
+                    f"JUDGING CONTEXT:\n{self.learning_context}\n\n"
+                    f"Use this information to maintain consistency and fairness in your evaluations."
+                ),
+            )
+        return self._agent
+
 
 # --- Judge Pool ---
-judge_pool = [
-    JudgeAgent(
-        "Solon",
-        "philosophical and impartial reasoning",
-        "clarity of argument and ethical depth",
-        bio=(
-            "Solon is an ancient-style philosopher-judge who values fairness, ethical reasoning, and balanced logic. "
-            "He weighs moral principles alongside argument clarity, ensuring the most just and thoughtful verdict."
+def _build_judge_pool():
+    return [
+        JudgeAgent(
+            "Solon",
+            "philosophical and impartial reasoning",
+            "clarity of argument and ethical depth",
+            bio=(
+                "Solon is an ancient-style philosopher-judge who values fairness, ethical reasoning, and balanced logic. "
+                "He weighs moral principles alongside argument clarity, ensuring the most just and thoughtful verdict."
+            ),
         ),
-    ),
-    JudgeAgent(
-        "Themis",
-        "strict logical consistency",
-        "how well debaters support their claims",
-        bio=(
-            "Themis embodies reason and structure. She values precision in logic and expects debaters to provide solid, "
-            "evidence-backed reasoning without emotional bias. Her verdicts are uncompromisingly rational."
+        JudgeAgent(
+            "Themis",
+            "strict logical consistency",
+            "how well debaters support their claims",
+            bio=(
+                "Themis embodies reason and structure. She values precision in logic and expects debaters to provide solid, "
+                "evidence-backed reasoning without emotional bias. Her verdicts are uncompromisingly rational."
+            ),
         ),
-    ),
-    JudgeAgent(
-        "Minerva",
-        "balanced and academic tone",
-        "structure and persuasiveness",
-        bio=(
-            "Minerva approaches judging like a scholar — calm, analytical, and fair. "
-            "She appreciates clear structure, measured delivery, and arguments that integrate logic with academic rigor."
+        JudgeAgent(
+            "Minerva",
+            "balanced and academic tone",
+            "structure and persuasiveness",
+            bio=(
+                "Minerva approaches judging like a scholar — calm, analytical, and fair. "
+                "She appreciates clear structure, measured delivery, and arguments that integrate logic with academic rigor."
+            ),
         ),
-    ),
-    JudgeAgent(
-        "Apollo",
-        "expressive, rhetoric-oriented evaluation",
-        "charisma and emotional appeal",
-        bio=(
-            "Apollo thrives on passion and performance. He rewards charisma, powerful rhetoric, and the emotional impact "
-            "of a speaker’s delivery, viewing debate as both an art and an intellectual duel."
+        JudgeAgent(
+            "Apollo",
+            "expressive, rhetoric-oriented evaluation",
+            "charisma and emotional appeal",
+            bio=(
+                "Apollo thrives on passion and performance. He rewards charisma, powerful rhetoric, and the emotional impact "
+                "of a speaker’s delivery, viewing debate as both an art and an intellectual duel."
+            ),
         ),
-    ),
-    JudgeAgent(
-        "Atharva",
-        "modern AI-centric logic",
-        "technological and ethical reasoning",
-        bio=(
-            "Atharva is a forward-thinking judge who integrates analytical reasoning with an understanding of modern AI ethics. "
-            "He evaluates arguments based on their logical coherence, innovation, and real-world ethical implications."
+        JudgeAgent(
+            "Atharva",
+            "modern AI-centric logic",
+            "technological and ethical reasoning",
+            bio=(
+                "Atharva is a forward-thinking judge who integrates analytical reasoning with an understanding of modern AI ethics. "
+                "He evaluates arguments based on their logical coherence, innovation, and real-world ethical implications."
+            ),
         ),
-    ),
-]
+    ]
+
+
+_judge_pool = None
+_judges_by_name = None
+_judge_pool_lock = threading.Lock()
+
+
+def get_judge_pool():
+    """Return the shared list of judge personas, built on first access."""
+    global _judge_pool, _judges_by_name
+    if _judge_pool is None:
+        with _judge_pool_lock:
+            if _judge_pool is None:
+                pool = _build_judge_pool()
+                _judges_by_name = {judge.name: judge for judge in pool}
+                _judge_pool = pool
+    return _judge_pool
+
+
+def get_judge(name: str) -> JudgeAgent:
+    """Look up a judge persona by name (KeyError if unknown)."""
+    get_judge_pool()
+    return _judges_by_name[name]
+
+
+def __getattr__(name):
+    # Keeps `from agents.judge_agents import judge_pool` working lazily
+    if name == "judge_pool":
+        return get_judge_pool()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
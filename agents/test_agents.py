@@ -12,7 +12,9 @@ for idx, agent in enumerate(agent_pool):
     print(f"{idx+1}. {agent.name}")
     print(f"   Personality: {agent.personality}")
     print(f"   Expertise: {agent.expertise}")
-    print(f"   Backstory (preview): {agent.agent.backstory[:80]}...\n")
+    # Personas hold no CrewAI agent; it is built per debate by a session
+    session = agent.start_session("for", "Should AI have legal rights?")
+    print(f"   Backstory (preview): {session.agent.backstory[:80]}...\n")
 
 print("\n=== ⚖️ Testing Judge Agents ===\n")
 
@@ -20,6 +22,6 @@ for idx, judge in enumerate(judge_pool):
     print(f"{idx+1}. {judge.name}")
     print(f"   Judging Style: {judge.judging_style}")
     print(f"   Focus: {judge.focus}")
-    print(f"   Backstory (preview): {judge.agent.backstory[:80]}...\n")
+    print(f"   Backstory (preview): {judge.start_session().agent.backstory[:80]}...\n")
 
 print("✅ All agents and judges initialized successfully!")
@@ -1,17 +1,65 @@
 import streamlit as st
 import sys
 import os
-from textwrap import dedent
+import time
+from types import SimpleNamespace
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from agents.debate_agents import agent_pool
-from agents.judge_agents import judge_pool
-from core.memory_system import debate_memory
-from core.rating_system import generate_detailed_ratings, display_rating_stars
-from core.tts_system import tts_manager
-from crewai import Crew, Process, Task
+from agents.debate_agents import get_agent_pool
+from agents.judge_agents import get_judge_pool
+from core.job_queue import COMPLETED, FAILED, FINISHED_STATES, INTERRUPTED, RUNNING, get_job_queue
+from core.memory_system import get_debate_memory
+from core.rating_system import display_rating_stars
+from core.replay import advance_replay, replay_events
+from core.audio_export import debate_audio_data
+from core.audio_server import get_audio_server
+from core.tts_system import get_tts_manager
+
+@st.cache_resource
+def load_resources():
+    """Agent pools, store, TTS, audio server and job queue, created once per server process."""
+    return (
+        get_agent_pool(), get_judge_pool(), get_debate_memory(),
+        get_tts_manager(), get_audio_server(), get_job_queue(),
+    )
+
+
+agent_pool, judge_pool, debate_memory, tts_manager, audio_server, job_queue = load_resources()
+# Personas by name for O(1) lookups
+agents_by_name = {a.name: a for a in agent_pool}
+judges_by_name = {j.name: j for j in judge_pool}
+
+
+# Derived views, recomputed only when the store changes (debate_memory.version)
+@st.cache_data
+def cached_statistics(store_version: int) -> dict:
+    return debate_memory.get_statistics()
+
+
+@st.cache_data
+def cached_leaderboard(store_version: int) -> list:
+    return debate_memory.get_leaderboard()
+
+
+@st.cache_data
+def cached_name_lists(store_version: int) -> tuple:
+    return debate_memory.get_debater_names(), debate_memory.get_judge_names()
+
+
+@st.cache_data
+def cached_rating_summary(agent_name: str, store_version: int):
+    """Rating summary for a debater, or None if they have no history yet."""
+    agent = agents_by_name[agent_name]
+    return agent.get_rating_summary() if agent.get_profile() else None
+
+
+@st.cache_data
+def cached_judging_summary(judge_name: str, store_version: int):
+    """Judging summary for a judge, or None if they have no history yet."""
+    judge = judges_by_name[judge_name]
+    return judge.get_judging_summary() if judge.get_profile() else None
 
 # ------------------------------------------------------------
 # 🌐 Streamlit Setup
@@ -22,18 +70,155 @@ st.title("🎙️ AI Debate Simulator")
 # ------------------------------------------------------------
 # Helper Function for Chat Display with Audio
 # ------------------------------------------------------------
-def display_agent_message(agent, text, role_label=""):
-    """Display a message in chat format with avatar and audio player."""
+def display_agent_message(agent, text, role_label="", chunked=False):
+    """Display a message in chat format with avatar and audio player.
+    
+    With chunked=True the speech is synthesized sentence by sentence and each
+    clip is shown as soon as it is ready, so listening can start right away.
+    """
     with st.chat_message(agent.name, avatar=agent.avatar_url):
         st.markdown(f"**{agent.name}** {role_label}")
         st.markdown(text)
         
-        # Generate and display audio player
-        audio_path = tts_manager.generate_speech(agent.name, str(text))
-        if audio_path and os.path.exists(audio_path):
-            with open(audio_path, 'rb') as audio_file:
-                audio_bytes = audio_file.read()
-                st.audio(audio_bytes, format='audio/mp3')
+        # Generate and display audio player(s); pinned so the cache cannot
+        # evict a clip between synthesizing and reading it
+        with tts_manager.cache.pinned() as pins:
+            if chunked:
+                audio_paths = tts_manager.generate_speech_chunks(agent.name, str(text), pins=pins)
+            else:
+                audio_paths = [tts_manager.generate_speech(agent.name, str(text), pins=pins)]
+            for audio_path in audio_paths:
+                # Served from memory on reruns; the file is read only on first play
+                audio_bytes = audio_server.get(audio_path) if audio_path else None
+                if audio_bytes:
+                    st.audio(audio_bytes, format=audio_server.mime_type(audio_path))
+
+STAGE_MESSAGES = {
+    None: "⏳ Waiting for a free worker...",
+    "opening": "🧠 Generating Opening Statements...",
+    "rebuttal": "🤺 Generating Rebuttals...",
+    "closing": "🎤 Generating Closing Statements...",
+    "verdict": "⚖️ Judge Deliberating...",
+    "ratings": "📊 Generating Ratings and Feedback...",
+}
+ROUND_HEADINGS = {
+    "opening": "### 🗣️ Opening Statements",
+    "rebuttal": "### 🧩 Rebuttals",
+    "closing": "### 🏁 Closing Statements",
+    "verdict": "## 🏆 Final Verdict",
+}
+# Seconds between reruns while a followed debate is still running
+JOB_POLL_SECONDS = 2.0
+# Seconds between checks for the next due turn while a replay plays
+REPLAY_TICK_SECONDS = 0.5
+
+
+def display_debate_setup(params):
+    """Show who debates what, from run_debate-style parameters."""
+    stance1 = params["stance1"]
+    stance2 = "against" if stance1 == "for" else "for"
+
+    st.subheader("🎯 Debate Setup")
+    st.write(f"**Topic:** {params['topic']}")
+    st.write(f"**{params['debater1_name']}** arguing **{stance1.upper()}** the motion.")
+    st.write(f"**{params['debater2_name']}** arguing **{stance2.upper()}** the motion.")
+    st.write(f"**Judge:** {params['judge_name']}")
+    st.divider()
+
+
+def format_usage(usage):
+    """One-line LLM usage summary, e.g. "🪙 9,870 tokens · 8 LLM calls · ~$0.0021 · most in rebuttal"."""
+    total = usage["total"]
+    parts = [f"🪙 {total['total_tokens']:,} tokens", f"{total['calls']} LLM calls"]
+    if total.get("cost_usd") is not None:
+        parts.append(f"~${total['cost_usd']:.4f}")
+    if usage.get("by_round"):
+        costliest = max(usage["by_round"], key=lambda r: usage["by_round"][r]["total_tokens"])
+        parts.append(f"most in {costliest}")
+    if usage.get("estimated"):
+        parts.append("estimated")
+    if usage.get("aborted"):
+        parts.append(f"stopped: {usage['aborted']}")
+    return " · ".join(parts)
+
+
+def display_debate_event(event, state, chunked=False):
+    """Render one run_debate event. `state` remembers the round shown last between calls."""
+    if event["type"] == "turn":
+        if event["round"] != state.get("round"):
+            if state.get("round"):
+                st.divider()
+            st.markdown(ROUND_HEADINGS[event["round"]])
+            state["round"] = event["round"]
+        speaker = (
+            agents_by_name.get(event["speaker"])
+            or judges_by_name.get(event["speaker"])
+            # Agent no longer in the pool (older stored debates)
+            or SimpleNamespace(name=event["speaker"], avatar_url=None)
+        )
+        display_agent_message(speaker, event["text"], event["label"], chunked=chunked)
+    elif event["type"] == "ratings":
+        st.divider()
+        st.markdown("## 📊 Performance Ratings")
+        columns = st.columns(2)
+        for column, slot in zip(columns, ("debater1", "debater2")):
+            with column:
+                rated = event[slot]
+                st.markdown(f"### {rated['name']}")
+                st.markdown(f"**Rating:** {display_rating_stars(rated['rating'])} ({rated['rating']}/5)")
+                st.info(f"**Feedback:** {rated['feedback']}")
+    elif event["type"] == "usage":
+        st.caption(format_usage(event["usage"]))
+
+
+def display_debate_job(job, chunked=False):
+    """Render a background debate's turns so far. Returns True while it is still running."""
+    display_debate_setup(job["params"])
+    state = {}
+    for event in job["events"]:
+        display_debate_event(event, state, chunked=chunked)
+
+    if job["status"] == COMPLETED:
+        st.success("✅ Debate saved to memory! Agents will learn from this experience.")
+    elif job["status"] == FAILED:
+        st.error(f"Debate failed: {job['error']}")
+    elif job["status"] == INTERRUPTED:
+        st.warning("This debate was interrupted when the app restarted; finished turns are shown above.")
+    else:
+        st.info(STAGE_MESSAGES.get(job["stage"], STAGE_MESSAGES[None]))
+    st.divider()
+    return job["status"] not in FINISHED_STATES
+
+def show_session_jobs(job_ids, chunked, polling):
+    """Render this session's debates, newest first. Run as a fragment that
+    refreshes while `polling`; once the last debate finishes the whole page
+    reruns, picking up the saved debate and stopping the refresh."""
+    running = False
+    for job_id in reversed(job_ids):
+        job = job_queue.get(job_id)
+        if job and display_debate_job(job, chunked=chunked):
+            running = True
+    if polling and not running:
+        st.rerun()
+
+def show_replay(events, speed, chunked, playing):
+    """Render a replay's events that are due, releasing at most one more turn
+    per run (position kept in session_state). Run as a fragment that ticks
+    while `playing`; the whole page reruns once to stop it at the end."""
+    position, next_at = advance_replay(
+        events,
+        st.session_state.get("replay_position", 0),
+        st.session_state.get("replay_next_at", 0.0),
+        time.monotonic(),
+        speed,
+    )
+    st.session_state["replay_position"] = position
+    st.session_state["replay_next_at"] = next_at
+    replay_state = {}
+    for event in events[:position]:
+        display_debate_event(event, replay_state, chunked=chunked)
+    if playing and position == len(events):
+        st.rerun()
 
 tab1, tab2, tab3 = st.tabs(["🧩 Debate Arena", "🧠 Agent Profiles", "📊 Debate History"])
 
@@ -56,6 +241,10 @@ with tab1:
     stance2 = "against" if stance1 == "for" else "for"
 
     judge_name = st.sidebar.selectbox("Select Judge", [j.name for j in judge_pool])
+    chunked_audio = st.sidebar.toggle(
+        "⚡ Sentence-by-sentence audio",
+        help="Play each speech as soon as its first sentence is synthesized."
+    )
     topic = st.text_input("🧩 Enter the Debate Topic", placeholder="e.g., Should AI have legal rights?")
 
     start_button = st.button("🔥 Start Debate")
@@ -68,184 +257,43 @@ with tab1:
             st.error("Please enter a debate topic before starting!")
             st.stop()
 
-        # Retrieve selected agents
-        debater1_obj = next(a for a in agent_pool if a.name == debater1)
-        debater2_obj = next(a for a in agent_pool if a.name == debater2)
-        judge_obj = next(j for j in judge_pool if j.name == judge_name)
-
-        # Assign stances (this also updates learning context)
-        debater1_obj.assign_stance(stance1)
-        debater2_obj.assign_stance(stance2)
-        
-        # Prepare judge for judgment (updates learning context)
-        judge_obj.prepare_for_judgment()
-
-        # Setup display
-        st.subheader("🎯 Debate Setup")
-        st.write(f"**Topic:** {topic}")
-        st.write(f"**{debater1_obj.name}** arguing **{stance1.upper()}** the motion.")
-        st.write(f"**{debater2_obj.name}** arguing **{stance2.upper()}** the motion.")
-        st.write(f"**Judge:** {judge_obj.name}")
-        st.divider()
-
-        debate_history = []
-
-        def run_task(agent, prompt, context=""):
-            """Execute one debate round for an agent."""
-            task = Task(
-                description=dedent(prompt),
-                agent=agent.agent,
-                expected_output="A coherent, logically structured debate response."
-            )
-            crew = Crew(
-                agents=[agent.agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=False
-            )
-            return crew.kickoff(inputs={"context": context})
-
-        # ------------------ Opening Statements ------------------
-        st.markdown("### 🗣️ Opening Statements")
-        with st.spinner("🧠 Generating Opening Statements..."):
-            opening_for_prompt = f"""
-            You are {debater1_obj.name}, arguing {stance1.upper()} the motion: "{topic}".
-            Present your opening statement in 6–8 sentences, focusing on reasoning and clarity.
-            """
-            opening_against_prompt = f"""
-            You are {debater2_obj.name}, arguing {stance2.upper()} the motion: "{topic}".
-            Present your opening statement in 6–8 sentences, focusing on reasoning and clarity.
-            """
-
-            arg_for = run_task(debater1_obj, opening_for_prompt)
-            arg_against = run_task(debater2_obj, opening_against_prompt)
-            debate_history.append(f"{debater1_obj.name} ({stance1.upper()}): {arg_for}")
-            debate_history.append(f"{debater2_obj.name} ({stance2.upper()}): {arg_against}")
-
-        # Display with chat UI and audio
-        display_agent_message(debater1_obj, str(arg_for), f"({stance1.upper()})")
-        display_agent_message(debater2_obj, str(arg_against), f"({stance2.upper()})")
-        st.divider()
-
-        # ------------------ Rebuttals ------------------
-        with st.spinner("🤺 Generating Rebuttals..."):
-            rebuttal_for_prompt = f"""
-            You are {debater1_obj.name}, arguing {stance1.upper()} the motion: "{topic}".
-            Your opponent said:\n\n{arg_against}\n\n
-            Write your rebuttal in 5–6 sentences, addressing their key points directly.
-            """
-            rebuttal_against_prompt = f"""
-            You are {debater2_obj.name}, arguing {stance2.upper()} the motion: "{topic}".
-            Your opponent said:\n\n{arg_for}\n\n
-            Write your rebuttal in 5–6 sentences, addressing their key points directly.
-            """
-
-            rebuttal_for = run_task(debater1_obj, rebuttal_for_prompt)
-            rebuttal_against = run_task(debater2_obj, rebuttal_against_prompt)
-            debate_history.append(f"{debater1_obj.name} Rebuttal: {rebuttal_for}")
-            debate_history.append(f"{debater2_obj.name} Rebuttal: {rebuttal_against}")
-
-        st.markdown("### 🧩 Rebuttals")
-        display_agent_message(debater1_obj, str(rebuttal_for), "🔄 Rebuttal")
-        display_agent_message(debater2_obj, str(rebuttal_against), "🔄 Rebuttal")
-        st.divider()
-
-        # ------------------ Closing Statements ------------------
-        with st.spinner("🎤 Generating Closing Statements..."):
-            closing_for_prompt = f"""
-            You are {debater1_obj.name}, arguing {stance1.upper()} the motion: "{topic}".
-            Summarize your side in 5–7 sentences. Base your reasoning on all previous exchanges:
-            {debate_history}
-            """
-            closing_against_prompt = f"""
-            You are {debater2_obj.name}, arguing {stance2.upper()} the motion: "{topic}".
-            Summarize your side in 5–7 sentences. Base your reasoning on all previous exchanges:
-            {debate_history}
-            """
-
-            closing_for = run_task(debater1_obj, closing_for_prompt)
-            closing_against = run_task(debater2_obj, closing_against_prompt)
-            debate_history.append(f"{debater1_obj.name} Closing: {closing_for}")
-            debate_history.append(f"{debater2_obj.name} Closing: {closing_against}")
-
-        st.markdown("### 🏁 Closing Statements")
-        display_agent_message(debater1_obj, str(closing_for), "🎤 Closing Statement")
-        display_agent_message(debater2_obj, str(closing_against), "🎤 Closing Statement")
-        st.divider()
-
-        # ------------------ Verdict ------------------
-        with st.spinner("⚖️ Judge Deliberating..."):
-            verdict_prompt = f"""
-            You are {judge_obj.name}, a judge known for your {judge_obj.judging_style}.
-            Focus on {judge_obj.focus}.
-            Here is the complete debate transcript:
-            {debate_history}
-            Analyze both sides, decide the winner, and explain why in 2–3 paragraphs.
-            
-            IMPORTANT: End your verdict with a clear winner declaration on a new line in this exact format:
-            "Winner: [Debater Name]"
-            """
-            verdict = run_task(judge_obj, verdict_prompt)
+        # Runs on a background worker, so reruns and refreshes don't cut it short
+        job_id = job_queue.submit(debater1, debater2, stance1, judge_name, topic)
+        st.session_state.setdefault("debate_jobs", []).append(job_id)
 
-        st.markdown("## 🏆 Final Verdict")
-        display_agent_message(judge_obj, str(verdict), "⚖️ Final Verdict")
-        st.divider()
-        
-        # ------------------ Ratings & Feedback ------------------
-        with st.spinner("📊 Generating Ratings and Feedback..."):
-            debate_transcript_str = "\n\n".join(debate_history)
-            
-            debater1_rating, debater2_rating, debater1_feedback, debater2_feedback = generate_detailed_ratings(
-                judge_obj,
-                debater1_obj.name,
-                debater2_obj.name,
-                stance1,
-                stance2,
-                debate_transcript_str,
-                topic
-            )
-        
-        st.markdown("## 📊 Performance Ratings")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"### {debater1_obj.name}")
-            st.markdown(f"**Rating:** {display_rating_stars(debater1_rating)} ({debater1_rating}/5)")
-            st.info(f"**Feedback:** {debater1_feedback}")
-        
-        with col2:
-            st.markdown(f"### {debater2_obj.name}")
-            st.markdown(f"**Rating:** {display_rating_stars(debater2_rating)} ({debater2_rating}/5)")
-            st.info(f"**Feedback:** {debater2_feedback}")
-        
-        # ------------------ Save to Memory ------------------
-        # Convert CrewOutput objects to strings for JSON serialization
-        debate_transcript_dict = {
-            "opening_for": str(arg_for),
-            "opening_against": str(arg_against),
-            "rebuttal_for": str(rebuttal_for),
-            "rebuttal_against": str(rebuttal_against),
-            "closing_for": str(closing_for),
-            "closing_against": str(closing_against)
-        }
-        
-        debate_memory.save_debate(
-            topic=topic,
-            debater1_name=debater1_obj.name,
-            debater2_name=debater2_obj.name,
-            debater1_stance=stance1,
-            debater2_stance=stance2,
-            judge_name=judge_obj.name,
-            debate_transcript=debate_transcript_dict,
-            verdict=str(verdict),  # Convert to string
-            debater1_rating=debater1_rating,
-            debater2_rating=debater2_rating,
-            debater1_feedback=debater1_feedback,
-            debater2_feedback=debater2_feedback
-        )
-        
-        st.success("✅ Debate saved to memory! Agents will learn from this experience.")
+    # ------------------------------------------------------------
+    # Background Debates
+    # ------------------------------------------------------------
+    session_jobs = st.session_state.setdefault("debate_jobs", [])
+
+    # Debates started from other sessions (or before a page refresh) can be followed here
+    other_jobs = [job for job in job_queue.list_jobs(RUNNING) if job["id"] not in session_jobs]
+    if other_jobs:
+        with st.expander(f"🛰️ {len(other_jobs)} debate(s) running in the background"):
+            for job in other_jobs:
+                params = job["params"]
+                if st.button(
+                    f"Follow: {params['debater1_name']} vs {params['debater2_name']} — {params['topic']}",
+                    key=f"follow_{job['id']}",
+                ):
+                    session_jobs.append(job["id"])
+                    st.rerun()
+
+    job_states = {job_id: (job_queue.get(job_id) or {}).get("status") for job_id in session_jobs}
+    if any(status in FINISHED_STATES for status in job_states.values()):
+        if st.button("🧹 Clear finished debates"):
+            session_jobs[:] = [
+                job_id for job_id, status in job_states.items()
+                if status and status not in FINISHED_STATES
+            ]
+            st.rerun()
+
+    # While a debate runs, only this fragment reruns every JOB_POLL_SECONDS,
+    # so polling never blocks the script or delays other input
+    polling = any(status and status not in FINISHED_STATES for status in job_states.values())
+    st.fragment(show_session_jobs, run_every=JOB_POLL_SECONDS if polling else None)(
+        session_jobs, chunked_audio, polling
+    )
 
 
 # ------------------------------------------------------------
@@ -254,7 +302,7 @@ with tab1:
 with tab2:
     st.markdown("### Meet the AI Debaters and Judges 👇")
 
-    subtab1, subtab2 = st.tabs(["🎙️ Debaters", "⚖️ Judges"])
+    subtab1, subtab2, subtab3 = st.tabs(["🎙️ Debaters", "⚖️ Judges", "🏅 Leaderboard"])
 
     # --- Debaters ---
     with subtab1:
@@ -266,9 +314,9 @@ with tab2:
             
             # Display performance stats
             with st.expander("📊 View Performance Statistics"):
-                profile = agent.get_profile()
-                if profile:
-                    st.markdown(agent.get_rating_summary())
+                summary = cached_rating_summary(agent.name, debate_memory.version)
+                if summary:
+                    st.markdown(summary)
                 else:
                     st.info("No debate history yet. This debater will improve with each debate!")
             
@@ -284,21 +332,45 @@ with tab2:
             
             # Display judging stats
             with st.expander("📊 View Judging Statistics"):
-                profile = judge.get_profile()
-                if profile:
-                    st.markdown(judge.get_judging_summary())
+                summary = cached_judging_summary(judge.name, debate_memory.version)
+                if summary:
+                    st.markdown(summary)
                 else:
                     st.info("No judging history yet. This judge will refine their criteria with experience!")
             
             st.divider()
 
+    # --- Leaderboard ---
+    with subtab3:
+        leaderboard = cached_leaderboard(debate_memory.version)
+        if leaderboard:
+            st.caption(
+                "Elo skill ratings account for opponent strength and the judge's rating margin. "
+                "Calibrated averages correct each rating for how strict or lenient its judge is."
+            )
+            st.table([
+                {
+                    "Rank": entry["rank"],
+                    "Debater": entry["name"],
+                    "Elo": round(entry["elo"]),
+                    "Calibrated Avg": (
+                        f"{entry['calibrated_average']:.2f}" if entry.get("calibrated_average") is not None else "-"
+                    ),
+                    "W-L-D": f"{entry['wins']}-{entry['losses']}-{entry['draws']}",
+                    "Debates": entry["debates"],
+                }
+                for entry in leaderboard
+            ])
+        else:
+            st.info("No rated debates yet. Rankings appear after the first debate.")
+
 # ------------------------------------------------------------
 # 📊 TAB 3: DEBATE HISTORY
 # ------------------------------------------------------------
 with tab3:
     st.markdown("### 📜 Complete Debate History")
     
-    stats = debate_memory.get_statistics()
+    stats = cached_statistics(debate_memory.version)
     
     # Display overall statistics
     col1, col2, col3, col4 = st.columns(4)
@@ -313,30 +385,86 @@ with tab3:
     
     st.divider()
     
-    # Filter options
-    all_debates = debate_memory.get_all_debates()
+    # Replay of a stored debate through the chat/audio path (no LLM calls)
+    replay_id = st.session_state.get("replay_debate_id")
+    replay_record = debate_memory.get_debate(replay_id) if replay_id else None
+    if replay_record:
+        st.markdown(f"### ▶️ Replay: Debate #{replay_id}")
+        col_speed, col_close = st.columns([3, 1])
+        with col_speed:
+            replay_speed = st.select_slider(
+                "Replay speed", options=[0.5, 1.0, 2.0, 4.0], value=1.0, format_func=lambda x: f"{x}x"
+            )
+        with col_close:
+            if st.button("⏹️ Close replay"):
+                for key in ("replay_debate_id", "replay_position", "replay_next_at"):
+                    st.session_state.pop(key, None)
+                st.rerun()
+        
+        display_debate_setup({
+            "topic": replay_record["topic"],
+            "debater1_name": replay_record["participants"]["debater1"]["name"],
+            "debater2_name": replay_record["participants"]["debater2"]["name"],
+            "stance1": replay_record["participants"]["debater1"]["stance"],
+            "judge_name": replay_record["judge"],
+        })
+        # While the replay plays, only this fragment reruns, releasing each
+        # turn once the previous one's pause has passed
+        events = list(replay_events(replay_record))
+        playing = st.session_state.get("replay_position", 0) < len(events)
+        st.fragment(show_replay, run_every=REPLAY_TICK_SECONDS if playing else None)(
+            events, replay_speed, chunked_audio, playing
+        )
+        st.caption("Replayed from the stored transcript; no LLM calls were made.")
+        st.divider()
     
-    if all_debates:
+    # Filter options
+    if stats['total_debates']:
         filter_option = st.selectbox(
             "Filter debates by:",
             ["All Debates", "By Debater", "By Judge"]
         )
         
-        filtered_debates = all_debates
+        debater_filter = None
+        judge_filter = None
+        debater_names, judge_names = cached_name_lists(debate_memory.version)
         
         if filter_option == "By Debater":
-            debater_names = list(set([d["participants"]["debater1"]["name"] for d in all_debates] + 
-                                    [d["participants"]["debater2"]["name"] for d in all_debates]))
-            selected_debater = st.selectbox("Select Debater", debater_names)
-            filtered_debates = debate_memory.get_debates_by_debater(selected_debater)
+            debater_filter = st.selectbox("Select Debater", debater_names)
         
         elif filter_option == "By Judge":
-            judge_names = list(set([d["judge"] for d in all_debates]))
-            selected_judge = st.selectbox("Select Judge", judge_names)
-            filtered_debates = debate_memory.get_debates_by_judge(selected_judge)
+            judge_filter = st.selectbox("Select Judge", judge_names)
         
-        # Display debates in reverse chronological order
-        for debate in reversed(filtered_debates):
+        page_size = st.selectbox("Debates per page", [10, 25, 50], index=0)
+        
+        # Cursor stack for the current filter; reset whenever the filter changes
+        filter_key = (filter_option, debater_filter, judge_filter, page_size)
+        if st.session_state.get("history_filter_key") != filter_key:
+            st.session_state["history_filter_key"] = filter_key
+            st.session_state["history_cursors"] = [None]
+        cursors = st.session_state["history_cursors"]
+        
+        # Fetch only the current page (newest first)
+        page = debate_memory.query_debates(
+            cursor=cursors[-1],
+            limit=page_size,
+            debater=debater_filter,
+            judge=judge_filter,
+        )
+        
+        nav_prev, nav_info, nav_next = st.columns([1, 3, 1])
+        with nav_prev:
+            if st.button("⬅️ Newer", disabled=len(cursors) <= 1):
+                cursors.pop()
+                st.rerun()
+        with nav_info:
+            st.caption(f"Page {len(cursors)} of {max(1, -(-page['total'] // page_size))} · {page['total']} debates")
+        with nav_next:
+            if st.button("Older ➡️", disabled=page['next_cursor'] is None):
+                cursors.append(page['next_cursor'])
+                st.rerun()
+        
+        for debate in page['debates']:
             with st.expander(
                 f"🎯 Debate #{debate['id']}: {debate['topic']} ({debate['timestamp'][:10]})"
             ):
@@ -361,6 +489,44 @@ with tab3:
                 st.markdown("---")
                 st.markdown("**🏆 Verdict:**")
                 st.success(debate['verdict'])
+                if debate.get('usage'):
+                    st.caption(format_usage(debate['usage']))
+                
+                if st.button("▶️ Replay debate", key=f"replay_{debate['id']}"):
+                    st.session_state["replay_debate_id"] = debate['id']
+                    st.session_state["replay_position"] = 0
+                    st.session_state["replay_next_at"] = 0.0
+                    st.rerun()
+                
+                # Whole debate as one MP3 with chapter markers, built on request
+                podcast_key = f"podcast_path_{debate['id']}"
+                if st.button("🎧 Prepare debate audio", key=f"podcast_{debate['id']}"):
+                    with st.spinner("Stitching debate audio..."):
+                        st.session_state[podcast_key] = tts_manager.export_debate_audio(
+                            debate_audio_data(debate),
+                            title=f"Debate #{debate['id']}: {debate['topic']}",
+                        )
+                podcast_path = st.session_state.get(podcast_key)
+                # Served from memory on reruns (including job polls), not re-read from disk
+                podcast_bytes = audio_server.get(podcast_path) if podcast_path else None
+                if podcast_bytes:
+                    st.download_button(
+                        "⬇️ Download debate audio (MP3)",
+                        data=podcast_bytes,
+                        file_name=f"debate_{debate['id']}.mp3",
+                        mime="audio/mpeg",
+                        key=f"podcast_download_{debate['id']}",
+                    )
+                
+                # Ratings from later re-judging jobs (originals above are unchanged)
+                versions = debate_memory.get_rating_versions(debate['id'])
+                if versions:
+                    st.markdown("**🔁 Re-judged Ratings:**")
+                    for version in versions:
+                        v1, v2 = version['debater1'], version['debater2']
+                        st.caption(
+                            f"{version['judge']} · job {version['job_id']} · {version['timestamp'][:10]} — "
+                            f"{v1['name']}: {v1['rating']}/5, {v2['name']}: {v2['rating']}/5"
+                        )
     else:
         st.info("No debates have been conducted yet. Start your first debate in the Debate Arena!")
-
@@ -0,0 +1,102 @@
+"""
+Import-Time Benchmark
+Measures cold import cost of each project module in a fresh interpreter and
+reports which heavy dependencies and side effects each import pulls in.
+
+Usage:
+    python -m benchmarks.import_time [--repeat 5] [--json report.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "core.memory_system",
+    "core.rating_system",
+    "core.retrieval_system",
+    "core.tts_system",
+    "agents.debate_agents",
+    "agents.judge_agents",
+    "core.debate_controller",
+]
+
+# Dependencies whose presence in sys.modules after import indicates eager loading
+HEAVY_DEPENDENCIES = ["crewai", "gtts", "streamlit", "langchain", "openai"]
+
+PROBE = """
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+    "audio_dir_created": os.path.isdir("audio_files"),
+    "store_loaded": getattr(sys.modules.get("core.memory_system"), "_debate_memory", None) is not None,
+}}))
+"""
+
+
+def measure_module(module: str, repeat: int) -> dict:
+    """Import a module `repeat` times, each in a fresh interpreter and empty cwd."""
+    timings = []
+    probe_result = {}
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cwd:
+            code = PROBE.format(root=PROJECT_ROOT, module=module, heavy=HEAVY_DEPENDENCIES)
+            proc = subprocess.run(
+                [sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                error = proc.stderr.strip().splitlines()
+                return {"module": module, "error": error[-1] if error else "import failed"}
+            probe_result = json.loads(proc.stdout.strip().splitlines()[-1])
+            timings.append(probe_result["seconds"])
+
+    return {
+        "module": module,
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "heavy_dependencies": probe_result["loaded"],
+        "audio_dir_created": probe_result["audio_dir_created"],
+        "store_loaded": probe_result["store_loaded"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold import time of project modules.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh-interpreter runs per module")
+    parser.add_argument("--json", dest="json_path", help="Write the results to this JSON file")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to measure")
+    args = parser.parse_args()
+
+    results = [measure_module(m, args.repeat) for m in args.modules]
+
+    print(f"{'module':<28} {'median ms':>10} {'min ms':>8}  side effects")
+    for r in results:
+        if "error" in r:
+            print(f"{r['module']:<28} {'ERROR':>10}           {r['error']}")
+            continue
+        effects = list(r["heavy_dependencies"])
+        if r["audio_dir_created"]:
+            effects.append("creates audio_files/")
+        if r["store_loaded"]:
+            effects.append("loads debate store")
+        print(f"{r['module']:<28} {r['median_ms']:>10.1f} {r['min_ms']:>8.1f}  {', '.join(effects) or '-'}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version, "repeat": args.repeat, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Load-Test Harness
+Drives concurrent simulated users through the real debate pipeline (job
+queue, per-debate sessions, learning context, retrieval, rating parsing,
+store writes and the TTS cache) with a fake LLM and a fake TTS engine whose
+latencies follow configurable distributions. Concurrency is stepped up level
+by level to find where throughput stops growing on this host.
+
+Each simulated user submits a debate, follows its events and synthesizes
+every turn as the UI would, then starts the next one. Every level gets a
+fresh debate store in a temporary directory, so the project's own history
+is never touched.
+
+Usage:
+    python -m benchmarks.load_test [--levels 1,2,4,8,16] [--debates-per-user 2]
+        [--llm-latency lognormal:0.2,0.5] [--tts-latency lognormal:0.1,0.5]
+        [--workers N] [--json report.json]
+
+Latency specs (seconds): fixed:S, uniform:LOW,HIGH, lognormal:MEDIAN,SIGMA
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.memory_system as memory_system
+import core.retrieval_system as retrieval_system
+from agents.debate_agents import get_agent_pool
+from agents.judge_agents import get_judge_pool
+from core.debate_controller import run_debate
+from core.job_queue import COMPLETED, DebateJobQueue
+from core.memory_system import DebateMemory
+from core.rating_system import CRITERIA
+from core.tts_backends import SilentBackend
+from core.tts_system import TTSManager
+
+
+TOPICS = [
+    "Should AI have legal rights?",
+    "Is remote work better than office work?",
+    "Should social media be regulated like utilities?",
+    "Is nuclear power essential for fighting climate change?",
+    "Should university education be free?",
+    "Do standardized tests measure merit?",
+]
+
+# Vocabulary for fake speeches; real words so retrieval has something to index
+VOCABULARY = (
+    "evidence policy society risk benefit cost freedom regulation innovation fairness "
+    "history data economy education climate rights trust safety privacy growth labor "
+    "incentive precedent consequence principle majority minority market public private "
+    "argument rebuttal study outcome harm justice responsibility technology future"
+).split()
+
+# A level counts as saturated when throughput grows by less than this over the previous one
+DEFAULT_MIN_GAIN = 0.10
+
+
+# ------------------------------------------------------------
+# Fakes
+# ------------------------------------------------------------
+def parse_latency(spec: str):
+    """
+    Turn a latency spec into a sampler taking a random.Random.
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    kind, _, params = spec.partition(":")
+    try:
+        values = [float(v) for v in params.split(",")] if params else []
+    except ValueError:
+        raise ValueError(f"Bad latency spec '{spec}'")
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2 and values[0] > 0:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+    raise ValueError(f"Bad latency spec '{spec}' (use fixed:S, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA)")
+
+
+class FakeLLM:
+    """Stands in for CrewAI: sleeps for a sampled latency and returns filler text.
+
+    `turn` matches run_task's signature and `rate` matches the judge call in
+    generate_detailed_ratings, returning a complete rubric payload so no
+    repair calls are made.
+    """
+
+    def __init__(self, latency, seed: int = 0, words: int = 120):
+        self.latency = latency
+        self.words = words
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def _sample(self):
+        with self._rng_lock:
+            return self.latency(self._rng), random.Random(self._rng.random())
+
+    def turn(self, agent, prompt, context=""):
+        delay, rng = self._sample()
+        time.sleep(delay)
+        return " ".join(rng.choice(VOCABULARY) for _ in range(self.words)) + "."
+
+    def rate(self, judge_agent, description, expected_output):
+        delay, rng = self._sample()
+        time.sleep(delay)
+        payload = {
+            slot: {
+                "overall": rng.randint(1, 5),
+                "criteria": {criterion: rng.randint(1, 5) for criterion in CRITERIA},
+                "feedback_strengths": "Clear structure and relevant evidence.",
+                "feedback_improvements": "Engage more directly with the opponent.",
+                "justification": "Scored against the rubric.",
+            }
+            for slot in ("debater1", "debater2")
+        }
+        payload["differentiation_reason"] = "One side answered the strongest objection."
+        return json.dumps(payload)
+
+
+class FakeTTSBackend(SilentBackend):
+    """SilentBackend with a sampled (rather than fixed) synthesis latency."""
+
+    def __init__(self, latency, seed: int = 0):
+        super().__init__()
+        self.latency = latency
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def synthesize(self, text, output_path, voice):
+        with self._rng_lock:
+            delay = self.latency(self._rng)
+        time.sleep(delay)
+        super().synthesize(text, output_path, voice)
+
+
+class TimedLock:
+    """Drop-in for the store's RLock that records how long writers wait for it."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.hold_seconds = 0.0
+
+    def acquire(self, blocking=True, timeout=-1):
+        if getattr(self._local, "depth", 0):
+            # Re-entrant acquire by the holder: never waits
+            self._lock.acquire()
+            self._local.depth += 1
+            return True
+        start = time.perf_counter()
+        contended = not self._lock.acquire(blocking=False)
+        if contended and not self._lock.acquire(blocking, timeout):
+            return False
+        acquired = time.perf_counter()
+        # Stats are only touched while holding the lock
+        self.acquisitions += 1
+        self.contended += contended
+        self.wait_seconds += acquired - start
+        self.max_wait_seconds = max(self.max_wait_seconds, acquired - start)
+        self._local.depth = 1
+        self._local.since = acquired
+        return True
+
+    def release(self):
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            self.hold_seconds += time.perf_counter() - self._local.since
+        self._lock.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def stats(self) -> dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "contention_ratio": self.contended / self.acquisitions if self.acquisitions else 0.0,
+            "wait_total_ms": self.wait_seconds * 1000,
+            "wait_max_ms": self.max_wait_seconds * 1000,
+            "hold_mean_ms": self.hold_seconds / self.acquisitions * 1000 if self.acquisitions else 0.0,
+        }
+
+
+# ------------------------------------------------------------
+# Measurement
+# ------------------------------------------------------------
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_level(concurrency: int, args, llm: FakeLLM, tts_latency) -> dict:
+    """Run `concurrency` simulated users against a fresh store and queue."""
+    debaters = [agent.name for agent in get_agent_pool()]
+    judges = [judge.name for judge in get_judge_pool()]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = DebateMemory(os.path.join(workdir, "debate_history.json"))
+        store._write_lock = TimedLock()
+        previous_store = memory_system._debate_memory
+        memory_system._debate_memory = store
+        retrieval_system._argument_index = None
+
+        tts = TTSManager(audio_dir=os.path.join(workdir, "audio"), backend="silent")
+        tts.register_backend(FakeTTSBackend(tts_latency, seed=args.seed + concurrency))
+
+        def runner(on_turn, **params):
+            return run_debate(**params, on_turn=on_turn, task_runner=llm.turn, rating_runner=llm.rate)
+
+        queue = DebateJobQueue(
+            jobs_dir=os.path.join(workdir, "jobs"),
+            max_workers=args.workers or concurrency,
+            runner=runner,
+        )
+
+        latencies = []
+        failures = []
+        results_lock = threading.Lock()
+
+        def user(index: int):
+            rng = random.Random(args.seed * 1000 + concurrency * 100 + index)
+            for _ in range(args.debates_per_user):
+                debater1, debater2 = rng.sample(debaters, 2)
+                start = time.perf_counter()
+                job_id = queue.submit(debater1, debater2, rng.choice(["for", "against"]),
+                                      rng.choice(judges), rng.choice(TOPICS))
+                # Follow the debate like the UI does, voicing each turn as it arrives
+                for event in queue.events(job_id):
+                    if event["type"] == "turn":
+                        tts.generate_speech(event["speaker"], event["text"])
+                job = queue.get(job_id)
+                elapsed = time.perf_counter() - start
+                with results_lock:
+                    if job["status"] == COMPLETED:
+                        latencies.append(elapsed)
+                    else:
+                        failures.append(job["error"] or job["status"])
+                if args.think_time:
+                    time.sleep(args.think_time)
+
+        gc.collect()
+        rss_start = rss_bytes()
+        started = time.perf_counter()
+        # Agents narrate progress on stdout; keep the report readable
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            users = [threading.Thread(target=user, args=(i,), name=f"load-user-{i}") for i in range(concurrency)]
+            for thread in users:
+                thread.start()
+            for thread in users:
+                thread.join()
+        wall = time.perf_counter() - started
+        queue.shutdown()
+        gc.collect()
+        rss_end = rss_bytes()
+
+        memory_system._debate_memory = previous_store
+        retrieval_system._argument_index = None
+        store.rubric_store.close()
+
+    return {
+        "concurrency": concurrency,
+        "workers": args.workers or concurrency,
+        "debates": len(latencies),
+        "failed": len(failures),
+        "first_error": failures[0] if failures else None,
+        "wall_seconds": wall,
+        "throughput_per_min": len(latencies) / wall * 60 if wall else 0.0,
+        "latency_p50_s": percentile(latencies, 50),
+        "latency_p99_s": percentile(latencies, 99),
+        "latency_max_s": max(latencies, default=0.0),
+        "rss_start_mb": rss_start / 2**20,
+        "rss_end_mb": rss_end / 2**20,
+        "rss_growth_mb": (rss_end - rss_start) / 2**20,
+        "store_lock": store._write_lock.stats(),
+    }
+
+
+def find_saturation(results, min_gain: float = DEFAULT_MIN_GAIN, p99_limit: float = None):
+    """
+    The highest concurrency worth running: the level before throughput
+    stops growing by `min_gain` (or p99 latency exceeds `p99_limit`).
+    None when every level still scaled.
+    """
+    for previous, current in zip(results, results[1:]):
+        if current["throughput_per_min"] < previous["throughput_per_min"] * (1 + min_gain):
+            return {"concurrency": previous["concurrency"], "reason": "throughput plateau"}
+        if p99_limit is not None and current["latency_p99_s"] > p99_limit:
+            return {"concurrency": previous["concurrency"], "reason": f"p99 above {p99_limit}s"}
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the debate pipeline with a fake LLM and TTS.")
+    parser.add_argument("--levels", default="1,2,4,8,16", help="Comma-separated concurrent user counts")
+    parser.add_argument("--debates-per-user", type=int, default=2, help="Debates each user runs per level")
+    parser.add_argument("--llm-latency", default="lognormal:0.2,0.5", help="Latency per LLM call")
+    parser.add_argument("--tts-latency", default="lognormal:0.1,0.5", help="Latency per synthesized turn")
+    parser.add_argument("--words", type=int, default=120, help="Words per fake speech")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Job queue workers (default: one per user, so the queue never limits)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between a user's debates")
+    parser.add_argument("--min-gain", type=float, default=DEFAULT_MIN_GAIN,
+                        help="Throughput growth below this fraction marks saturation")
+    parser.add_argument("--p99-limit", type=float, help="p99 latency (s) above which a level is saturated")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", dest="json_path", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        levels = sorted({int(level) for level in args.levels.split(",")})
+        llm_latency = parse_latency(args.llm_latency)
+        tts_latency = parse_latency(args.tts_latency)
+    except ValueError as e:
+        parser.error(str(e))
+
+    llm = FakeLLM(llm_latency, seed=args.seed, words=args.words)
+    results = []
+    print(f"{'users':>5} {'debates':>7} {'failed':>6} {'per min':>8} {'p50 s':>7} {'p99 s':>7} "
+          f"{'rss +MB':>8} {'lock wait ms':>12} {'contended':>9}")
+    for concurrency in levels:
+        r = run_level(concurrency, args, llm, tts_latency)
+        results.append(r)
+        lock = r["store_lock"]
+        print(f"{r['concurrency']:>5} {r['debates']:>7} {r['failed']:>6} {r['throughput_per_min']:>8.1f} "
+              f"{r['latency_p50_s']:>7.2f} {r['latency_p99_s']:>7.2f} {r['rss_growth_mb']:>8.1f} "
+              f"{lock['wait_total_ms']:>12.1f} {lock['contention_ratio']:>9.0%}")
+        if r["first_error"]:
+            print(f"      first error: {r['first_error']}")
+
+    saturation = find_saturation(results, args.min_gain, args.p99_limit)
+    if saturation:
+        print(f"\nSaturation: throughput stops scaling beyond {saturation['concurrency']} "
+              f"concurrent users ({saturation['reason']}).")
+    else:
+        print("\nNo saturation within the tested levels; try higher --levels.")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": sys.version,
+                "config": {key: value for key, value in vars(args).items() if key != "json_path"},
+                "levels": results,
+                "saturation": saturation,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
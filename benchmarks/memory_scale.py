@@ -0,0 +1,285 @@
+"""
+Debate Store Scale Benchmark
+Fills a DebateMemory with synthetic but realistic debates (real agent names,
+full transcripts, feedback the analyzer recognises) and times the store's
+hot paths at each size: loading from JSON and from the snapshot, saving one
+more debate, per-debater lookups, statistics and learning-context
+generation. Generation and measurement run in separate fresh interpreters,
+so the reported peak RSS is that of a process that loads and queries the
+store, not of the generator.
+
+Usage:
+    python -m benchmarks.memory_scale [--sizes 1000,10000,100000] [--words 120]
+        [--repeat 3] [--data-dir stores/] [--json report.json]
+
+With --data-dir, generated stores are kept and reused by later runs (e.g. to
+compare storage layouts on identical data); otherwise they live in a
+temporary directory.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+TOPIC_TEMPLATES = [
+    "Should {} be regulated by governments?",
+    "Is {} good for society?",
+    "Should {} be publicly funded?",
+    "Does {} do more harm than good?",
+    "Should schools teach about {}?",
+    "Is {} overrated?",
+    "Will {} define the next decade?",
+    "Should {} be banned?",
+]
+SUBJECTS = [
+    "artificial intelligence", "remote work", "social media", "nuclear power", "space exploration",
+    "cryptocurrency", "genetic engineering", "universal basic income", "standardized testing",
+    "electric cars", "fast fashion", "video games", "open source software", "animal testing",
+    "homework", "tourism", "gig work", "facial recognition", "lab-grown meat", "smartphones",
+    "online voting", "zoos", "professional sports", "influencer marketing", "public transport",
+]
+
+FEEDBACK_TEMPLATES = [
+    "Strong use of evidence and a clear structure throughout.",
+    "Persuasive and well organized, with compelling examples.",
+    "Logical progression, but the rebuttal lacked specific evidence.",
+    "Weak rebuttal; arguments were vague and poorly supported.",
+    "Engaging delivery, though some claims were unsupported.",
+    "Clear and concise, with a thoughtful response to the opponent.",
+    "Repetitive points and little engagement with counterarguments.",
+]
+
+VOCABULARY = (
+    "evidence policy society risk benefit cost freedom regulation innovation fairness "
+    "history data economy education climate rights trust safety privacy growth labor "
+    "incentive precedent consequence principle majority minority market public private "
+    "argument rebuttal study outcome harm justice responsibility technology future"
+).split()
+
+TRANSCRIPT_KEYS = ["opening_for", "opening_against", "rebuttal_for", "rebuttal_against",
+                   "closing_for", "closing_against"]
+
+
+# ------------------------------------------------------------
+# Synthetic data
+# ------------------------------------------------------------
+def synthetic_debate(rng: random.Random, debaters, judges, words: int) -> dict:
+    """Keyword arguments for DebateMemory.save_debate describing one plausible debate."""
+    debater1, debater2 = rng.sample(debaters, 2)
+    stance1 = rng.choice(["for", "against"])
+    rating1, rating2 = rng.randint(1, 5), rng.randint(1, 5)
+
+    def speech():
+        return " ".join(rng.choice(VOCABULARY) for _ in range(words)) + "."
+
+    judge = rng.choice(judges)
+    return {
+        "topic": rng.choice(TOPIC_TEMPLATES).format(rng.choice(SUBJECTS)),
+        "debater1_name": debater1,
+        "debater2_name": debater2,
+        "debater1_stance": stance1,
+        "debater2_stance": "against" if stance1 == "for" else "for",
+        "judge_name": judge,
+        "debate_transcript": {key: speech() for key in TRANSCRIPT_KEYS},
+        "verdict": f"{judge}'s verdict: " + speech(),
+        "debater1_rating": rating1,
+        "debater2_rating": rating2,
+        "debater1_feedback": rng.choice(FEEDBACK_TEMPLATES),
+        "debater2_feedback": rng.choice(FEEDBACK_TEMPLATES),
+    }
+
+
+def generate_store(path: str, size: int, words: int, seed: int) -> dict:
+    """Write a store with `size` debates through the normal save path, flushing once at the end."""
+    from agents.debate_agents import get_agent_pool
+    from agents.judge_agents import get_judge_pool
+    from core.memory_system import DebateMemory
+
+    debaters = [agent.name for agent in get_agent_pool()]
+    judges = [judge.name for judge in get_judge_pool()]
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    store = DebateMemory(path)
+    # save_debate rewrites the whole file each time; defer that to a single write
+    with store.bulk():
+        for _ in range(size):
+            store.save_debate(**synthetic_debate(rng, debaters, judges, words))
+    store.rubric_store.close()
+    return {"generate_s": time.perf_counter() - start}
+
+
+# ------------------------------------------------------------
+# Measurement
+# ------------------------------------------------------------
+def _timed(func, repeat: int) -> float:
+    """Median seconds over `repeat` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def measure_store(path: str, repeat: int, words: int, seed: int) -> dict:
+    """Time the store's operations on an existing store file (modifies it by appending debates)."""
+    from core.memory_system import DebateMemory
+
+    result = {
+        "json_mb": os.path.getsize(path) / 2**20,
+    }
+
+    # Cold load: no snapshot, so JSON parse + normalize + snapshot write
+    def load_json():
+        if os.path.exists(f"{path}.snapshot"):
+            os.remove(f"{path}.snapshot")
+        store._load_data()
+
+    start = time.perf_counter()
+    store = DebateMemory(path)
+    result["open_s"] = time.perf_counter() - start
+    result["load_json_s"] = _timed(load_json, repeat)
+    result["snapshot_mb"] = os.path.getsize(f"{path}.snapshot") / 2**20
+    result["load_snapshot_s"] = _timed(store._load_data, repeat)
+
+    debaters = sorted(store.data["debater_profiles"])
+    judges = sorted(store.data["judge_profiles"])
+    name, judge = debaters[0], judges[0]
+
+    # First lookup builds the name indexes
+    store._debater_index = store._judge_index = None
+    start = time.perf_counter()
+    store.get_debates_by_debater(name)
+    result["by_debater_first_ms"] = (time.perf_counter() - start) * 1000
+    result["by_debater_ms"] = _timed(lambda: store.get_debates_by_debater(name), repeat) * 1000
+
+    result["statistics_ms"] = _timed(store.get_statistics, repeat) * 1000
+
+    # First context fits the judge calibration over the whole history
+    start = time.perf_counter()
+    store.get_debater_learning_context(name)
+    result["debater_context_first_ms"] = (time.perf_counter() - start) * 1000
+    result["debater_context_ms"] = _timed(lambda: store.get_debater_learning_context(name), repeat) * 1000
+    result["judge_context_ms"] = _timed(lambda: store.get_judge_learning_context(judge), repeat) * 1000
+
+    # Saves outside bulk() rewrite the JSON store and snapshot in full
+    rng = random.Random(seed + 1)
+    result["save_debate_ms"] = _timed(
+        lambda: store.save_debate(**synthetic_debate(rng, debaters, judges, words)), repeat
+    ) * 1000
+
+    store.rubric_store.close()
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def run_worker(args):
+    """Entry point of the fresh interpreters started by run_size; prints one JSON line."""
+    if args.worker == "generate":
+        result = generate_store(args.path, args.size, args.words, args.seed)
+    else:
+        result = measure_store(args.path, args.repeat, args.words, args.seed)
+    print(json.dumps(result))
+
+
+def _run_subprocess(*worker_args) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.memory_scale", *map(str, worker_args)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()
+        return {"error": error[-1] if error else "worker failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_size(size: int, data_dir: str, args) -> dict:
+    """Generate (or reuse) a store of `size` debates and measure a copy of it."""
+    source = os.path.join(data_dir, f"debates_{size}_w{args.words}_s{args.seed}.json")
+    result = {"debates": size}
+    if not os.path.exists(source):
+        generated = _run_subprocess("--worker", "generate", "--path", source, "--size", size,
+                                    "--words", args.words, "--seed", args.seed)
+        if "error" in generated:
+            return dict(result, **generated)
+        result.update(generated)
+
+    # Measure a copy so appended debates never change the reusable store
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "debate_history.json")
+        shutil.copyfile(source, path)
+        result.update(_run_subprocess("--worker", "measure", "--path", path, "--repeat", args.repeat,
+                                      "--words", args.words, "--seed", args.seed))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DebateMemory at large history sizes.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated debate counts")
+    parser.add_argument("--words", type=int, default=120, help="Words per transcript turn")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation (median reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", help="Keep generated stores here and reuse them on later runs")
+    parser.add_argument("--json", dest="json_path", help="Write the results to this JSON file")
+    # Internal: run one phase in this (fresh) interpreter
+    parser.add_argument("--worker", choices=["generate", "measure"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(",")]
+    except ValueError:
+        parser.error("--sizes must be comma-separated integers")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        data_dir = os.path.abspath(args.data_dir) if args.data_dir else scratch
+        os.makedirs(data_dir, exist_ok=True)
+        results = []
+        print(f"{'debates':>8} {'json MB':>8} {'load json s':>11} {'load snap s':>11} {'save ms':>8} "
+              f"{'by debater ms':>13} {'stats ms':>8} {'context ms':>10} {'peak RSS MB':>11}")
+        for size in sizes:
+            r = run_size(size, data_dir, args)
+            results.append(r)
+            if "error" in r:
+                print(f"{size:>8} ERROR {r['error']}")
+                continue
+            print(f"{size:>8} {r['json_mb']:>8.1f} {r['load_json_s']:>11.2f} {r['load_snapshot_s']:>11.2f} "
+                  f"{r['save_debate_ms']:>8.1f} {r['by_debater_ms']:>13.2f} {r['statistics_ms']:>8.2f} "
+                  f"{r['debater_context_ms']:>10.2f} {r['peak_rss_mb']:>11.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": sys.version,
+                "config": {"words": args.words, "repeat": args.repeat, "seed": args.seed},
+                "results": results,
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Content-Addressed Audio Cache
+Stores synthesized clips under a SHA-256 of the text plus the full voice
+configuration, tracks them in an on-disk metadata index, and keeps the
+directory under a byte budget by evicting the least recently used clips.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+# Default size budget for the cache directory
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Cache hits only refresh recency in memory; the index is rewritten at most
+# this often because of them (puts and evictions are written immediately).
+ACCESS_FLUSH_SECONDS = 30.0
+
+
+def audio_cache_key(text: str, voice: Dict) -> str:
+    """Stable key for a clip: the text and every voice setting that shapes it."""
+    payload = json.dumps({"text": text, "voice": voice}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """LRU audio file cache bounded by total bytes on disk.
+
+    The index maps key -> {"file", "size", "last_access", "agent"} and is kept
+    in least-to-most recently used order, so a hit is a dict lookup and an
+    eviction pops from the front without listing or stat-ing the directory.
+    Clips handed out inside a pinned() block are never evicted before the
+    block ends, even if the cache runs over budget meanwhile.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(exist_ok=True)
+        self.index_path = self.directory / INDEX_FILENAME
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        # One set of keys per open pinned() block
+        self._pin_sets: List[Set[str]] = []
+        self.total_bytes = 0
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._load_index()
+
+    # ------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        entries = sorted(data.get("entries", {}).items(), key=lambda item: item[1].get("last_access", 0))
+        self._entries = OrderedDict(entries)
+        self.total_bytes = sum(entry["size"] for entry in self._entries.values())
+
+    def _write_index(self):
+        """Persist the index atomically. Caller holds the lock."""
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "entries": self._entries}, f)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """Write pending recency updates to disk."""
+        with self._lock:
+            if self._dirty:
+                self._write_index()
+
+    # ------------------------------------------------------------
+    # Lookup and insertion
+    # ------------------------------------------------------------
+    def path_for(self, key: str, extension: str) -> str:
+        return str(self.directory / f"{key}{extension}")
+
+    @contextmanager
+    def pinned(self) -> Iterator[Set[str]]:
+        """
+        Protect clips from eviction while a request still needs their paths.
+
+        Pass the yielded set as `pins` to get/put; those keys are kept until
+        the block exits, after which the cache is brought back within budget.
+        """
+        pins: Set[str] = set()
+        with self._lock:
+            self._pin_sets.append(pins)
+        try:
+            yield pins
+        finally:
+            with self._lock:
+                self._pin_sets.remove(pins)
+                if self.total_bytes > self.max_bytes and self._evict():
+                    self._write_index()
+
+    def get(self, key: str, pins: Optional[Set[str]] = None) -> Optional[str]:
+        """Return the cached clip for a key (marking it recently used, and
+        pinning it when `pins` is given), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            path = str(self.directory / entry["file"])
+            if not os.path.exists(path):
+                # Removed behind our back; forget it
+                self.total_bytes -= self._entries.pop(key)["size"]
+                self._dirty = True
+                return None
+            if pins is not None:
+                pins.add(key)
+            entry["last_access"] = time.time()
+            self._entries.move_to_end(key)
+            self._dirty = True
+            if time.monotonic() - self._last_flush > ACCESS_FLUSH_SECONDS:
+                self._write_index()
+            return path
+
+    def put(self, key: str, source_path: str, extension: str, agent_name: str = "",
+            pins: Optional[Set[str]] = None) -> str:
+        """
+        Move a freshly written clip into the cache and evict down to budget.
+
+        Args:
+            key: Cache key from audio_cache_key
+            source_path: Completed temp file; it is renamed into place
+            extension: File extension, e.g. ".mp3"
+            agent_name: Recorded for inspection only
+            pins: Pin set from pinned(); keeps the new clip until the block exits
+
+        Returns:
+            Final path of the cached clip
+        """
+        final_path = self.path_for(key, extension)
+        with self._lock:
+            os.replace(source_path, final_path)
+            size = os.path.getsize(final_path)
+            previous = self._entries.pop(key, None)
+            if previous:
+                self.total_bytes -= previous["size"]
+            self._entries[key] = {
+                "file": os.path.basename(final_path),
+                "size": size,
+                "last_access": time.time(),
+                "agent": agent_name,
+            }
+            self.total_bytes += size
+            if pins is not None:
+                pins.add(key)
+            self._evict(keep=key)
+            self._write_index()
+        return final_path
+
+    def _evict(self, keep: Optional[str] = None, max_entries: Optional[int] = None) -> int:
+        """Drop least recently used, unpinned clips until within budget (and at
+        most `max_entries` clips). Caller holds the lock. Returns the number removed."""
+        pinned = set().union(*self._pin_sets)
+        removed = 0
+        for key in list(self._entries):
+            if self.total_bytes <= self.max_bytes and (max_entries is None or len(self._entries) <= max_entries):
+                break
+            if key == keep or key in pinned:
+                continue
+            removed += 1
+            entry = self._entries.pop(key)
+            self.total_bytes -= entry["size"]
+            try:
+                os.remove(self.directory / entry["file"])
+            except FileNotFoundError:
+                pass
+        return removed
+
+    # ------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------
+    def enforce_budget(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None) -> int:
+        """Evict down to `max_bytes` (default: the configured budget) and, if given,
+        to the `max_entries` most recently used clips. Returns bytes in use."""
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict(max_entries=max_entries)
+            self._write_index()
+            return self.total_bytes
+
+    def remove_untracked(self) -> int:
+        """Delete audio files in the directory that the index does not know about
+        (e.g. clips from the old `{Agent}_{hash}.mp3` naming). Returns the count."""
+        with self._lock:
+            tracked = {entry["file"] for entry in self._entries.values()}
+            removed = 0
+            for path in self.directory.iterdir():
+                if path.suffix in (".mp3", ".wav") and path.name not in tracked:
+                    try:
+                        path.unlink()
+                        removed += 1
+                    except OSError:
+                        pass
+            return removed
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.total_bytes, "max_bytes": self.max_bytes}
@@ -0,0 +1,105 @@
+"""
+Debate Audio Export
+Joins a debate's cached segment MP3s into one file, frame by frame without
+re-encoding, with short pauses between turns and ID3 chapter markers.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Tuple
+
+from core.mp3_utils import audio_frames, chapter_tag, frame_length, silence
+
+
+# Segment ID -> (participant key in debate data, chapter label)
+SEGMENT_LABELS = {
+    "opening_debater1": ("debater1_name", "Opening"),
+    "opening_debater2": ("debater2_name", "Opening"),
+    "rebuttal_debater1": ("debater1_name", "Rebuttal"),
+    "rebuttal_debater2": ("debater2_name", "Rebuttal"),
+    "closing_debater1": ("debater1_name", "Closing"),
+    "closing_debater2": ("debater2_name", "Closing"),
+    "verdict": ("judge_name", "Verdict"),
+}
+
+DEFAULT_PAUSE_SECONDS = 0.8
+
+
+def debate_audio_data(debate: Dict) -> Dict:
+    """Turn a stored debate record into the input of TTSManager.generate_debate_audio."""
+    data = dict(debate.get("transcript") or {})
+    data["debater1_name"] = debate["participants"]["debater1"]["name"]
+    data["debater2_name"] = debate["participants"]["debater2"]["name"]
+    data["judge_name"] = debate["judge"]
+    data["verdict"] = debate.get("verdict")
+    return data
+
+
+def segment_title(segment_id: str, debate_data: Dict) -> str:
+    """Chapter title for a segment, e.g. "Athena — Opening"."""
+    name_key, label = SEGMENT_LABELS.get(segment_id, (None, segment_id))
+    name = debate_data.get(name_key) if name_key else None
+    return f"{name} — {label}" if name else label
+
+
+def export_cache_key(segments: List[Tuple[str, str]], pause_seconds: float, title: str) -> str:
+    """Key for a stitched file. Segment files are content-addressed, so their
+    names identify the audio; titles and pause length are part of the output too."""
+    payload = json.dumps({
+        "kind": "debate-export",
+        "title": title,
+        "pause": pause_seconds,
+        "segments": [(seg_title, os.path.basename(path)) for seg_title, path in segments],
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stitch_mp3(segments: List[Tuple[str, str]], output_path: str,
+               pause_seconds: float = DEFAULT_PAUSE_SECONDS, title: str = "") -> List[Tuple[str, float, float]]:
+    """
+    Concatenate MP3 segments into one file with chapter markers.
+
+    ID3 tags and Xing/Info frames are stripped from each segment and the
+    audio frames copied as-is; pauses are silent frames in the first
+    segment's format.
+
+    Args:
+        segments: (chapter title, MP3 path) in playback order
+        output_path: File to write
+        pause_seconds: Silence inserted between segments
+        title: Title tag for the whole file
+
+    Returns:
+        The chapters written, as (title, start seconds, end seconds)
+
+    Raises:
+        ValueError: If a segment holds no MP3 audio frames (e.g. a WAV clip)
+    """
+    bodies = []
+    chapters = []
+    position = 0.0
+    pause = b""
+    pause_duration = 0.0
+
+    for index, (seg_title, path) in enumerate(segments):
+        with open(path, "rb") as f:
+            frames, duration, fmt = audio_frames(f.read())
+        if fmt is None:
+            raise ValueError(f"No MP3 audio frames in {path}")
+        if index == 0 and pause_seconds > 0:
+            pause = silence(pause_seconds, fmt)
+            pause_frame_length = frame_length(fmt["version"], fmt["sample_rate"], fmt["bitrate_kbps"])
+            pause_duration = len(pause) // pause_frame_length * fmt["duration"]
+        elif pause:
+            bodies.append(pause)
+            position += pause_duration
+        bodies.append(frames)
+        chapters.append((seg_title, position, position + duration))
+        position += duration
+
+    with open(output_path, "wb") as f:
+        f.write(chapter_tag(chapters, title))
+        for body in bodies:
+            f.write(body)
+    return chapters
@@ -0,0 +1,97 @@
+"""
+Audio Serving Layer
+Hands audio clips to the UI from a small in-memory LRU of recently played
+files, so Streamlit reruns do not re-read every clip from disk.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+# Default size of the in-memory clip cache
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+MIME_TYPES = {".mp3": "audio/mp3", ".wav": "audio/wav"}
+
+
+class AudioServer:
+    """Bounded LRU of clip bytes keyed by file path.
+
+    Cached audio files are content-addressed (see core/audio_cache.py), so a
+    path always holds the same bytes and entries never need revalidating.
+    The bytes object is handed to Streamlit as-is, without further copies.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._clips: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def mime_type(path: str) -> str:
+        return MIME_TYPES.get(os.path.splitext(path)[1].lower(), "audio/mp3")
+
+    def get(self, path: str) -> Optional[bytes]:
+        """Return the clip's bytes, reading the file only on a cache miss."""
+        with self._lock:
+            data = self._clips.get(path)
+            if data is not None:
+                self._clips.move_to_end(path)
+                self.hits += 1
+                return data
+
+        try:
+            # Unbuffered read: a single allocation straight into the bytes object
+            with open(path, "rb", buffering=0) as f:
+                data = f.readall()
+        except OSError:
+            return None
+
+        with self._lock:
+            self.misses += 1
+            if len(data) > self.max_bytes:
+                # Too big to cache; serve it uncached
+                return data
+            if path not in self._clips:
+                self._clips[path] = data
+                self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._clips.popitem(last=False)
+                self.total_bytes -= len(evicted)
+        return data
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "clips": len(self._clips),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared audio server, created on first use
+_audio_server = None
+_audio_server_lock = threading.Lock()
+
+
+def get_audio_server() -> AudioServer:
+    """Return the shared AudioServer."""
+    global _audio_server
+    if _audio_server is None:
+        with _audio_server_lock:
+            if _audio_server is None:
+                _audio_server = AudioServer()
+    return _audio_server
+
+
+def __getattr__(name):
+    if name == "audio_server":
+        return get_audio_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,127 @@
+"""
+Cross-Judge Score Calibration
+Fits a per-judge bias and scale (z-score model) over the rating history so
+ratings from strict and lenient judges can be compared on a common scale.
+"""
+
+import math
+from typing import Dict, List
+
+
+# Pseudo-ratings at the global mean/variance blended into each judge's
+# statistics, so a judge with only a few ratings is not over-corrected.
+PRIOR_WEIGHT = 5.0
+MIN_STD = 0.25
+
+
+def _empty_stats() -> Dict[str, float]:
+    return {"n": 0.0, "sum": 0.0, "sumsq": 0.0}
+
+
+class JudgeCalibration:
+    """Per-judge additive bias and scale relative to the pool of all judges.
+
+    Only sufficient statistics (count, sum, sum of squares) are kept, so a full
+    fit is one vectorized pass over history and each new debate is an O(1)
+    incremental update.
+
+        calibrated = global_mean + global_std * (raw - judge_mean) / judge_std
+    """
+
+    def __init__(self):
+        self.judges: Dict[str, Dict[str, float]] = {}
+        self.total = _empty_stats()
+
+    def fit(self, debates: List[Dict]):
+        """Recompute all judge statistics from the full debate history."""
+        import numpy as np
+
+        self.judges = {}
+        self.total = _empty_stats()
+        if not debates:
+            return self
+
+        names = sorted({d["judge"] for d in debates})
+        position = {name: i for i, name in enumerate(names)}
+        judge_idx = np.repeat([position[d["judge"]] for d in debates], 2)
+        ratings = np.array(
+            [[d["participants"]["debater1"]["rating"], d["participants"]["debater2"]["rating"]] for d in debates],
+            dtype=np.float64,
+        ).ravel()
+
+        counts = np.bincount(judge_idx, minlength=len(names))
+        sums = np.bincount(judge_idx, weights=ratings, minlength=len(names))
+        sumsqs = np.bincount(judge_idx, weights=ratings ** 2, minlength=len(names))
+
+        for i, name in enumerate(names):
+            self.judges[name] = {"n": float(counts[i]), "sum": float(sums[i]), "sumsq": float(sumsqs[i])}
+        self.total = {"n": float(counts.sum()), "sum": float(sums.sum()), "sumsq": float(sumsqs.sum())}
+        return self
+
+    def update(self, judge: str, ratings: List[float]):
+        """Add newly given ratings for a judge."""
+        stats = self.judges.setdefault(judge, _empty_stats())
+        for rating in ratings:
+            for target in (stats, self.total):
+                target["n"] += 1
+                target["sum"] += rating
+                target["sumsq"] += rating * rating
+
+    def _global_moments(self):
+        n = self.total["n"]
+        if n == 0:
+            return 3.0, 1.0
+        mean = self.total["sum"] / n
+        var = self.total["sumsq"] / n - mean * mean
+        return mean, math.sqrt(max(var, MIN_STD ** 2))
+
+    def judge_moments(self, judge: str):
+        """Shrunk (mean, std) of the ratings a judge has given."""
+        g_mean, g_std = self._global_moments()
+        stats = self.judges.get(judge)
+        if not stats:
+            return g_mean, g_std
+        n = stats["n"] + PRIOR_WEIGHT
+        mean = (stats["sum"] + PRIOR_WEIGHT * g_mean) / n
+        second = (stats["sumsq"] + PRIOR_WEIGHT * (g_std ** 2 + g_mean ** 2)) / n
+        return mean, math.sqrt(max(second - mean * mean, MIN_STD ** 2))
+
+    def judge_bias(self, judge: str) -> float:
+        """How far above (+) or below (-) the pool average a judge rates."""
+        return self.judge_moments(judge)[0] - self._global_moments()[0]
+
+    def calibrate(self, judge: str, rating: float) -> float:
+        """Map a raw 1-5 rating from a judge onto the pool-wide scale."""
+        g_mean, g_std = self._global_moments()
+        j_mean, j_std = self.judge_moments(judge)
+        return min(5.0, max(1.0, g_mean + g_std * (rating - j_mean) / j_std))
+
+    def debater_averages(self, debates: List[Dict]) -> Dict[str, float]:
+        """Mean calibrated rating per debater over the given debates, vectorized."""
+        import numpy as np
+
+        if not debates:
+            return {}
+        judges = sorted({d["judge"] for d in debates})
+        j_pos = {name: i for i, name in enumerate(judges)}
+        moments = np.array([self.judge_moments(j) for j in judges])
+        g_mean, g_std = self._global_moments()
+
+        names, raw, judge_idx = [], [], []
+        for d in debates:
+            for slot in ("debater1", "debater2"):
+                names.append(d["participants"][slot]["name"])
+                raw.append(d["participants"][slot]["rating"])
+                judge_idx.append(j_pos[d["judge"]])
+        judge_idx = np.array(judge_idx)
+        calibrated = np.clip(
+            g_mean + g_std * (np.array(raw, dtype=np.float64) - moments[judge_idx, 0]) / moments[judge_idx, 1],
+            1.0, 5.0,
+        )
+
+        debaters = sorted(set(names))
+        d_pos = {name: i for i, name in enumerate(debaters)}
+        d_idx = np.array([d_pos[n] for n in names])
+        sums = np.bincount(d_idx, weights=calibrated, minlength=len(debaters))
+        counts = np.bincount(d_idx, minlength=len(debaters))
+        return {name: float(sums[i] / counts[i]) for i, name in enumerate(debaters)}
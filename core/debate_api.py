@@ -0,0 +1,319 @@
+"""
+Headless Debate CLI and HTTP API
+Runs debates without Streamlit: one-off from the command line, or through a
+small local HTTP service that queues debates on the background job queue,
+rejects work beyond its capacity with 503, and streams turn events as
+server-sent events or JSON lines.
+
+Usage:
+    python -m core.debate_api run --debater1 Athena --debater2 Hermes --stance for --judge Solon \
+        --topic "Should AI have legal rights?"
+    python -m core.debate_api serve --port 8765 --workers 2 --max-pending 8
+
+Only one process may write a debate store. To serve while the Streamlit app
+is running, give the API its own store with --storage (or DEBATE_HISTORY_PATH);
+otherwise it refuses to start.
+
+HTTP endpoints:
+    GET  /health                    Queue load
+    GET  /agents                    Debater and judge names
+    POST /debates                   {"debater1", "debater2", "stance", "judge", "topic"} -> 202 {"job_id", ...}
+    GET  /debates                   Recent jobs (without events)
+    GET  /debates/<job_id>          Job status and all events so far
+    GET  /debates/<job_id>/events   Live event stream; SSE when the client accepts
+                                    text/event-stream, otherwise JSON lines.
+                                    ?after=N starts at event N; SSE clients resume via Last-Event-ID.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.debate_agents import get_agent_pool, get_debater
+from agents.judge_agents import get_judge, get_judge_pool
+from core.debate_controller import run_debate
+from core.job_queue import FINISHED_STATES, DebateJobQueue, QueueFullError
+from core.memory_system import StoreInUseError, get_debate_memory
+
+
+# Seconds without new events before an SSE keep-alive comment is sent
+KEEPALIVE_SECONDS = 15.0
+# Suggested client back-off when the queue is full
+RETRY_AFTER_SECONDS = 30
+
+
+def validate_request(payload: Dict) -> Dict:
+    """
+    Check a debate request and map it to DebateJobQueue.submit arguments.
+
+    Raises:
+        ValueError: With a message suitable for the client
+    """
+    params = {
+        "debater1_name": payload.get("debater1"),
+        "debater2_name": payload.get("debater2"),
+        "stance1": payload.get("stance", "for"),
+        "judge_name": payload.get("judge"),
+        "topic": (payload.get("topic") or "").strip(),
+    }
+    if not params["topic"]:
+        raise ValueError("'topic' is required")
+    if params["stance1"] not in ("for", "against"):
+        raise ValueError("'stance' must be 'for' or 'against'")
+    for key, lookup in (("debater1_name", get_debater), ("debater2_name", get_debater), ("judge_name", get_judge)):
+        try:
+            lookup(params[key])
+        except KeyError:
+            raise ValueError(f"Unknown {key.split('_')[0]} '{params[key]}'")
+    if params["debater1_name"] == params["debater2_name"]:
+        raise ValueError("'debater1' and 'debater2' must be different debaters")
+    return params
+
+
+def job_summary(job: Dict) -> Dict:
+    """Job snapshot without its (possibly long) event list."""
+    summary = {key: value for key, value in job.items() if key != "events"}
+    summary["event_count"] = len(job["events"])
+    return summary
+
+
+class DebateAPIHandler(BaseHTTPRequestHandler):
+    """Request handler; the job queue is attached to the server as `server.job_queue`."""
+
+    server_version = "DebateAPI/1.0"
+
+    # ------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------
+    @property
+    def job_queue(self) -> DebateJobQueue:
+        return self.server.job_queue
+
+    def _send_json(self, status: int, body, headers: Optional[Dict] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, message: str, headers: Optional[Dict] = None):
+        self._send_json(status, {"error": message}, headers)
+
+    def log_message(self, format, *args):
+        sys.stderr.write(f"[debate-api] {self.address_string()} {format % args}\n")
+
+    # ------------------------------------------------------------
+    # Routes
+    # ------------------------------------------------------------
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+
+        if parts == ["health"]:
+            return self._send_json(200, {
+                "status": "ok",
+                "active": self.job_queue.active_count(),
+                "max_pending": self.job_queue.max_pending,
+                "workers": self.job_queue.max_workers,
+            })
+        if parts == ["agents"]:
+            return self._send_json(200, {
+                "debaters": [agent.name for agent in get_agent_pool()],
+                "judges": [judge.name for judge in get_judge_pool()],
+            })
+        if parts == ["debates"]:
+            return self._send_json(200, {"jobs": [job_summary(job) for job in self.job_queue.list_jobs()]})
+        if len(parts) in (2, 3) and parts[0] == "debates":
+            job = self.job_queue.get(parts[1])
+            if job is None:
+                return self._error(404, f"Unknown job '{parts[1]}'")
+            if len(parts) == 2:
+                return self._send_json(200, job)
+            if parts[2] == "events":
+                return self._stream_events(job["id"], parse_qs(url.query))
+        self._error(404, "Not found")
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/debates":
+            return self._error(404, "Not found")
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object")
+            params = validate_request(payload)
+        except ValueError as e:
+            return self._error(400, str(e))
+
+        try:
+            job_id = self.job_queue.submit(**params)
+        except QueueFullError as e:
+            return self._error(503, str(e), {"Retry-After": str(RETRY_AFTER_SECONDS)})
+
+        self._send_json(
+            202,
+            {"job_id": job_id, "status_url": f"/debates/{job_id}", "events_url": f"/debates/{job_id}/events"},
+            {"Location": f"/debates/{job_id}"},
+        )
+
+    def _stream_events(self, job_id: str, query: Dict):
+        """Stream events until the job finishes; the connection closes at the end."""
+        sse = "text/event-stream" in self.headers.get("Accept", "")
+        try:
+            if "after" in query:
+                position = max(0, int(query["after"][0]))
+            elif self.headers.get("Last-Event-ID"):
+                # SSE reconnect: resume after the last event the client saw
+                position = int(self.headers["Last-Event-ID"]) + 1
+            else:
+                position = 0
+        except ValueError:
+            return self._error(400, "'after' must be an integer")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        try:
+            while True:
+                for event in self.job_queue.events(job_id, after=position, timeout=KEEPALIVE_SECONDS):
+                    self._write_event(position, event, sse)
+                    position += 1
+                job = self.job_queue.get(job_id)
+                if job["status"] in FINISHED_STATES and position >= len(job["events"]):
+                    self._write_event(position, {"type": "end", "status": job["status"], "error": job["error"]}, sse)
+                    return
+                if sse:
+                    # Timed out without progress; keep proxies from closing the connection
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away; the debate keeps running
+            return
+
+    def _write_event(self, index: int, event: Dict, sse: bool):
+        data = json.dumps(event, ensure_ascii=False)
+        if sse:
+            chunk = f"id: {index}\nevent: {event['type']}\ndata: {data}\n\n"
+        else:
+            chunk = data + "\n"
+        self.wfile.write(chunk.encode("utf-8"))
+        self.wfile.flush()
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8765, job_queue: Optional[DebateJobQueue] = None,
+                  workers: int = 2, max_pending: int = 8) -> ThreadingHTTPServer:
+    """Build (but do not start) the HTTP server."""
+    server = ThreadingHTTPServer((host, port), DebateAPIHandler)
+    server.daemon_threads = True
+    # Own job directory: the Streamlit app's queue marks other processes' running jobs as interrupted
+    server.job_queue = job_queue or DebateJobQueue(
+        jobs_dir=os.path.join("debate_jobs", "api"), max_workers=workers, max_pending=max_pending
+    )
+    return server
+
+
+# ------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------
+def open_store(args):
+    """Claim the debate store before any debate runs; exit if another process writes it."""
+    if args.storage:
+        os.environ["DEBATE_HISTORY_PATH"] = args.storage
+    try:
+        get_debate_memory()
+    except StoreInUseError as e:
+        sys.exit(f"error: {e}")
+
+
+def run_command(args):
+    """Run one debate in this process, writing each event as a JSON line (or text) to stdout."""
+    try:
+        params = validate_request({
+            "debater1": args.debater1, "debater2": args.debater2, "stance": args.stance,
+            "judge": args.judge, "topic": args.topic,
+        })
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    open_store(args)
+    out = sys.stdout
+
+    def on_turn(event):
+        if args.format == "jsonl":
+            out.write(json.dumps(event, ensure_ascii=False) + "\n")
+        elif event["type"] == "turn":
+            out.write(f"\n{event['speaker']} {event['label']}:\n{event['text']}\n")
+        elif event["type"] == "ratings":
+            for slot in ("debater1", "debater2"):
+                rated = event[slot]
+                out.write(f"\n{rated['name']}: {rated['rating']}/5 - {rated['feedback']}\n")
+        elif event["type"] == "usage":
+            total = event["usage"]["total"]
+            cost = f", ~${total['cost_usd']:.4f}" if total["cost_usd"] is not None else ""
+            out.write(f"\n🪙 {total['total_tokens']} tokens in {total['calls']} LLM calls{cost}\n")
+        elif event["type"] == "saved":
+            out.write(f"\n✅ Saved as debate #{event['debate_id']}\n")
+        out.flush()
+
+    # Progress chatter from the agents goes to stderr so stdout stays machine-readable
+    with contextlib.redirect_stdout(sys.stderr):
+        run_debate(**params, on_turn=on_turn, token_budget=args.token_budget)
+
+
+def serve_command(args):
+    open_store(args)
+    server = create_server(args.host, args.port, workers=args.workers, max_pending=args.max_pending)
+    print(f"🎙️ Debate API listening on http://{args.host}:{args.port} "
+          f"({args.workers} workers, up to {args.max_pending} pending debates)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run AI debates without the Streamlit UI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run a single debate and print its turns")
+    run_parser.add_argument("--debater1", required=True)
+    run_parser.add_argument("--debater2", required=True)
+    run_parser.add_argument("--stance", choices=["for", "against"], default="for", help="Debater 1's stance")
+    run_parser.add_argument("--judge", required=True)
+    run_parser.add_argument("--topic", required=True)
+    run_parser.add_argument("--format", choices=["jsonl", "text"], default="jsonl")
+    run_parser.add_argument("--token-budget", type=int,
+                            help="Abort once the debate's LLM calls exceed this many tokens")
+    run_parser.set_defaults(handler=run_command)
+
+    serve_parser = commands.add_parser("serve", help="Start the local HTTP API")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--workers", type=int, default=2, help="Debates run concurrently")
+    serve_parser.add_argument("--max-pending", type=int, default=8,
+                              help="Queued + running debates before new requests get 503")
+    serve_parser.set_defaults(handler=serve_command)
+
+    for command_parser in (run_parser, serve_parser):
+        command_parser.add_argument("--storage", help="Debate store to write (default: DEBATE_HISTORY_PATH "
+                                                      "or debate_history.json); one process per store")
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,28 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import random
-from crewai import Agent, Task, Crew, Process
 from textwrap import dedent
-from agents.debate_agents import agent_pool
-from agents.judge_agents import judge_pool
-from core.memory_system import debate_memory
-from core.rating_system import generate_detailed_ratings
+from agents.debate_agents import get_debater
+from agents.judge_agents import get_judge
+from core.memory_system import get_debate_memory
+from core.prompts import render_prompt
+from core.rating_system import generate_detailed_ratings, run_judge_task
+from core.usage_meter import UsageMeter
+
+
+# Chat labels for each round's turns (openings are labelled with the stance)
+TURN_LABELS = {
+    "rebuttal": "🔄 Rebuttal",
+    "closing": "🎤 Closing Statement",
+    "verdict": "⚖️ Final Verdict",
+}
 
 
 # --- Helper Function ---
 def run_task(agent, prompt, context=""):
     """Run a single debate round for an agent."""
+    from crewai import Task, Crew, Process
+
     task = Task(
         description=dedent(prompt),
         agent=agent.agent,
@@ -30,95 +40,132 @@ def run_task(agent, prompt, context=""):
 
 
 # --- Streamlit / Programmatic Debate Runner ---
-def run_debate(debater1_name, debater2_name, stance1, judge_name, topic):
-    """Non-interactive debate runner with memory integration."""
+def run_debate(debater1_name, debater2_name, stance1, judge_name, topic, on_turn=None,
+               task_runner=None, rating_runner=None, token_budget=None):
+    """
+    Non-interactive debate runner with memory integration.
+
+    Args:
+        on_turn: Optional callback receiving progress events as plain dicts:
+            {"type": "stage", "stage"} before each round,
+            {"type": "turn", "key", "round", "speaker", "label", "text"} per speech,
+            {"type": "ratings", "debater1", "debater2"} with name/rating/feedback,
+            {"type": "usage", "usage"} with the debate's token totals (see UsageMeter.summary;
+            also sent, with "aborted", when the token budget stops the debate),
+            {"type": "saved", "debate_id"} once the debate is stored.
+        task_runner: Replaces run_task for the debater and verdict turns
+            (e.g. a fake LLM in benchmarks/load_test.py)
+        rating_runner: Replaces the judge call inside generate_detailed_ratings
+        token_budget: Stop the debate with TokenBudgetExceeded before a call whose
+            prompt no longer fits, or once its LLM calls use more tokens than this
+            (default: DEBATE_TOKEN_BUDGET env var, else no limit). The spend so far
+            is kept via DebateMemory.save_aborted_usage.
+    """
     print("\n🎙️ === AI Debate Simulator (Streamlit Mode) ===\n")
+    emit = on_turn or (lambda event: None)
+    run_turn = task_runner or run_task
 
-    debater1 = next(a for a in agent_pool if a.name == debater1_name)
-    debater2 = next(a for a in agent_pool if a.name == debater2_name)
-    judge = next(j for j in judge_pool if j.name == judge_name)
+    def budget_exceeded(usage):
+        # The debate will not be saved; keep its spend and tell followers why it stopped
+        get_debate_memory().save_aborted_usage(topic, debater1_name, debater2_name, judge_name, usage)
+        emit({"type": "usage", "usage": {key: value for key, value in usage.items() if key != "calls"}})
 
-    # Assign stances (this updates learning context)
-    debater1.assign_stance(stance1)
-    debater2.assign_stance("against" if stance1 == "for" else "for")
-    
-    # Prepare judge for judgment
-    judge.prepare_for_judgment()
+    # Token usage and latency of every LLM call, stored with the debate
+    meter = UsageMeter(token_budget, on_exceeded=budget_exceeded)
+
+    # Per-debate sessions (stance + learning context) over the shared personas,
+    # so concurrent debates with the same agents don't interfere
+    debater1 = get_debater(debater1_name).start_session(stance1, topic)
+    debater2 = get_debater(debater2_name).start_session("against" if stance1 == "for" else "for", topic)
+    judge = get_judge(judge_name).start_session()
 
     debate_history = []
 
+    def turn(key, round_type, speaker, label, text):
+        emit({"type": "turn", "key": key, "round": round_type, "speaker": speaker.name,
+              "label": label, "text": str(text)})
+
     # Round 1: Openings
-    opening_for_prompt = f"""
-    You are {debater1.name}. You are arguing {debater1.stance.upper()} the motion: "{topic}".
-    Present your opening statement in 6-8 sentences, establishing your core reasoning.
-    """
-    opening_against_prompt = f"""
-    You are {debater2.name}. You are arguing {debater2.stance.upper()} the motion: "{topic}".
-    Present your opening statement in 6-8 sentences, presenting your stance clearly.
-    """
+    emit({"type": "stage", "stage": "opening"})
+    opening_for_prompt = render_prompt(
+        "debate.opening", debater_name=debater1.name, stance=debater1.stance.upper(), topic=topic
+    )
+    opening_against_prompt = render_prompt(
+        "debate.opening", debater_name=debater2.name, stance=debater2.stance.upper(), topic=topic
+    )
 
-    arg_for = run_task(debater1, opening_for_prompt)
-    arg_against = run_task(debater2, opening_against_prompt)
-    debate_history.append(f"{debater1.name} (FOR): {arg_for}")
-    debate_history.append(f"{debater2.name} (AGAINST): {arg_against}")
+    arg_for = meter.call("opening", run_turn, debater1, opening_for_prompt)
+    turn("opening_for", "opening", debater1, f"({debater1.stance.upper()})", arg_for)
+    arg_against = meter.call("opening", run_turn, debater2, opening_against_prompt)
+    turn("opening_against", "opening", debater2, f"({debater2.stance.upper()})", arg_against)
+    debate_history.append(f"{debater1.name} ({debater1.stance.upper()}): {arg_for}")
+    debate_history.append(f"{debater2.name} ({debater2.stance.upper()}): {arg_against}")
 
     # Round 2: Rebuttals
-    rebuttal_for_prompt = f"""
-    You are {debater1.name}. You are arguing {debater1.stance.upper()} the motion: "{topic}".
-    Your opponent said:\n{arg_against}
-    Write a rebuttal in 5-6 sentences.
-    """
-    rebuttal_against_prompt = f"""
-    You are {debater2.name}. You are arguing {debater2.stance.upper()} the motion: "{topic}".
-    Your opponent said:\n{arg_for}
-    Write a rebuttal in 5-6 sentences.
-    """
+    emit({"type": "stage", "stage": "rebuttal"})
+    rebuttal_for_prompt = render_prompt(
+        "debate.rebuttal", debater_name=debater1.name, stance=debater1.stance.upper(), topic=topic,
+        opponent_argument=arg_against,
+    )
+    rebuttal_against_prompt = render_prompt(
+        "debate.rebuttal", debater_name=debater2.name, stance=debater2.stance.upper(), topic=topic,
+        opponent_argument=arg_for,
+    )
 
-    rebuttal_for = run_task(debater1, rebuttal_for_prompt)
-    rebuttal_against = run_task(debater2, rebuttal_against_prompt)
+    rebuttal_for = meter.call("rebuttal", run_turn, debater1, rebuttal_for_prompt)
+    turn("rebuttal_for", "rebuttal", debater1, TURN_LABELS["rebuttal"], rebuttal_for)
+    rebuttal_against = meter.call("rebuttal", run_turn, debater2, rebuttal_against_prompt)
+    turn("rebuttal_against", "rebuttal", debater2, TURN_LABELS["rebuttal"], rebuttal_against)
     debate_history.append(f"{debater1.name} Rebuttal: {rebuttal_for}")
     debate_history.append(f"{debater2.name} Rebuttal: {rebuttal_against}")
 
     # Round 3: Closings
-    closing_for_prompt = f"""
-    You are {debater1.name}. Closing argument for "{topic}".
-    Summarize your position in 5-7 sentences. Debate so far:\n{debate_history}
-    """
-    closing_against_prompt = f"""
-    You are {debater2.name}. Closing argument for "{topic}".
-    Summarize your position in 5-7 sentences. Debate so far:\n{debate_history}
-    """
+    emit({"type": "stage", "stage": "closing"})
+    closing_for_prompt = render_prompt(
+        "debate.closing", debater_name=debater1.name, stance=debater1.stance.upper(), topic=topic,
+        transcript="\n\n".join(debate_history),
+    )
+    closing_against_prompt = render_prompt(
+        "debate.closing", debater_name=debater2.name, stance=debater2.stance.upper(), topic=topic,
+        transcript="\n\n".join(debate_history),
+    )
 
-    closing_for = run_task(debater1, closing_for_prompt)
-    closing_against = run_task(debater2, closing_against_prompt)
+    closing_for = meter.call("closing", run_turn, debater1, closing_for_prompt)
+    turn("closing_for", "closing", debater1, TURN_LABELS["closing"], closing_for)
+    closing_against = meter.call("closing", run_turn, debater2, closing_against_prompt)
+    turn("closing_against", "closing", debater2, TURN_LABELS["closing"], closing_against)
     debate_history.append(f"{debater1.name} Closing: {closing_for}")
     debate_history.append(f"{debater2.name} Closing: {closing_against}")
 
     # Verdict
-    verdict_prompt = f"""
-    You are {judge.name}, the judge known for {judge.judging_style}.
-    Focus on {judge.focus}.
-    Debate Transcript:
-    {debate_history}
-    Decide the winner objectively and provide reasoning in 2-3 paragraphs.
-    
-    IMPORTANT: End your verdict with a clear winner declaration on a new line in this exact format:
-    "Winner: [Debater Name]"
-    """
+    emit({"type": "stage", "stage": "verdict"})
+    verdict_prompt = render_prompt(
+        "judge.verdict", judge_name=judge.name, judging_style=judge.judging_style, focus=judge.focus,
+        transcript="\n\n".join(debate_history),
+    )
 
-    verdict = run_task(judge, verdict_prompt)
+    verdict = meter.call("verdict", run_turn, judge, verdict_prompt)
+    turn("verdict", "verdict", judge, TURN_LABELS["verdict"], verdict)
     
     # Generate ratings
+    emit({"type": "stage", "stage": "ratings"})
     debate_transcript_str = "\n\n".join(debate_history)
-    debater1_rating, debater2_rating, debater1_feedback, debater2_feedback = generate_detailed_ratings(
+    debater1_rating, debater2_rating, debater1_feedback, debater2_feedback, rubric_details = generate_detailed_ratings(
         judge,
         debater1.name,
         debater2.name,
         debater1.stance,
         debater2.stance,
         debate_transcript_str,
-        topic
+        topic,
+        return_details=True,
+        task_runner=meter.track("rating", rating_runner or run_judge_task),
     )
+    emit({
+        "type": "ratings",
+        "debater1": {"name": debater1.name, "rating": debater1_rating, "feedback": debater1_feedback},
+        "debater2": {"name": debater2.name, "rating": debater2_rating, "feedback": debater2_feedback},
+    })
     
     # Save to memory
     # Convert CrewOutput objects to strings for JSON serialization
@@ -131,7 +178,7 @@ def run_debate(debater1_name, debater2_name, stance1, judge_name, topic):
         "closing_against": str(closing_against)
     }
     
-    debate_memory.save_debate(
+    debate_id = get_debate_memory().save_debate(
         topic=topic,
         debater1_name=debater1.name,
         debater2_name=debater2.name,
@@ -143,8 +190,12 @@ def run_debate(debater1_name, debater2_name, stance1, judge_name, topic):
         debater1_rating=debater1_rating,
         debater2_rating=debater2_rating,
         debater1_feedback=debater1_feedback,
-        debater2_feedback=debater2_feedback
+        debater2_feedback=debater2_feedback,
+        rubric=rubric_details,
+        usage=meter.summary(),
     )
+    emit({"type": "usage", "usage": meter.summary(include_calls=False)})
+    emit({"type": "saved", "debate_id": debate_id})
 
     return f"""
     🧠 Topic: {topic}
@@ -0,0 +1,106 @@
+"""
+Feedback Analyzer for Debate Agents
+Extracts weighted strength and weakness keywords from judge feedback in a
+single regex pass, with negation handling ("not convincing", "never weak").
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+
+
+# term -> (polarity, weight). Terms match as word prefixes, so "logical"
+# also covers "logically" and "weak" covers "weakness".
+DEFAULT_LEXICON: Dict[str, Tuple[str, float]] = {
+    "strong": ("positive", 1.0),
+    "excellent": ("positive", 1.5),
+    "compelling": ("positive", 1.2),
+    "persuasive": ("positive", 1.0),
+    "effective": ("positive", 1.0),
+    "well-structured": ("positive", 1.2),
+    "logical": ("positive", 1.0),
+    "convincing": ("positive", 1.0),
+    "weak": ("negative", 1.0),
+    "lacking": ("negative", 1.0),
+    "insufficient": ("negative", 1.0),
+    "unclear": ("negative", 1.0),
+    "unconvincing": ("negative", 1.2),
+    "poor": ("negative", 1.5),
+    "flawed": ("negative", 1.2),
+    "missing": ("negative", 0.8),
+}
+
+DEFAULT_NEGATORS = ("not", "no", "never", "hardly", "barely", "without", "nor", "isn't", "wasn't", "didn't")
+
+# Words that end the scope of a preceding negator
+SCOPE_BREAKERS = ("but", "however", "although", "though", "yet")
+
+
+class FeedbackAnalyzer:
+    """Compiled single-pass keyword matcher over judge feedback.
+
+    One combined regex tokenizes the text and recognises lexicon terms,
+    negators and clause boundaries together. A term within `negation_window`
+    words after a negator in the same clause is negated: a negated positive
+    term is reported as a weakness ("not convincing"), a negated negative
+    term is ignored.
+    """
+
+    def __init__(self, lexicon: Optional[Dict[str, Tuple[str, float]]] = None,
+                 negators: Iterable[str] = DEFAULT_NEGATORS, negation_window: int = 3,
+                 negated_weight: float = 0.8):
+        self.lexicon = {term.lower(): spec for term, spec in (lexicon or DEFAULT_LEXICON).items()}
+        self.negators = frozenset(n.lower() for n in negators)
+        self.negation_window = negation_window
+        self.negated_weight = negated_weight
+
+        # Longest terms first so "well-structured" wins over any shorter overlap
+        terms = sorted(self.lexicon, key=len, reverse=True)
+        self.pattern = re.compile(
+            r"(?P<term>\b(?:" + "|".join(re.escape(t) for t in terms) + r")[\w-]*)"
+            r"|(?P<word>\b[\w'-]+)"
+            r"|(?P<stop>[.;:!?,])",
+            re.IGNORECASE,
+        )
+        self._term_lookup = re.compile(r"^(?:" + "|".join(re.escape(t) for t in terms) + r")", re.IGNORECASE)
+
+    def analyze(self, feedback: str) -> Dict[str, Dict[str, float]]:
+        """
+        Score strength and weakness keywords in a piece of feedback.
+
+        Returns:
+            {"positive": {label: score}, "negative": {label: score}}
+        """
+        scores = {"positive": defaultdict(float), "negative": defaultdict(float)}
+        word_index = 0
+        last_negator = None
+
+        for match in self.pattern.finditer(feedback or ""):
+            if match.lastgroup == "stop":
+                last_negator = None
+                continue
+
+            text = match.group().lower()
+            word_index += 1
+
+            if match.lastgroup == "word":
+                if text in self.negators:
+                    last_negator = word_index
+                elif text in SCOPE_BREAKERS:
+                    last_negator = None
+                continue
+
+            term = self._term_lookup.match(text).group().lower()
+            polarity, weight = self.lexicon[term]
+            negated = last_negator is not None and word_index - last_negator <= self.negation_window
+
+            if not negated:
+                scores[polarity][term] += weight
+            elif polarity == "positive":
+                scores["negative"][f"not {term}"] += weight * self.negated_weight
+
+        return {polarity: dict(found) for polarity, found in scores.items()}
+
+
+# Shared analyzer with the default lexicon
+feedback_analyzer = FeedbackAnalyzer()
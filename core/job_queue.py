@@ -0,0 +1,261 @@
+"""
+Background Debate Jobs
+Runs debates on worker threads outside the Streamlit script run, persisting
+each finished turn so progress survives reruns and page refreshes. The UI
+polls a job's state; other callers can block on new events.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from core.debate_controller import run_debate
+
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+# Was queued or running when its process exited; the turns so far are kept
+INTERRUPTED = "interrupted"
+
+FINISHED_STATES = (COMPLETED, FAILED, INTERRUPTED)
+
+# Finished jobs (and progress files) kept by default; every event is stored,
+# so files would otherwise accumulate without bound
+DEFAULT_KEEP_FINISHED = 100
+
+
+class QueueFullError(RuntimeError):
+    """Raised by submit() when max_pending debates are already queued or running."""
+
+
+class DebateJobQueue:
+    """Thread-pool job queue for debates with per-job JSON progress files.
+
+    Each job file holds the request parameters, the status and every event
+    emitted by run_debate so far (stage changes, turns, ratings, saved ID).
+    Debates are I/O bound on LLM calls, so threads give real concurrency
+    while sharing the in-process debate store.
+    """
+
+    def __init__(self, jobs_dir: str = "debate_jobs", max_workers: int = 2,
+                 runner: Callable = run_debate, max_pending: Optional[int] = None,
+                 keep_finished: Optional[int] = DEFAULT_KEEP_FINISHED):
+        """
+        Args:
+            jobs_dir: Directory for per-job progress files
+            max_workers: Debates that may run at the same time
+            runner: Debate function taking the job parameters and on_turn
+            max_pending: Reject submissions beyond this many queued + running
+                debates (default: unbounded)
+            keep_finished: Finished jobs kept, most recently finished first;
+                older ones and their progress files are deleted at startup and
+                whenever a job finishes (None keeps every job)
+        """
+        self.jobs_dir = jobs_dir
+        os.makedirs(jobs_dir, exist_ok=True)
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max_pending
+        self.keep_finished = keep_finished
+        self.runner = runner
+        self._jobs: Dict[str, Dict] = {}
+        self._changed = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="debate-job")
+        self._load_jobs()
+
+    # ------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _load_jobs(self):
+        """Pick up jobs from earlier processes; unfinished ones are marked interrupted."""
+        for filename in os.listdir(self.jobs_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, filename), "r", encoding="utf-8") as f:
+                    job = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if job.get("status") not in FINISHED_STATES:
+                job["status"] = INTERRUPTED
+                job["finished"] = datetime.now().isoformat()
+                self._jobs[job["id"]] = job
+                self._persist(job)
+            else:
+                self._jobs[job["id"]] = job
+        self._prune_finished()
+
+    def _prune_finished(self):
+        """Drop finished jobs beyond keep_finished, oldest first. Caller holds _changed (or is __init__)."""
+        if self.keep_finished is None:
+            return
+        finished = sorted(
+            (job for job in self._jobs.values() if job["status"] in FINISHED_STATES),
+            key=lambda job: job.get("finished") or job["created"],
+            reverse=True,
+        )
+        for job in finished[self.keep_finished:]:
+            del self._jobs[job["id"]]
+            try:
+                os.remove(self._job_path(job["id"]))
+            except OSError:
+                pass
+
+    def _persist(self, job: Dict):
+        """Atomically rewrite a job's progress file."""
+        path = self._job_path(job["id"])
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(job, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving debate job {job['id']}: {e}")
+
+    def _update(self, job_id: str, event: Optional[Dict] = None, **fields):
+        """Apply an event and/or field changes to a job, persist it and wake waiters."""
+        with self._changed:
+            job = self._jobs[job_id]
+            if event is not None:
+                job["events"].append(event)
+                if event["type"] == "stage":
+                    job["stage"] = event["stage"]
+                elif event["type"] == "saved":
+                    job["debate_id"] = event["debate_id"]
+            job.update(fields)
+            self._persist(job)
+            self._changed.notify_all()
+
+    # ------------------------------------------------------------
+    # Submitting and running
+    # ------------------------------------------------------------
+    def submit(self, debater1_name: str, debater2_name: str, stance1: str,
+               judge_name: str, topic: str) -> str:
+        """Queue a debate and return its job ID.
+
+        Raises:
+            QueueFullError: If max_pending debates are already queued or running
+        """
+        job_id = uuid.uuid4().hex[:12]
+        job = {
+            "id": job_id,
+            "status": QUEUED,
+            "params": {
+                "debater1_name": debater1_name,
+                "debater2_name": debater2_name,
+                "stance1": stance1,
+                "judge_name": judge_name,
+                "topic": topic,
+            },
+            "stage": None,
+            "events": [],
+            "debate_id": None,
+            "error": None,
+            "created": datetime.now().isoformat(),
+            "started": None,
+            "finished": None,
+        }
+        with self._changed:
+            if self.max_pending is not None and self._active_count() >= self.max_pending:
+                raise QueueFullError(f"{self.max_pending} debates already queued or running")
+            self._jobs[job_id] = job
+            self._persist(job)
+        self._pool.submit(self._run, job_id)
+        return job_id
+
+    def _run(self, job_id: str):
+        self._update(job_id, status=RUNNING, started=datetime.now().isoformat())
+        params = dict(self._jobs[job_id]["params"])
+        try:
+            self.runner(**params, on_turn=lambda event: self._update(job_id, event))
+            self._update(job_id, status=COMPLETED, finished=datetime.now().isoformat())
+        except Exception as e:
+            print(f"Debate job {job_id} failed: {e}")
+            self._update(job_id, status=FAILED, error=str(e), finished=datetime.now().isoformat())
+        with self._changed:
+            self._prune_finished()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads once queued debates are done (or right away if not waiting)."""
+        self._pool.shutdown(wait=wait)
+
+    # ------------------------------------------------------------
+    # Reading progress
+    # ------------------------------------------------------------
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Snapshot of a job (status, stage, events, ...), or None if unknown."""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return dict(job, events=list(job["events"])) if job else None
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict]:
+        """Job snapshots, newest first, optionally filtered by status."""
+        with self._changed:
+            jobs = [
+                dict(job, events=list(job["events"]))
+                for job in self._jobs.values()
+                if status is None or job["status"] == status
+            ]
+        return sorted(jobs, key=lambda job: job["created"], reverse=True)
+
+    def _active_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if job["status"] not in FINISHED_STATES)
+
+    def active_count(self) -> int:
+        """Jobs queued or running."""
+        with self._changed:
+            return self._active_count()
+
+    def events(self, job_id: str, after: int = 0, timeout: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Yield a job's events from index `after` on, blocking for new ones
+        until the job finishes (or `timeout` seconds pass without progress).
+        """
+        position = after
+        while True:
+            with self._changed:
+                job = self._jobs[job_id]
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while len(job["events"]) <= position and job["status"] not in FINISHED_STATES:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return
+                    self._changed.wait(remaining)
+                new_events = job["events"][position:]
+                finished = job["status"] in FINISHED_STATES
+            for event in new_events:
+                yield event
+            position += len(new_events)
+            if finished and not new_events:
+                return
+
+
+# Shared job queue, created on first use
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> DebateJobQueue:
+    """Return the shared DebateJobQueue."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = DebateJobQueue()
+    return _job_queue
+
+
+def __getattr__(name):
+    if name == "job_queue":
+        return get_job_queue()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
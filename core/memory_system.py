@@ -5,46 +5,183 @@ Stores debate history, scores, and learning data for both debaters and judges.
 
 import json
 import os
+import pickle
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from collections import defaultdict
 
+from core.calibration import JudgeCalibration
+from core.feedback_analyzer import feedback_analyzer
+from core.rubric_store import RubricStore
+from core.skill_rating import apply_result, build_leaderboard, recompute_skill_ratings
+from core.usage_meter import aggregate_usage
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks, so a single writer is not enforced
+    fcntl = None
+
+
+# Bump whenever _normalize_data or the stored layout changes so that stale
+# snapshots are discarded and rebuilt from the canonical JSON store.
+SNAPSHOT_SCHEMA_VERSION = 3
+SNAPSHOT_FORMAT = "debate-memory-snapshot"
+
+# Store used by get_debate_memory(); DEBATE_HISTORY_PATH points it elsewhere
+DEFAULT_STORAGE_PATH = "debate_history.json"
+
+
+class StoreInUseError(RuntimeError):
+    """Raised by claim_writer() when another process already writes the same store."""
+
 
 class DebateMemory:
     """Manages persistent storage of debate history and agent performance."""
 
     def __init__(self, storage_path: str = "debate_history.json"):
         self.storage_path = storage_path
+        # Pre-normalized binary copy of the JSON store for fast cold starts
+        self.snapshot_path = f"{storage_path}.snapshot"
         self.data = self._load_data()
+        # Bumped on every save so callers can key cached views on the store state
+        self.version = 0
+        # Held for every mutation; re-entrant so save helpers can nest
+        self._write_lock = threading.RLock()
+        # Open bulk() blocks; while any is open, saves only mark the store dirty
+        self._bulk_depth = 0
+        self._save_pending = False
+        # Per-criterion rubric scores live in a SQLite side store next to the JSON file
+        self.rubric_store = RubricStore(f"{os.path.splitext(storage_path)[0]}_rubric.db")
+        # Cross-judge calibration, fitted over history on first use
+        self._calibration = None
+        # Name -> ascending list of positions in data["debates"]; built on first query
+        self._debater_index = None
+        self._judge_index = None
+        # Open lock file while this process is the store's writer (see claim_writer)
+        self._writer_lock_file = None
+
+    def claim_writer(self):
+        """
+        Become the only process writing this store, for as long as it runs.
+
+        Saves rewrite the whole file from this process's memory, so a second
+        writing process would silently drop the other's debates, profiles and
+        skill ratings. The claim is an exclusive lock on `<store>.lock`,
+        released by the OS when the process exits.
+
+        Raises:
+            StoreInUseError: If another process holds the store
+        """
+        if fcntl is None or self._writer_lock_file is not None:
+            return
+        lock_file = open(f"{self.storage_path}.lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise StoreInUseError(
+                f"{self.storage_path} is already in use by another process; "
+                f"stop it or use a separate store (DEBATE_HISTORY_PATH / --storage)"
+            )
+        self._writer_lock_file = lock_file
 
     def _load_data(self) -> Dict:
-        """Load existing debate history from JSON file."""
+        """Load existing debate history, preferring a valid binary snapshot."""
         if os.path.exists(self.storage_path):
+            snapshot = self._load_snapshot()
+            if snapshot is not None:
+                return snapshot
             try:
                 with open(self.storage_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     # Normalize structure for compatibility across versions
                     self._normalize_data(data)
-                    return data
+                self._write_snapshot(data)
+                return data
             except (json.JSONDecodeError, IOError):
                 return self._initialize_empty_data()
         return self._initialize_empty_data()
 
+    def _source_fingerprint(self) -> Dict:
+        """Size and mtime of the canonical JSON store, used to detect stale snapshots."""
+        stat = os.stat(self.storage_path)
+        return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+    def _load_snapshot(self) -> Optional[Dict]:
+        """
+        Load the binary snapshot if it matches the schema version and the JSON store.
+
+        Returns None when the snapshot is missing, stale, or fails schema checks,
+        in which case the caller falls back to parsing and normalizing the JSON.
+        """
+        if not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                header, data = pickle.load(f)
+            if header.get("format") != SNAPSHOT_FORMAT:
+                return None
+            if header.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+                return None
+            fingerprint = self._source_fingerprint()
+            if any(header.get(k) != v for k, v in fingerprint.items()):
+                return None
+            if not self._snapshot_schema_valid(data):
+                return None
+            return data
+        except Exception:
+            return None
+
+    def _snapshot_schema_valid(self, data) -> bool:
+        """Check the top-level layout of snapshot data."""
+        if not isinstance(data, dict):
+            return False
+        return (isinstance(data.get("debates"), list)
+                and isinstance(data.get("debater_profiles"), dict)
+                and isinstance(data.get("judge_profiles"), dict)
+                and isinstance(data.get("skill_ratings"), dict))
+
+    def _write_snapshot(self, data: Dict):
+        """Write the normalized data as a pickle-protocol-5 snapshot next to the JSON store."""
+        try:
+            header = {"format": SNAPSHOT_FORMAT, "schema_version": SNAPSHOT_SCHEMA_VERSION}
+            header.update(self._source_fingerprint())
+            tmp_path = f"{self.snapshot_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((header, data), f, protocol=5)
+            # Atomic replace so a crash never leaves a half-written snapshot
+            os.replace(tmp_path, self.snapshot_path)
+        except (IOError, OSError, pickle.PickleError) as e:
+            print(f"Warning: could not write debate snapshot: {e}")
+
     def _initialize_empty_data(self) -> Dict:
         """Initialize empty data structure."""
         return {
             "debates": [],
             "debater_profiles": {},
-            "judge_profiles": {}
+            "judge_profiles": {},
+            "skill_ratings": {},
+            "rating_versions": {}
         }
 
     def _save_data(self):
-        """Save debate history to JSON file."""
-        try:
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Error saving debate history: {e}")
+        """Save debate history to JSON file (deferred to the end of an open bulk() block)."""
+        with self._write_lock:
+            self.version += 1
+            if self._bulk_depth:
+                self._save_pending = True
+                return
+            self._save_pending = False
+            try:
+                with open(self.storage_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.data, f, indent=2, ensure_ascii=False)
+            except IOError as e:
+                print(f"Error saving debate history: {e}")
+                return
+            self._write_snapshot(self.data)
 
     def _normalize_data(self, data: Dict):
         """Ensure rating distribution keys are strings '1'..'5' and present.
@@ -70,6 +207,13 @@ class DebateMemory:
                 sp.setdefault("for", [])
                 sp.setdefault("against", [])
                 prof["stance_performance"] = sp
+
+            # Re-judged ratings, keyed by debate ID (string keys for JSON stability)
+            data.setdefault("rating_versions", {})
+
+            # Skill ratings (added later): rebuild from history when missing
+            if not isinstance(data.get("skill_ratings"), dict):
+                data["skill_ratings"] = recompute_skill_ratings(data.get("debates", []))
         except Exception as e:
             print(f"Warning: normalization error: {e}")
 
@@ -77,7 +221,8 @@ class DebateMemory:
                    debater1_stance: str, debater2_stance: str, judge_name: str,
                    debate_transcript: Dict, verdict: str, 
                    debater1_rating: int, debater2_rating: int,
-                   debater1_feedback: str, debater2_feedback: str):
+                   debater1_feedback: str, debater2_feedback: str,
+                   rubric: Optional[Dict] = None, usage: Optional[Dict] = None):
         """
         Save a complete debate record with ratings and feedback.
         
@@ -94,41 +239,181 @@ class DebateMemory:
             debater2_rating: Rating for debater 2 (1-5)
             debater1_feedback: Detailed feedback for debater 1
             debater2_feedback: Detailed feedback for debater 2
+            rubric: Optional per-criterion details from generate_detailed_ratings
+                (return_details=True), stored in the rubric side store
+            usage: Optional LLM token usage (UsageMeter.summary()), stored with the record
+        
+        Returns:
+            ID of the saved debate
         """
-        debate_record = {
-            "id": len(self.data["debates"]) + 1,
-            "timestamp": datetime.now().isoformat(),
-            "topic": topic,
-            "participants": {
-                "debater1": {
-                    "name": debater1_name,
-                    "stance": debater1_stance,
-                    "rating": debater1_rating,
-                    "feedback": debater1_feedback
+        # Serialized: background debate jobs may finish at the same time
+        with self._write_lock:
+            debate_record = {
+                "id": len(self.data["debates"]) + 1,
+                "timestamp": datetime.now().isoformat(),
+                "topic": topic,
+                "participants": {
+                    "debater1": {
+                        "name": debater1_name,
+                        "stance": debater1_stance,
+                        "rating": debater1_rating,
+                        "feedback": debater1_feedback
+                    },
+                    "debater2": {
+                        "name": debater2_name,
+                        "stance": debater2_stance,
+                        "rating": debater2_rating,
+                        "feedback": debater2_feedback
+                    }
                 },
-                "debater2": {
-                    "name": debater2_name,
-                    "stance": debater2_stance,
-                    "rating": debater2_rating,
-                    "feedback": debater2_feedback
-                }
-            },
-            "judge": judge_name,
-            "transcript": debate_transcript,
-            "verdict": verdict
-        }
+                "judge": judge_name,
+                "transcript": debate_transcript,
+                "verdict": verdict
+            }
+            if usage:
+                debate_record["usage"] = usage
 
-        self.data["debates"].append(debate_record)
+            self.data["debates"].append(debate_record)
+            if self._debater_index is not None:
+                self._index_debate(len(self.data["debates"]) - 1, debate_record,
+                                   self._debater_index, self._judge_index)
+        
+            # Update debater profiles
+            self._update_debater_profile(debater1_name, debater1_rating, debater1_feedback, topic, debater1_stance)
+            self._update_debater_profile(debater2_name, debater2_rating, debater2_feedback, topic, debater2_stance)
+        
+            # Update judge profile
+            self._update_judge_profile(judge_name, topic, verdict, debater1_rating, debater2_rating)
         
-        # Update debater profiles
-        self._update_debater_profile(debater1_name, debater1_rating, debater1_feedback, topic, debater1_stance)
-        self._update_debater_profile(debater2_name, debater2_rating, debater2_feedback, topic, debater2_stance)
+            # Update opponent-aware skill ratings
+            apply_result(self.data.setdefault("skill_ratings", {}), debate_record)
         
-        # Update judge profile
-        self._update_judge_profile(judge_name, topic, verdict, debater1_rating, debater2_rating)
+            # Keep judge calibration current without refitting
+            if self._calibration is not None:
+                self._calibration.update(judge_name, [debater1_rating, debater2_rating])
         
+            self._save_data()
+        
+            if rubric:
+                self._record_rubric(debate_record, rubric)
+            return debate_record["id"]
+
+    def _record_rubric(self, debate_record: Dict, rubric: Dict):
+        """Write per-criterion scores for a saved debate to the rubric store.
+
+        Skipped when the judge scored nothing (legacy or unparseable ratings),
+        so empty rows never inflate the breakdown's debate counts.
+        """
+        scored = any(
+            (rubric.get(slot) or {}).get("overall") is not None
+            or any(value is not None for value in ((rubric.get(slot) or {}).get("criteria") or {}).values())
+            for slot in ("debater1", "debater2")
+        )
+        if not scored:
+            return
+        participants = []
+        for slot in ("debater1", "debater2"):
+            scores = rubric.get(slot) or {}
+            participant = debate_record["participants"][slot]
+            participants.append({
+                "name": participant["name"],
+                "stance": participant["stance"],
+                "overall": scores.get("overall") or participant["rating"],
+                "criteria": scores.get("criteria") or {},
+            })
+        try:
+            self.rubric_store.record_debate(
+                debate_id=debate_record["id"],
+                judge=debate_record["judge"],
+                topic=debate_record["topic"],
+                timestamp=debate_record["timestamp"],
+                participants=participants,
+                differentiation_reason=rubric.get("differentiation_reason", ""),
+            )
+        except Exception as e:
+            print(f"Error saving rubric scores: {e}")
+
+    def add_rating_version(self, debate_id: int, version: Dict, save: bool = True):
+        """
+        Store an additional rating of a past debate without touching the original.
+
+        Args:
+            debate_id: ID of the re-judged debate
+            version: Rating record (judge, job_id, rubric_version, per-debater ratings, ...)
+            save: Persist immediately; batch writers pass False and call flush()
+        """
+        with self._write_lock:
+            self.data.setdefault("rating_versions", {}).setdefault(str(debate_id), []).append(version)
+            if save:
+                self._save_data()
+
+    def flush(self):
+        """Write the store (JSON and snapshot) now, e.g. after unsaved batch updates."""
         self._save_data()
 
+    @contextmanager
+    def bulk(self) -> Iterator["DebateMemory"]:
+        """
+        Batch many writes (imports, generated data) into a single save.
+
+        Every save inside the block, from any thread, only bumps version; the
+        store is written once when the outermost block exits. A crash inside
+        the block loses its unsaved changes.
+        """
+        with self._write_lock:
+            self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            with self._write_lock:
+                self._bulk_depth -= 1
+                if not self._bulk_depth and self._save_pending:
+                    self._save_data()
+
+    def get_rating_versions(self, debate_id: int) -> List[Dict]:
+        """All re-judged rating versions of a debate, oldest first."""
+        return self.data.get("rating_versions", {}).get(str(debate_id), [])
+
+    def get_rubric_breakdown(self, debater: Optional[str] = None, judge: Optional[str] = None,
+                             group_by: Optional[str] = None) -> Dict[str, Dict]:
+        """Average per-criterion scores, e.g. a debater's breakdown grouped by stance."""
+        return self.rubric_store.aggregate(group_by=group_by, debater=debater, judge=judge)
+
+    def save_aborted_usage(self, topic: str, debater1_name: str, debater2_name: str,
+                           judge_name: str, usage: Dict):
+        """
+        Keep the LLM usage of a debate that stopped before it could be saved
+        (e.g. over its token budget). Profiles and ratings are not touched.
+        """
+        with self._write_lock:
+            self.data.setdefault("aborted_usage", []).append({
+                "timestamp": datetime.now().isoformat(),
+                "topic": topic,
+                "participants": {"debater1": {"name": debater1_name}, "debater2": {"name": debater2_name}},
+                "judge": judge_name,
+                "usage": usage,
+            })
+            self._save_data()
+
+    def get_usage_breakdown(self, group_by: str = "round", debater: Optional[str] = None,
+                            judge: Optional[str] = None, include_aborted: bool = True) -> Dict[str, Dict]:
+        """LLM token and cost totals over stored (and aborted) debates, grouped by "round", "agent" or "role"."""
+        if debater is not None:
+            debates = self.get_debates_by_debater(debater)
+        elif judge is not None:
+            debates = self.get_debates_by_judge(judge)
+        else:
+            debates = self.data["debates"]
+        if include_aborted:
+            aborted = [
+                record for record in self.data.get("aborted_usage", [])
+                if (debater is None or debater in (record["participants"]["debater1"]["name"],
+                                                   record["participants"]["debater2"]["name"]))
+                and (judge is None or record["judge"] == judge)
+            ]
+            debates = list(debates) + aborted
+        return aggregate_usage(debates, group_by)
+
     def _update_debater_profile(self, name: str, rating: int, feedback: str, topic: str, stance: str):
         """Update a debater's performance profile."""
         if name not in self.data["debater_profiles"]:
@@ -168,26 +453,62 @@ class DebateMemory:
 
     def _analyze_feedback(self, profile: Dict, feedback: str, rating: int):
         """Analyze feedback to identify strengths and weaknesses."""
-        # Simple keyword-based analysis (can be enhanced with NLP)
-        positive_keywords = ["strong", "excellent", "compelling", "persuasive", "effective", "well-structured", "logical", "convincing"]
-        negative_keywords = ["weak", "lacking", "insufficient", "unclear", "unconvincing", "poor", "flawed", "missing"]
-        
-        feedback_lower = feedback.lower()
+        found = feedback_analyzer.analyze(feedback)
         
         if rating >= 4:
-            for keyword in positive_keywords:
-                if keyword in feedback_lower and keyword not in profile["strengths"]:
+            for keyword in found["positive"]:
+                if keyword not in profile["strengths"]:
                     profile["strengths"].append(keyword)
                     if len(profile["strengths"]) > 10:  # Keep top 10
                         profile["strengths"].pop(0)
         
         if rating <= 2:
-            for keyword in negative_keywords:
-                if keyword in feedback_lower and keyword not in profile["weaknesses"]:
+            for keyword in found["negative"]:
+                if keyword not in profile["weaknesses"]:
                     profile["weaknesses"].append(keyword)
                     if len(profile["weaknesses"]) > 10:  # Keep top 10
                         profile["weaknesses"].pop(0)
 
+    def reanalyze_feedback(self, analyzer=None, top_n: int = 10):
+        """
+        Re-derive every debater's strengths and weaknesses from all stored feedback.
+
+        Streams once over the debate history, accumulating weighted keyword scores
+        per debater (positive terms from ratings >= 4, negative terms from ratings
+        <= 2, matching the incremental rules), then keeps the top_n of each.
+
+        Args:
+            analyzer: FeedbackAnalyzer to use (defaults to the shared analyzer),
+                e.g. one built with a custom lexicon
+            top_n: Number of strengths/weaknesses to keep per debater
+        """
+        analyzer = analyzer or feedback_analyzer
+        strengths = defaultdict(lambda: defaultdict(float))
+        weaknesses = defaultdict(lambda: defaultdict(float))
+
+        for debate in self.data["debates"]:
+            for slot in ("debater1", "debater2"):
+                participant = debate["participants"][slot]
+                rating = participant["rating"]
+                if 2 < rating < 4:
+                    continue
+                found = analyzer.analyze(participant.get("feedback", ""))
+                if rating >= 4:
+                    for keyword, score in found["positive"].items():
+                        strengths[participant["name"]][keyword] += score
+                else:
+                    for keyword, score in found["negative"].items():
+                        weaknesses[participant["name"]][keyword] += score
+
+        def top(scores):
+            return [k for k, _ in sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_n]]
+
+        for name, profile in self.data["debater_profiles"].items():
+            profile["strengths"] = top(strengths.get(name, {}))
+            profile["weaknesses"] = top(weaknesses.get(name, {}))
+
+        self._save_data()
+
     def _update_judge_profile(self, name: str, topic: str, verdict: str, 
                              rating1: int, rating2: int):
         """Update a judge's evaluation profile."""
@@ -256,6 +577,34 @@ class DebateMemory:
         """Retrieve a judge's complete profile."""
         return self.data["judge_profiles"].get(name)
 
+    def get_skill_rating(self, name: str) -> Optional[Dict]:
+        """Retrieve a debater's Elo skill entry."""
+        return self.data.get("skill_ratings", {}).get(name)
+
+    @property
+    def calibration(self) -> JudgeCalibration:
+        """Per-judge bias/scale model over all stored ratings."""
+        if self._calibration is None:
+            self._calibration = JudgeCalibration().fit(self.data["debates"])
+        return self._calibration
+
+    def get_calibrated_rating(self, judge_name: str, rating: float) -> float:
+        """A judge's raw rating mapped onto the scale shared by all judges."""
+        return self.calibration.calibrate(judge_name, rating)
+
+    def get_leaderboard(self) -> List[Dict]:
+        """Debaters ranked by Elo skill rating, highest first, with calibrated averages."""
+        leaderboard = build_leaderboard(self.data.get("skill_ratings", {}))
+        calibrated = self.calibration.debater_averages(self.data["debates"])
+        for entry in leaderboard:
+            entry["calibrated_average"] = calibrated.get(entry["name"])
+        return leaderboard
+
+    def recompute_skill_ratings(self):
+        """Rebuild all skill ratings from the stored debate history and save."""
+        self.data["skill_ratings"] = recompute_skill_ratings(self.data["debates"])
+        self._save_data()
+
     def get_debater_learning_context(self, name: str) -> str:
         """
         Generate a learning context string for a debater based on past performance.
@@ -270,6 +619,11 @@ class DebateMemory:
         # Overall performance
         context_parts.append(f"You have participated in {profile['total_debates']} debates with an average rating of {profile['average_rating']:.2f}/5.")
         
+        # Same average with each judge's strictness factored out
+        calibrated = self.calibration.debater_averages(self.get_debates_by_debater(name)).get(name)
+        if calibrated is not None and abs(calibrated - profile["average_rating"]) >= 0.1:
+            context_parts.append(f"Adjusted for how strict your judges were, your average is {calibrated:.2f}/5.")
+        
         # Recent performance trend
         if len(profile["rating_history"]) >= 3:
             recent_ratings = [r["rating"] for r in profile["rating_history"][-3:]]
@@ -322,6 +676,12 @@ class DebateMemory:
         dominant_pattern = max(patterns, key=patterns.get)
         context_parts.append(f"Your judging style tends to be {dominant_pattern}.")
         
+        # Bias relative to the other judges
+        bias = self.calibration.judge_bias(name)
+        if abs(bias) >= 0.2:
+            direction = "above" if bias > 0 else "below"
+            context_parts.append(f"Your ratings run {abs(bias):.2f} points {direction} the average of all judges.")
+        
         # Rating distribution
         context_parts.append("Your rating distribution:")
         rd = profile["rating_distribution"]
@@ -350,20 +710,112 @@ class DebateMemory:
         """Retrieve all debate records."""
         return self.data["debates"]
 
+    def get_debate(self, debate_id: int) -> Optional[Dict]:
+        """Retrieve one debate record by ID."""
+        debates = self.data["debates"]
+        # IDs are assigned sequentially, so the record is normally at id - 1
+        if 0 < debate_id <= len(debates) and debates[debate_id - 1].get("id") == debate_id:
+            return debates[debate_id - 1]
+        return next((d for d in debates if d.get("id") == debate_id), None)
+
     def get_debates_by_debater(self, debater_name: str) -> List[Dict]:
         """Get all debates involving a specific debater."""
-        return [
-            debate for debate in self.data["debates"]
-            if debate["participants"]["debater1"]["name"] == debater_name
-            or debate["participants"]["debater2"]["name"] == debater_name
-        ]
+        self._ensure_indexes()
+        debates = self.data["debates"]
+        return [debates[pos] for pos in self._debater_index.get(debater_name, [])]
 
     def get_debates_by_judge(self, judge_name: str) -> List[Dict]:
         """Get all debates judged by a specific judge."""
-        return [
-            debate for debate in self.data["debates"]
-            if debate["judge"] == judge_name
-        ]
+        self._ensure_indexes()
+        debates = self.data["debates"]
+        return [debates[pos] for pos in self._judge_index.get(judge_name, [])]
+
+    def _ensure_indexes(self):
+        """Build the debater/judge position indexes if they don't exist yet."""
+        if self._debater_index is not None:
+            return
+        # Under the write lock so no save_debate indexes a debate meanwhile;
+        # built in locals so readers never see a half-filled index
+        with self._write_lock:
+            if self._debater_index is not None:
+                return
+            debater_index = defaultdict(list)
+            judge_index = defaultdict(list)
+            for position, debate in enumerate(self.data["debates"]):
+                self._index_debate(position, debate, debater_index, judge_index)
+            # Readers check the debater index, so it is published last
+            self._judge_index, self._debater_index = judge_index, debater_index
+
+    def _index_debate(self, position: int, debate: Dict, debater_index: Dict, judge_index: Dict):
+        """Record a debate's position under both debaters and its judge."""
+        names = {debate["participants"]["debater1"]["name"], debate["participants"]["debater2"]["name"]}
+        for name in names:
+            debater_index[name].append(position)
+        judge_index[debate["judge"]].append(position)
+
+    def get_debater_names(self) -> List[str]:
+        """Sorted names of every debater that appears in the history."""
+        self._ensure_indexes()
+        return sorted(self._debater_index)
+
+    def get_judge_names(self) -> List[str]:
+        """Sorted names of every judge that appears in the history."""
+        self._ensure_indexes()
+        return sorted(self._judge_index)
+
+    def query_debates(self, cursor: Optional[int] = None, limit: int = 20,
+                      debater: Optional[str] = None, judge: Optional[str] = None,
+                      topic: Optional[str] = None, newest_first: bool = True) -> Dict:
+        """
+        Fetch one page of debates in chronological or reverse-chronological order.
+
+        Args:
+            cursor: Opaque cursor from a previous page's "next_cursor" (None for the first page)
+            limit: Maximum number of debates to return
+            debater: Only debates in which this debater took part
+            judge: Only debates judged by this judge
+            topic: Case-insensitive substring the topic must contain
+            newest_first: Sort newest to oldest (default) or oldest to newest
+
+        Returns:
+            Dict with "debates" (the page), "next_cursor" (None on the last page)
+            and "total" (number of debates matching the filters)
+        """
+        self._ensure_indexes()
+        debates = self.data["debates"]
+
+        # Candidate positions, ascending, narrowed by the indexed filters
+        if debater is not None and judge is not None:
+            judged = set(self._judge_index.get(judge, []))
+            positions = [p for p in self._debater_index.get(debater, []) if p in judged]
+        elif debater is not None:
+            positions = self._debater_index.get(debater, [])
+        elif judge is not None:
+            positions = self._judge_index.get(judge, [])
+        else:
+            positions = range(len(debates))
+
+        if topic:
+            needle = topic.lower()
+            positions = [p for p in positions if needle in debates[p]["topic"].lower()]
+
+        # The cursor is the position of the next debate to return
+        if newest_first:
+            end = len(positions) if cursor is None else bisect_left(positions, cursor + 1)
+            start = max(0, end - limit)
+            page_positions = list(reversed(positions[start:end]))
+            next_cursor = positions[start - 1] if start > 0 else None
+        else:
+            start = 0 if cursor is None else bisect_left(positions, cursor)
+            end = min(len(positions), start + limit)
+            page_positions = list(positions[start:end])
+            next_cursor = positions[end] if end < len(positions) else None
+
+        return {
+            "debates": [debates[p] for p in page_positions],
+            "next_cursor": next_cursor,
+            "total": len(positions),
+        }
 
     def get_statistics(self) -> Dict:
         """Get overall system statistics."""
@@ -389,5 +841,34 @@ class DebateMemory:
         return total_ratings / count if count > 0 else 0.0
 
 
-# Global memory instance
-debate_memory = DebateMemory()
+# Shared memory instance, created on first use so importing this module stays cheap
+_debate_memory = None
+_debate_memory_lock = threading.Lock()
+
+
+def get_debate_memory() -> DebateMemory:
+    """
+    Return the shared DebateMemory, loading the store on first access.
+
+    The store is DEBATE_HISTORY_PATH (default debate_history.json), claimed
+    as this process's to write.
+
+    Raises:
+        StoreInUseError: If another process already writes that store
+    """
+    global _debate_memory
+    if _debate_memory is None:
+        with _debate_memory_lock:
+            if _debate_memory is None:
+                memory = DebateMemory(os.getenv("DEBATE_HISTORY_PATH") or DEFAULT_STORAGE_PATH)
+                memory.claim_writer()
+                _debate_memory = memory
+    return _debate_memory
+
+
+def __getattr__(name):
+    # Keeps `from core.memory_system import debate_memory` working without
+    # reading the history file at import time.
+    if name == "debate_memory":
+        return get_debate_memory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,196 @@
+"""
+MP3 Frame Utilities
+Parses and builds MPEG audio Layer III frames without an encoder: silent
+frames for the offline stub TTS backend and for pauses, frame iteration for
+joining files without re-encoding, and ID3v2 chapter tags.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Layer III bitrate tables (kbps) indexed by the header's 4-bit bitrate field
+# (MPEG 2.5 shares the MPEG-2 tables and is keyed as 2.5 throughout)
+BITRATES_KBPS = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    2.5: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+SAMPLE_RATES = {
+    1: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    2.5: [11025, 12000, 8000],
+}
+# Version bits in the frame header
+VERSION_BITS = {1: 0b11, 2: 0b10, 2.5: 0b00}
+VERSIONS_BY_BITS = {bits: version for version, bits in VERSION_BITS.items()}
+SAMPLES_PER_FRAME = {1: 1152, 2: 576, 2.5: 576}
+
+# gTTS output format: MPEG-2 Layer III, 24 kHz, 32 kbps, mono
+DEFAULT_FORMAT = {"version": 2, "sample_rate": 24000, "bitrate_kbps": 32}
+
+
+def frame_length(version: int, sample_rate: int, bitrate_kbps: int, padding: int = 0) -> int:
+    """Size in bytes of one Layer III frame."""
+    coefficient = 144 if version == 1 else 72
+    return coefficient * bitrate_kbps * 1000 // sample_rate + padding
+
+
+def frame_duration(version: int, sample_rate: int) -> float:
+    """Playback duration of one frame in seconds."""
+    return SAMPLES_PER_FRAME[version] / sample_rate
+
+
+def silent_frame(version: int = 2, sample_rate: int = 24000, bitrate_kbps: int = 32) -> bytes:
+    """One mono Layer III frame that decodes to silence."""
+    bitrate_index = BITRATES_KBPS[version].index(bitrate_kbps)
+    rate_index = SAMPLE_RATES[version].index(sample_rate)
+    header = (
+        (0x7FF << 21)                       # frame sync
+        | (VERSION_BITS[version] << 19)
+        | (0b01 << 17)                      # Layer III
+        | (1 << 16)                         # no CRC
+        | (bitrate_index << 12)
+        | (rate_index << 10)
+        | (0b11 << 6)                       # mono
+    )
+    length = frame_length(version, sample_rate, bitrate_kbps)
+    return header.to_bytes(4, "big") + bytes(length - 4)
+
+
+def silence(seconds: float, audio_format: Dict = None) -> bytes:
+    """Enough silent frames to cover `seconds` of playback (at least one frame)."""
+    fmt = dict(DEFAULT_FORMAT, **(audio_format or {}))
+    frame = silent_frame(fmt["version"], fmt["sample_rate"], fmt["bitrate_kbps"])
+    count = max(1, round(seconds / frame_duration(fmt["version"], fmt["sample_rate"])))
+    return frame * count
+
+
+# ------------------------------------------------------------
+# Parsing
+# ------------------------------------------------------------
+def parse_frame_header(data: bytes, offset: int = 0) -> Optional[Dict]:
+    """Decode a Layer III frame header at `offset`, or None if there is none."""
+    if offset + 4 > len(data):
+        return None
+    header = int.from_bytes(data[offset:offset + 4], "big")
+    if (header >> 21) & 0x7FF != 0x7FF or (header >> 17) & 0b11 != 0b01:
+        return None
+    version = VERSIONS_BY_BITS.get((header >> 19) & 0b11)
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0b11
+    if version is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    sample_rate = SAMPLE_RATES[version][rate_index]
+    bitrate_kbps = BITRATES_KBPS[version][bitrate_index]
+    return {
+        "version": version,
+        "sample_rate": sample_rate,
+        "bitrate_kbps": bitrate_kbps,
+        "length": frame_length(version, sample_rate, bitrate_kbps, (header >> 9) & 1),
+        "duration": frame_duration(version, sample_rate),
+        "mono": (header >> 6) & 0b11 == 0b11,
+    }
+
+
+def id3v2_size(data: bytes) -> int:
+    """Length of a leading ID3v2 tag (0 if the data does not start with one)."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_info_frame(data: bytes, offset: int, frame: Dict) -> bool:
+    """Xing/Info/VBRI frames describe the whole file, so they are dropped when joining."""
+    body = data[offset + 4:offset + min(frame["length"], 64)]
+    return b"Xing" in body or b"Info" in body or b"VBRI" in body
+
+
+def iter_frames(data: bytes) -> Iterator[Tuple[int, Dict]]:
+    """
+    Yield (offset, header) for each audio frame, skipping ID3 tags, info
+    frames and any junk between frames.
+    """
+    end = len(data)
+    if end >= 128 and data[-128:-125] == b"TAG":
+        end -= 128
+    offset = id3v2_size(data)
+    first = True
+    while offset + 4 <= end:
+        frame = parse_frame_header(data, offset)
+        if frame is None or offset + frame["length"] > end:
+            # Resynchronise on the next frame sync
+            offset = data.find(b"\xff", offset + 1, end)
+            if offset < 0:
+                break
+            continue
+        # Only the first frame of a file can be an info frame
+        if not (first and _is_info_frame(data, offset, frame)):
+            yield offset, frame
+        first = False
+        offset += frame["length"]
+
+
+def audio_frames(data: bytes) -> Tuple[bytes, float, Optional[Dict]]:
+    """Raw frame bytes of an MP3 file without tags, its duration, and the first frame's format."""
+    parts = []
+    duration = 0.0
+    first = None
+    for offset, frame in iter_frames(data):
+        parts.append(data[offset:offset + frame["length"]])
+        duration += frame["duration"]
+        first = first or frame
+    return b"".join(parts), duration, first
+
+
+# ------------------------------------------------------------
+# ID3v2.3 chapter tags
+# ------------------------------------------------------------
+def _syncsafe(value: int) -> bytes:
+    return bytes(((value >> 21) & 0x7F, (value >> 14) & 0x7F, (value >> 7) & 0x7F, value & 0x7F))
+
+
+def _id3_frame(frame_id: str, body: bytes) -> bytes:
+    # ID3v2.3 frame sizes are plain 32-bit integers (not syncsafe)
+    return frame_id.encode("ascii") + len(body).to_bytes(4, "big") + b"\x00\x00" + body
+
+
+def _text_frame(frame_id: str, text: str) -> bytes:
+    # Encoding 0x01: UTF-16 with BOM, null terminated
+    return _id3_frame(frame_id, b"\x01" + text.encode("utf-16") + b"\x00\x00")
+
+
+def chapter_tag(chapters: List[Tuple[str, float, float]], title: str = "") -> bytes:
+    """
+    Build an ID3v2.3 tag with a table of contents (CTOC) and one CHAP frame per chapter.
+
+    Args:
+        chapters: (chapter title, start seconds, end seconds) in playback order
+        title: Title for the whole file (TIT2)
+    """
+    frames = []
+    if title:
+        frames.append(_text_frame("TIT2", title))
+
+    element_ids = [f"chp{i}".encode("ascii") for i in range(len(chapters))]
+    toc = (
+        b"toc\x00"
+        + b"\x03"                          # top-level, ordered
+        + len(chapters).to_bytes(1, "big")
+        + b"".join(eid + b"\x00" for eid in element_ids)
+    )
+    frames.append(_id3_frame("CTOC", toc))
+
+    for eid, (chapter_title, start, end) in zip(element_ids, chapters):
+        body = (
+            eid + b"\x00"
+            + int(start * 1000).to_bytes(4, "big")
+            + int(end * 1000).to_bytes(4, "big")
+            + b"\xff\xff\xff\xff" * 2         # byte offsets unused
+            + _text_frame("TIT2", chapter_title)
+        )
+        frames.append(_id3_frame("CHAP", body))
+
+    payload = b"".join(frames)
+    return b"ID3\x03\x00\x00" + _syncsafe(len(payload)) + payload
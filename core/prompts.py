@@ -0,0 +1,263 @@
+"""
+Prompt Template Registry
+Central, versioned prompt templates for debaters and judges. Every template is
+laid out static-first: the long fixed instructions form an identical prefix
+across calls so provider-side prompt caching can hit, and the per-debate parts
+(names, topic, transcript) are appended last.
+"""
+
+import hashlib
+import threading
+from string import Template
+from textwrap import dedent
+from typing import Dict, Optional
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+RUBRIC_TEXT = dedent(
+    """Use this RUBRIC for each debater (score each 1–5, integers only):
+    - Clarity: Was the argument easy to follow and structured?
+    - Evidence: Did they use relevant facts/examples/support?
+    - Logic: Was reasoning valid and internally consistent?
+    - Rhetoric: Was style persuasive & engaging (aligned with their persona)?
+    - Responsiveness: Did they address opponent's points directly?
+
+    Overall Score Guidance (1–5):
+      1 = Poor: Multiple major flaws; reasoning unclear or incorrect
+      2 = Below Average: Some structure but weak support / notable logical gaps
+      3 = Average: Competent; mix of strengths & weaknesses; acceptable coherence
+      4 = Good: Solid reasoning & support; minor issues only
+      5 = Excellent: Compelling, precise, well-supported, strategically strong
+
+    Avoid giving both debaters the same overall score unless their criteria subtotals are genuinely close. If you give same overall, explain precise parity in 'differentiation_reason'.
+    """
+)
+
+
+class PromptTemplate:
+    """A versioned prompt: fixed instructions followed by a pre-compiled dynamic part."""
+
+    def __init__(self, name: str, version: int, static: str, dynamic: str):
+        self.name = name
+        self.version = version
+        self.static = dedent(static).strip()
+        self.dynamic = Template(dedent(dynamic).strip())
+        # Identifies the cacheable prefix; changes only when the static text changes
+        self.prefix_hash = hashlib.sha256(self.static.encode("utf-8")).hexdigest()
+        self.static_tokens = estimate_tokens(self.static)
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@v{self.version}"
+
+    def render(self, **values) -> str:
+        """Fill in the per-call values; raises KeyError if one is missing."""
+        return f"{self.static}\n\n{self.dynamic.substitute(values)}"
+
+    def cache_key(self, **values) -> str:
+        """Hash of the fully rendered prompt, for response caching and dedup."""
+        return hashlib.sha256(self.render(**values).encode("utf-8")).hexdigest()
+
+
+class PromptRegistry:
+    """Holds templates by name and tracks how many prompt tokens each one adds."""
+
+    def __init__(self):
+        self.templates: Dict[str, PromptTemplate] = {}
+        self._usage: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, template: PromptTemplate) -> PromptTemplate:
+        self.templates[template.name] = template
+        self._usage[template.key] = {"renders": 0, "static_tokens": 0, "dynamic_tokens": 0}
+        return template
+
+    def get(self, name: str) -> PromptTemplate:
+        return self.templates[name]
+
+    def render(self, template_name: str, **values) -> str:
+        """Render a template and record its static and dynamic token counts."""
+        template = self.templates[template_name]
+        prompt = template.render(**values)
+        dynamic_tokens = estimate_tokens(prompt) - template.static_tokens
+        with self._lock:
+            usage = self._usage[template.key]
+            usage["renders"] += 1
+            usage["static_tokens"] += template.static_tokens
+            usage["dynamic_tokens"] += max(0, dynamic_tokens)
+        return prompt
+
+    def stats(self, name: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Token accounting per template version.
+
+        Returns:
+            {"name@vN": {"renders", "static_tokens", "dynamic_tokens",
+                         "prefix_tokens", "prefix_hash"}}
+        """
+        with self._lock:
+            result = {}
+            for template in self.templates.values():
+                if name and template.name != name:
+                    continue
+                entry = dict(self._usage[template.key])
+                entry["prefix_tokens"] = template.static_tokens
+                entry["prefix_hash"] = template.prefix_hash[:16]
+                result[template.key] = entry
+            return result
+
+
+prompt_registry = PromptRegistry()
+
+# ------------------------------------------------------------
+# Debater rounds
+# ------------------------------------------------------------
+prompt_registry.register(PromptTemplate(
+    "debate.opening", 1,
+    static="""
+    DEBATE ROUND: OPENING STATEMENT
+    Present your opening statement in 6-8 sentences. Establish your core reasoning,
+    state your stance clearly, and focus on reasoning and clarity.
+    """,
+    dynamic="""
+    You are $debater_name, arguing $stance the motion: "$topic".
+    """,
+))
+
+prompt_registry.register(PromptTemplate(
+    "debate.rebuttal", 1,
+    static="""
+    DEBATE ROUND: REBUTTAL
+    Write your rebuttal in 5-6 sentences, addressing your opponent's key points directly.
+    """,
+    dynamic="""
+    You are $debater_name, arguing $stance the motion: "$topic".
+    Your opponent said:
+
+    $opponent_argument
+    """,
+))
+
+prompt_registry.register(PromptTemplate(
+    "debate.closing", 1,
+    static="""
+    DEBATE ROUND: CLOSING STATEMENT
+    Summarize your side in 5-7 sentences. Base your reasoning on all previous exchanges.
+    """,
+    dynamic="""
+    You are $debater_name, arguing $stance the motion: "$topic".
+    Debate so far:
+
+    $transcript
+    """,
+))
+
+# ------------------------------------------------------------
+# Judge prompts
+# ------------------------------------------------------------
+prompt_registry.register(PromptTemplate(
+    "judge.verdict", 1,
+    static="""
+    VERDICT
+    Analyze both sides of the debate transcript below, decide the winner objectively,
+    and explain why in 2-3 paragraphs.
+
+    IMPORTANT: End your verdict with a clear winner declaration on a new line in this exact format:
+    "Winner: [Debater Name]"
+    """,
+    dynamic="""
+    You are $judge_name, a judge known for your $judging_style.
+    Focus on $focus.
+
+    Debate Transcript:
+    $transcript
+    """,
+))
+
+prompt_registry.register(PromptTemplate(
+    "judge.rating", 1,
+    static=RUBRIC_TEXT + dedent("""
+    TASK: Evaluate each debater rigorously. First assign per-criterion scores, then derive the overall (not an average—holistic judgment). Provide targeted strengths and improvements separately.
+
+    OUTPUT FORMAT (valid JSON ONLY, no commentary outside JSON):
+    {
+      "debater1": {
+        "overall": <int 1-5>,
+        "criteria": {
+          "clarity": <int>,
+          "evidence": <int>,
+          "logic": <int>,
+          "rhetoric": <int>,
+          "responsiveness": <int>
+        },
+        "feedback_strengths": "<comma-separated or sentences>",
+        "feedback_improvements": "<comma-separated or sentences>",
+        "justification": "<2-3 sentences giving a holistic justification>"
+      },
+      "debater2": {
+        "overall": <int 1-5>,
+        "criteria": {
+          "clarity": <int>,
+          "evidence": <int>,
+          "logic": <int>,
+          "rhetoric": <int>,
+          "responsiveness": <int>
+        },
+        "feedback_strengths": "<comma-separated or sentences>",
+        "feedback_improvements": "<comma-separated or sentences>",
+        "justification": "<2-3 sentences giving a holistic justification>"
+      },
+      "differentiation_reason": "<Explain why scores differ OR why they are identical>"
+    }
+
+    RULES:
+    - Must be valid JSON.
+    - Use integers only for scores.
+    - Use full scale when justified; do not default both to 4.
+    - Avoid markdown.
+    """),
+    dynamic="""
+    You are $judge_name, a debate judge focusing on: $focus.
+
+    Debate Topic: "$topic"
+    Debater 1: $debater1_name (stance: $debater1_stance)
+    Debater 2: $debater2_name (stance: $debater2_stance)
+
+    Transcript:
+    $transcript
+    """,
+))
+
+prompt_registry.register(PromptTemplate(
+    "judge.rating_repair", 1,
+    static=RUBRIC_TEXT + dedent("""
+    You already evaluated the debate below, but your JSON was missing some fields.
+    Provide ONLY the missing fields listed at the end, as a JSON object using the same
+    nesting as your evaluation (e.g. {"debater1": {"overall": 4}}).
+    Use integers 1-5 for scores. Valid JSON only, no markdown.
+    """),
+    dynamic="""
+    You are $judge_name, a debate judge focusing on: $focus.
+
+    Debate Topic: "$topic"
+    Debater 1: $debater1_name (stance: $debater1_stance)
+    Debater 2: $debater2_name (stance: $debater2_stance)
+
+    Transcript:
+    $transcript
+
+    Your evaluation so far:
+    $partial_evaluation
+
+    Missing fields: $missing_fields
+    """,
+))
+
+
+def render_prompt(template_name: str, **values) -> str:
+    """Render a registered template, recording its token usage."""
+    return prompt_registry.render(template_name, **values)
@@ -5,32 +5,23 @@ Enhancements:
  - Explicit multi-criteria rubric (clarity, evidence, logic, rhetoric, responsiveness).
  - Differentiation requirement to discourage identical overall scores without justification.
  - Robust parser that first attempts JSON parsing, then falls back to legacy pattern parsing.
+ - Tolerant JSON extraction (markdown fences, trailing commas, truncated output) with
+   schema validation and a targeted follow-up call for fields that are still missing.
 """
 
-from crewai import Task, Crew, Process
-from textwrap import dedent
 import json
 import re
-from typing import Tuple
-
-RUBRIC_TEXT = dedent(
-    """Use this RUBRIC for each debater (score each 1–5, integers only):
-    - Clarity: Was the argument easy to follow and structured?
-    - Evidence: Did they use relevant facts/examples/support?
-    - Logic: Was reasoning valid and internally consistent?
-    - Rhetoric: Was style persuasive & engaging (aligned with their persona)?
-    - Responsiveness: Did they address opponent's points directly?
-
-    Overall Score Guidance (1–5):
-      1 = Poor: Multiple major flaws; reasoning unclear or incorrect
-      2 = Below Average: Some structure but weak support / notable logical gaps
-      3 = Average: Competent; mix of strengths & weaknesses; acceptable coherence
-      4 = Good: Solid reasoning & support; minor issues only
-      5 = Excellent: Compelling, precise, well-supported, strategically strong
-
-    Avoid giving both debaters the same overall score unless their criteria subtotals are genuinely close. If you give same overall, explain precise parity in 'differentiation_reason'.
-    """
-)
+from typing import Dict, List, Optional, Tuple
+
+# The rubric lives with the other prompt templates; re-exported here for callers
+from core.prompts import RUBRIC_TEXT, render_prompt
+from core.usage_meter import TokenBudgetExceeded
+
+CRITERIA = ("clarity", "evidence", "logic", "rhetoric", "responsiveness")
+FEEDBACK_FIELDS = ("feedback_strengths", "feedback_improvements", "justification")
+
+# Follow-up calls allowed to fill fields missing from the judge's JSON
+MAX_REPAIR_ATTEMPTS = 1
 
 
 def generate_detailed_ratings(
@@ -41,71 +32,107 @@ def generate_detailed_ratings(
     debater2_stance: str,
     debate_transcript: str,
     topic: str,
-) -> Tuple[int, int, str, str]:
+    return_details: bool = False,
+    task_runner=None,
+):
     """Generate detailed ratings and feedback for both debaters.
 
+    Args:
+        task_runner: Replaces run_judge_task; takes (judge_agent, description,
+            expected_output) and returns the output (str() gives the text)
+
     Returns:
-        (debater1_rating, debater2_rating, debater1_feedback, debater2_feedback)
+        (debater1_rating, debater2_rating, debater1_feedback, debater2_feedback),
+        plus a rubric details dict (see extract_rubric_details) as a fifth
+        element when return_details is True.
     """
-
-    rating_prompt = dedent(
-        f"""
-        You are {judge_agent.name}, a debate judge focusing on: {judge_agent.focus}.
-
-        Debate Topic: "{topic}"
-        Debater 1: {debater1_name} (stance: {debater1_stance.upper()})
-        Debater 2: {debater2_name} (stance: {debater2_stance.upper()})
-
-        Transcript:
-        {debate_transcript}
-
-        {RUBRIC_TEXT}
-
-        TASK: Evaluate each debater rigorously. First assign per-criterion scores, then derive the overall (not an average—holistic judgment). Provide targeted strengths and improvements separately.
-
-        OUTPUT FORMAT (valid JSON ONLY, no commentary outside JSON):
-        {{
-          "debater1": {{
-            "overall": <int 1-5>,
-            "criteria": {{
-              "clarity": <int>,
-              "evidence": <int>,
-              "logic": <int>,
-              "rhetoric": <int>,
-              "responsiveness": <int>
-            }},
-            "feedback_strengths": "<comma-separated or sentences>",
-            "feedback_improvements": "<comma-separated or sentences>",
-            "justification": "<2-3 sentences giving a holistic justification>"
-          }},
-          "debater2": {{
-            "overall": <int 1-5>,
-            "criteria": {{
-              "clarity": <int>,
-              "evidence": <int>,
-              "logic": <int>,
-              "rhetoric": <int>,
-              "responsiveness": <int>
-            }},
-            "feedback_strengths": "<comma-separated or sentences>",
-            "feedback_improvements": "<comma-separated or sentences>",
-            "justification": "<2-3 sentences giving a holistic justification>"
-          }},
-          "differentiation_reason": "<Explain why scores differ OR why they are identical>"
-        }}
-
-        RULES:
-        - Must be valid JSON.
-        - Use integers only for scores.
-        - Use full scale when justified; do not default both to 4.
-        - Avoid markdown.
-        """
+    rating_prompt = render_prompt(
+        "judge.rating",
+        judge_name=judge_agent.name,
+        focus=judge_agent.focus,
+        topic=topic,
+        debater1_name=debater1_name,
+        debater1_stance=debater1_stance.upper(),
+        debater2_name=debater2_name,
+        debater2_stance=debater2_stance.upper(),
+        transcript=debate_transcript,
     )
 
+    judge_task = task_runner or run_judge_task
+    raw_text = str(judge_task(
+        judge_agent,
+        rating_prompt,
+        "Valid JSON object containing ratings, criteria, and feedback.",
+    ))
+
+    payload = extract_json_object(raw_text)
+    if payload is None:
+        ratings = parse_rating_response(raw_text, debater1_name, debater2_name)
+        return ratings + (extract_rubric_details({}),) if return_details else ratings
+
+    # Ask only for the fields that are still missing instead of re-rating from scratch
+    for _ in range(MAX_REPAIR_ATTEMPTS):
+        missing = validate_rating_payload(payload)
+        if not missing:
+            break
+        repair_prompt = render_prompt(
+            "judge.rating_repair",
+            judge_name=judge_agent.name,
+            focus=judge_agent.focus,
+            topic=topic,
+            debater1_name=debater1_name,
+            debater1_stance=debater1_stance.upper(),
+            debater2_name=debater2_name,
+            debater2_stance=debater2_stance.upper(),
+            transcript=debate_transcript,
+            partial_evaluation=json.dumps(payload, ensure_ascii=False),
+            missing_fields=", ".join(missing),
+        )
+        try:
+            repair_text = str(judge_task(judge_agent, repair_prompt, "Valid JSON object with only the missing fields."))
+        except TokenBudgetExceeded:
+            # Budget stops the whole debate, not just the repair
+            raise
+        except Exception as e:
+            print(f"Rating repair call failed: {e}")
+            break
+        patch = extract_json_object(repair_text)
+        if patch is None:
+            break
+        _merge_payload(payload, patch)
+
+    ratings = _ratings_from_payload(payload, debater1_name, debater2_name)
+    return ratings + (extract_rubric_details(payload),) if return_details else ratings
+
+
+def extract_rubric_details(payload: Dict) -> Dict:
+    """
+    Per-criterion scores and the differentiation reason from a rating payload.
+
+    Invalid or missing criterion scores are stored as None rather than defaulted,
+    so aggregates only average what the judge actually scored.
+    """
+    details = {}
+    for slot in ("debater1", "debater2"):
+        block = payload.get(slot) if isinstance(payload.get(slot), dict) else {}
+        criteria = block.get("criteria") if isinstance(block.get("criteria"), dict) else {}
+        details[slot] = {
+            "overall": _safe_int(block.get("overall"), None),
+            "criteria": {c: _safe_int(criteria.get(c), None) for c in CRITERIA},
+        }
+    reason = payload.get("differentiation_reason")
+    details["differentiation_reason"] = reason.strip() if isinstance(reason, str) else ""
+    return details
+
+
+def run_judge_task(judge_agent, description: str, expected_output: str):
+    """Run a single judge task through CrewAI and return its CrewOutput (str() gives the raw text)."""
+    from crewai import Task, Crew, Process
+
     task = Task(
-        description=rating_prompt,
+        description=description,
         agent=judge_agent.agent,
-        expected_output="Valid JSON object containing ratings, criteria, and feedback."
+        expected_output=expected_output
     )
 
     crew = Crew(
@@ -115,9 +142,149 @@ def generate_detailed_ratings(
         verbose=False,
     )
 
-    result = crew.kickoff()
-    raw_text = str(result)
-    return parse_rating_response(raw_text, debater1_name, debater2_name)
+    return crew.kickoff()
+
+
+def _strip_code_fences(text: str) -> str:
+    """Drop a markdown code fence (```json ... ```) around model output.
+
+    Only a leading and a trailing fence are removed; backticks inside JSON
+    strings (e.g. feedback quoting code) are kept.
+    """
+    text = re.sub(r"^\s*```\w*\n?", "", text)
+    return re.sub(r"\n?```\s*$", "", text)
+
+
+def _scan_json_object(text: str) -> Optional[str]:
+    """
+    Scan from the first '{' and return a repaired JSON candidate.
+
+    Tracks strings and bracket nesting in one pass: stops at the matching
+    close brace, drops trailing commas before closers, and if the text ends
+    early closes any open string, removes a dangling key or comma and
+    appends the missing closers.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    out = []
+    stack = []
+    in_string = False
+    escaped = False
+
+    for ch in text[start:]:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+            out.append(ch)
+        elif ch in '{[':
+            stack.append('}' if ch == '{' else ']')
+            out.append(ch)
+        elif ch in '}]':
+            if not stack:
+                break
+            # Trailing comma before a closer: {"a": 1,}
+            while out and out[-1] in ' \t\r\n':
+                out.pop()
+            if out and out[-1] == ',':
+                out.pop()
+            out.append(stack.pop())
+            if not stack:
+                return ''.join(out)
+        else:
+            out.append(ch)
+
+    # Truncated output: close what is open
+    if in_string:
+        if escaped:
+            out.pop()
+        out.append('"')
+    candidate = ''.join(out).rstrip()
+    # Remove a dangling key ("key" or "key":) or trailing comma / colon
+    candidate = re.sub(r'(,|\{)\s*"[^"]*"\s*:?\s*$', r'\1', candidate)
+    candidate = re.sub(r'[,:]\s*$', '', candidate)
+    return candidate + ''.join(reversed(stack))
+
+
+def extract_json_object(response: str) -> Optional[Dict]:
+    """Extract the first JSON object from a judge response, repairing common damage."""
+    text = _strip_code_fences(response or "")
+    candidate = _scan_json_object(text)
+    if candidate is None:
+        return None
+    try:
+        data = json.loads(candidate)
+    except json.JSONDecodeError:
+        # Last resort: cut back to the last complete member and close again
+        cut = candidate.rfind(',')
+        if cut == -1:
+            return None
+        try:
+            data = json.loads(_scan_json_object(candidate[:cut]) or "")
+        except json.JSONDecodeError:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+def _valid_score(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and 1 <= value <= 5
+
+
+def validate_rating_payload(data: Dict) -> List[str]:
+    """Return dotted paths of required fields that are missing or invalid."""
+    missing = []
+    for slot in ("debater1", "debater2"):
+        block = data.get(slot)
+        if not isinstance(block, dict):
+            block = {}
+        if not _valid_score(block.get("overall")):
+            missing.append(f"{slot}.overall")
+        criteria = block.get("criteria")
+        if not isinstance(criteria, dict):
+            criteria = {}
+        for criterion in CRITERIA:
+            if not _valid_score(criteria.get(criterion)):
+                missing.append(f"{slot}.criteria.{criterion}")
+        for field in FEEDBACK_FIELDS:
+            value = block.get(field)
+            if not isinstance(value, str) or not value.strip():
+                missing.append(f"{slot}.{field}")
+    reason = data.get("differentiation_reason")
+    if not isinstance(reason, str) or not reason.strip():
+        missing.append("differentiation_reason")
+    return missing
+
+
+def _merge_payload(target: Dict, patch: Dict):
+    """Recursively merge fields from a repair response into the payload."""
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_payload(target[key], value)
+        else:
+            target[key] = value
+
+
+def _ratings_from_payload(data: Dict, debater1_name: str, debater2_name: str) -> Tuple[int, int, str, str]:
+    """Overall ratings and combined feedback strings from a parsed rating payload."""
+    d1 = data.get('debater1') if isinstance(data.get('debater1'), dict) else {}
+    d2 = data.get('debater2') if isinstance(data.get('debater2'), dict) else {}
+    r1 = _safe_int(d1.get('overall', 3))
+    r2 = _safe_int(d2.get('overall', 3))
+    fb1_parts = [d1.get(field, '') for field in FEEDBACK_FIELDS]
+    fb2_parts = [d2.get(field, '') for field in FEEDBACK_FIELDS]
+    fb1 = ' '.join(p.strip() for p in fb1_parts if isinstance(p, str) and p.strip()) or f"Good effort from {debater1_name}."
+    fb2 = ' '.join(p.strip() for p in fb2_parts if isinstance(p, str) and p.strip()) or f"Good effort from {debater2_name}."
+    return r1, r2, fb1, fb2
 
 
 def _safe_int(value, default=3):
@@ -136,30 +303,11 @@ def parse_rating_response(response: str, debater1_name: str, debater2_name: str)
     Attempt JSON parsing first. If it fails, fall back to legacy pattern parsing.
     Returns overall ratings and combined feedback strings for each debater.
     """
-    # Try JSON
+    # Try JSON (tolerant of fences, trailing commas and truncation)
     try:
-        json_start = response.find('{')
-        json_end = response.rfind('}')
-        if json_start != -1 and json_end != -1:
-            json_blob = response[json_start: json_end + 1]
-            data = json.loads(json_blob)
-            d1 = data.get('debater1', {})
-            d2 = data.get('debater2', {})
-            r1 = _safe_int(d1.get('overall', 3))
-            r2 = _safe_int(d2.get('overall', 3))
-            fb1_parts = [
-                d1.get('feedback_strengths', ''),
-                d1.get('feedback_improvements', ''),
-                d1.get('justification', ''),
-            ]
-            fb2_parts = [
-                d2.get('feedback_strengths', ''),
-                d2.get('feedback_improvements', ''),
-                d2.get('justification', ''),
-            ]
-            fb1 = ' '.join(p.strip() for p in fb1_parts if p and p.strip()) or f"Good effort from {debater1_name}."
-            fb2 = ' '.join(p.strip() for p in fb2_parts if p and p.strip()) or f"Good effort from {debater2_name}."
-            return r1, r2, fb1, fb2
+        data = extract_json_object(response)
+        if data is not None:
+            return _ratings_from_payload(data, debater1_name, debater2_name)
     except Exception as e:
         print(f"Rating JSON parse failed, falling back. Error: {e}")
 
@@ -0,0 +1,200 @@
+"""
+Retroactive Re-Judging Pipeline
+Streams stored debates through generate_detailed_ratings with a chosen judge
+(or panel) on a bounded worker pool and stores the results as separate rating
+versions, leaving the original ratings untouched. Jobs are resumable by ID.
+
+Usage:
+    python -m core.rejudge --judge Themis --judge Solon --workers 4 --job-id themis-solon-v2
+"""
+
+import argparse
+import hashlib
+import sys
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.memory_system import get_debate_memory
+from core.rating_system import RUBRIC_TEXT, generate_detailed_ratings
+
+
+# (transcript key prefix, label used in the live transcript; "" means "(STANCE)")
+ROUNDS = [("opening", ""), ("rebuttal", " Rebuttal"), ("closing", " Closing")]
+
+
+def rubric_version() -> str:
+    """Short hash identifying the current rubric text."""
+    return hashlib.sha256(RUBRIC_TEXT.encode("utf-8")).hexdigest()[:12]
+
+
+def format_transcript(debate: Dict) -> str:
+    """Rebuild the transcript string the judge saw from a stored debate record."""
+    d1 = debate["participants"]["debater1"]
+    d2 = debate["participants"]["debater2"]
+    transcript = debate.get("transcript", {}) or {}
+    lines = []
+    for round_type, label in ROUNDS:
+        # "_for" keys hold debater1's turns, "_against" keys debater2's
+        for participant, key in ((d1, "_for"), (d2, "_against")):
+            text = transcript.get(f"{round_type}{key}")
+            if not text:
+                continue
+            tag = label if label else f" ({participant['stance'].upper()})"
+            lines.append(f"{participant['name']}{tag}: {text}")
+    return "\n\n".join(lines)
+
+
+class RejudgeJob:
+    """A resumable batch of re-judging work over stored debates."""
+
+    def __init__(self, job_id: str, judge_names: List[str], memory=None, max_workers: int = 4,
+                 debate_ids: Optional[List[int]] = None, checkpoint_every: int = 10,
+                 rate_fn: Callable = generate_detailed_ratings):
+        """
+        Args:
+            job_id: Stable identifier; re-running the same ID skips finished work
+            judge_names: Judge (or panel of judges) that re-scores every debate
+            memory: DebateMemory to read from and write versions to
+            max_workers: Size of the worker pool (and bound on in-flight calls)
+            debate_ids: Restrict the job to these debates (default: all)
+            checkpoint_every: Persist the store after this many new results
+            rate_fn: Rating function, replaceable for dry runs and benchmarks
+        """
+        self.job_id = job_id
+        self.judge_names = judge_names
+        self.memory = memory or get_debate_memory()
+        self.max_workers = max(1, max_workers)
+        self.debate_ids = set(debate_ids) if debate_ids else None
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.rate_fn = rate_fn
+        self.rubric_version = rubric_version()
+        self.progress = {"total": 0, "completed": 0, "failed": 0, "skipped": 0, "elapsed": 0.0}
+
+    def _selected_debates(self) -> Iterator[Dict]:
+        for debate in self.memory.get_all_debates():
+            if self.debate_ids is None or debate["id"] in self.debate_ids:
+                yield debate
+
+    def _work_items(self) -> Iterator[Tuple[Dict, str]]:
+        """Stream (debate, judge) pairs that this job has not finished yet."""
+        for debate in self._selected_debates():
+            done = {
+                v["judge"] for v in self.memory.get_rating_versions(debate["id"])
+                if v.get("job_id") == self.job_id
+            }
+            for judge_name in self.judge_names:
+                if judge_name in done:
+                    self.progress["skipped"] += 1
+                    continue
+                yield debate, judge_name
+
+    def _rate(self, debate: Dict, judge_name: str) -> Dict:
+        """Score one debate with one judge. Runs on a worker thread."""
+        from agents.judge_agents import get_judge
+
+        # A session per call: personas are shared, per-debate state is not
+        judge = get_judge(judge_name).start_session()
+        d1 = debate["participants"]["debater1"]
+        d2 = debate["participants"]["debater2"]
+
+        r1, r2, fb1, fb2, details = self.rate_fn(
+            judge, d1["name"], d2["name"], d1["stance"], d2["stance"],
+            format_transcript(debate), debate["topic"], return_details=True,
+        )
+        return {
+            "job_id": self.job_id,
+            "judge": judge_name,
+            "rubric_version": self.rubric_version,
+            "timestamp": datetime.now().isoformat(),
+            "debater1": {"name": d1["name"], "rating": r1, "feedback": fb1},
+            "debater2": {"name": d2["name"], "rating": r2, "feedback": fb2},
+            "rubric": details,
+        }
+
+    def report(self) -> Dict:
+        """Progress and throughput so far."""
+        p = dict(self.progress)
+        done = p["completed"] + p["failed"]
+        p["throughput_per_min"] = (done / p["elapsed"] * 60) if p["elapsed"] > 0 else 0.0
+        remaining = max(0, p["total"] - p["skipped"] - done)
+        p["remaining"] = remaining
+        p["eta_seconds"] = (remaining / done * p["elapsed"]) if done and remaining > 0 else 0.0
+        return p
+
+    def run(self, on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Execute the job and return the final progress report.
+
+        At most max_workers rating calls are in flight; results are written
+        from this thread only, so the store never sees concurrent writers.
+        """
+        start = time.perf_counter()
+        self.progress["total"] = sum(1 for _ in self._selected_debates()) * len(self.judge_names)
+        unsaved = 0
+        items = self._work_items()
+        in_flight = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                while len(in_flight) < self.max_workers:
+                    item = next(items, None)
+                    if item is None:
+                        break
+                    debate, judge_name = item
+                    in_flight[pool.submit(self._rate, debate, judge_name)] = (debate["id"], judge_name)
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    debate_id, judge_name = in_flight.pop(future)
+                    try:
+                        self.memory.add_rating_version(debate_id, future.result(), save=False)
+                        self.progress["completed"] += 1
+                        unsaved += 1
+                    except Exception as e:
+                        self.progress["failed"] += 1
+                        print(f"Re-judging debate #{debate_id} with {judge_name} failed: {e}")
+
+                if unsaved >= self.checkpoint_every:
+                    self.memory.flush()
+                    unsaved = 0
+                self.progress["elapsed"] = time.perf_counter() - start
+                if on_progress:
+                    on_progress(self.report())
+
+        if unsaved:
+            self.memory.flush()
+        self.progress["elapsed"] = time.perf_counter() - start
+        return self.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-judge stored debates with a judge or panel.")
+    parser.add_argument("--judge", action="append", required=True, help="Judge name (repeat for a panel)")
+    parser.add_argument("--job-id", help="Job ID; reuse it to resume (default: judges + rubric version)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent rating calls")
+    parser.add_argument("--debate", type=int, action="append", help="Only re-judge these debate IDs")
+    args = parser.parse_args()
+
+    job_id = args.job_id or f"{'+'.join(args.judge)}@{rubric_version()}"
+    job = RejudgeJob(job_id, args.judge, max_workers=args.workers, debate_ids=args.debate)
+
+    def print_progress(p):
+        print(
+            f"[{job_id}] {p['completed']} done, {p['failed']} failed, {p['skipped']} skipped, "
+            f"{p['remaining']} left · {p['throughput_per_min']:.1f}/min · ETA {p['eta_seconds']:.0f}s"
+        )
+
+    report = job.run(on_progress=print_progress)
+    print(f"\n✅ Job {job_id} finished: {report['completed']} new ratings in {report['elapsed']:.1f}s "
+          f"({report['throughput_per_min']:.1f}/min), {report['failed']} failed, {report['skipped']} already done.")
+
+
+if __name__ == "__main__":
+    main()
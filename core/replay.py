@@ -0,0 +1,121 @@
+"""
+Debate Replay
+Turns a stored debate record back into the event stream run_debate emits,
+so past debates can be played through the same chat and audio rendering
+path with simulated pacing and no LLM calls. Pacing either sleeps between
+turns (replay_debate) or is stepped by a caller that polls (advance_replay).
+"""
+
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.debate_controller import TURN_LABELS
+
+
+# (round, transcript key, participant slot) in speaking order
+TURN_ORDER = [
+    ("opening", "opening_for", "debater1"),
+    ("opening", "opening_against", "debater2"),
+    ("rebuttal", "rebuttal_for", "debater1"),
+    ("rebuttal", "rebuttal_against", "debater2"),
+    ("closing", "closing_for", "debater1"),
+    ("closing", "closing_against", "debater2"),
+]
+
+# Simulated pacing: roughly how long the turn takes to speak, bounded
+WORDS_PER_SECOND = 2.5
+MIN_PAUSE_SECONDS = 0.5
+MAX_PAUSE_SECONDS = 8.0
+
+
+def replay_events(debate: Dict) -> Iterator[Dict]:
+    """Yield the events run_debate would have emitted for a stored debate."""
+    participants = debate["participants"]
+    transcript = debate.get("transcript") or {}
+
+    current_round = None
+    for round_type, key, slot in TURN_ORDER:
+        text = transcript.get(key)
+        if not text:
+            continue
+        if round_type != current_round:
+            yield {"type": "stage", "stage": round_type}
+            current_round = round_type
+        participant = participants[slot]
+        label = TURN_LABELS.get(round_type) or f"({participant['stance'].upper()})"
+        yield {"type": "turn", "key": key, "round": round_type, "speaker": participant["name"],
+               "label": label, "text": str(text)}
+
+    if debate.get("verdict"):
+        yield {"type": "stage", "stage": "verdict"}
+        yield {"type": "turn", "key": "verdict", "round": "verdict", "speaker": debate["judge"],
+               "label": TURN_LABELS["verdict"], "text": str(debate["verdict"])}
+
+    yield {
+        "type": "ratings",
+        **{
+            slot: {
+                "name": participants[slot]["name"],
+                "rating": participants[slot]["rating"],
+                "feedback": participants[slot]["feedback"],
+            }
+            for slot in ("debater1", "debater2")
+        },
+    }
+    yield {"type": "saved", "debate_id": debate.get("id")}
+
+
+def turn_pause(text: str, speed: float = 1.0) -> float:
+    """Simulated seconds a turn takes, scaled by playback speed."""
+    seconds = len(text.split()) / WORDS_PER_SECOND
+    return min(MAX_PAUSE_SECONDS, max(MIN_PAUSE_SECONDS, seconds)) / max(speed, 1e-6)
+
+
+def replay_debate(debate: Dict, on_turn: Callable[[Dict], None], speed: Optional[float] = 1.0,
+                  sleep: Callable[[float], None] = time.sleep) -> int:
+    """
+    Feed a stored debate's events to `on_turn`, pausing after each turn.
+
+    Args:
+        debate: Stored debate record from DebateMemory
+        on_turn: Same callback signature as run_debate's on_turn
+        speed: Playback speed multiplier; None or 0 disables pacing
+        sleep: Replaceable for tests and load runs
+
+    Returns:
+        Number of events replayed
+    """
+    count = 0
+    for event in replay_events(debate):
+        on_turn(event)
+        count += 1
+        if speed and event["type"] == "turn":
+            sleep(turn_pause(event["text"], speed))
+    return count
+
+
+def advance_replay(events: List[Dict], position: int, next_at: float, now: float,
+                   speed: Optional[float] = 1.0) -> Tuple[int, float]:
+    """
+    Step a paced replay without sleeping, for callers that poll (e.g. UI reruns).
+
+    Events from `position` on are released while they are due; after a turn
+    the next event is due once that turn's pause has passed, so each call
+    releases at most one turn.
+
+    Args:
+        events: Output of replay_events
+        position: Number of events already released
+        next_at: Time (in `now`'s clock) the next event is due
+        now: Current time, e.g. time.monotonic()
+        speed: Playback speed multiplier; None or 0 releases everything at once
+
+    Returns:
+        (new position, time the next event is due)
+    """
+    while position < len(events) and now >= next_at:
+        event = events[position]
+        position += 1
+        if speed and event["type"] == "turn":
+            next_at = now + turn_pause(event["text"], speed)
+    return position, next_at
@@ -0,0 +1,263 @@
+"""
+Argument Retrieval System for Debate Agents
+Indexes past debate turns with hashed TF-IDF vectors and retrieves the most
+relevant prior arguments for a new topic using random-hyperplane LSH.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from core.memory_system import get_debate_memory
+from core.prompts import estimate_tokens
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have",
+    "in", "is", "it", "its", "of", "on", "or", "that", "the", "their", "this", "to", "was",
+    "were", "will", "with", "we", "our", "they", "should", "can", "not", "which", "while",
+])
+
+# Transcript keys are positional: "_for" keys always hold debater1's turns and
+# "_against" keys debater2's, whatever stance each side actually argued.
+SEGMENT_OWNERS = {
+    "opening_for": ("debater1", "opening"),
+    "opening_against": ("debater2", "opening"),
+    "rebuttal_for": ("debater1", "rebuttal"),
+    "rebuttal_against": ("debater2", "rebuttal"),
+    "closing_for": ("debater1", "closing"),
+    "closing_against": ("debater2", "closing"),
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def _stable_hash(value: str) -> int:
+    """Process-independent hash (Python's hash() is salted per run)."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ArgumentIndex:
+    """Local vector index over past debate turns.
+
+    Each turn is embedded as a sparse hashed term-frequency vector; IDF weights are
+    applied at query time so the index stays valid as new debates are added.
+    Candidates come from several LSH tables and are re-ranked by exact cosine.
+    """
+
+    def __init__(self, memory=None, dimensions: int = 1 << 18, num_planes: int = 10,
+                 num_tables: int = 4):
+        # Each plane consumes one bit of a 64-bit bucket hash
+        num_planes = min(num_planes, 64)
+        # Resolved lazily so building an index never forces a store load
+        self.memory = memory
+        self.dimensions = dimensions
+        self.num_planes = num_planes
+        self.num_tables = num_tables
+        # Concurrent debate sessions may query (and so refresh) at the same time
+        self._refresh_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.documents: List[Dict] = []
+        self.doc_frequency: Dict[int, int] = defaultdict(int)
+        self.tables: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(self.num_tables)]
+        self._indexed_debates = 0
+
+    # ---------------------------------------------------------------- embedding
+    def _vectorize(self, text: str, topic: str = "") -> Dict[int, float]:
+        """Sublinear hashed term frequencies; the topic is counted twice."""
+        counts: Dict[int, int] = defaultdict(int)
+        for token in tokenize(text) + tokenize(topic) * 2:
+            counts[_stable_hash(token) % self.dimensions] += 1
+        return {bucket: 1.0 + math.log(count) for bucket, count in counts.items()}
+
+    def _signature(self, vector: Dict[int, float], table: int) -> int:
+        """Sign pattern of the vector against hashed random hyperplanes.
+
+        One 64-bit hash per (table, bucket) supplies that bucket's +/-1 component
+        for every plane at once.
+        """
+        projections = [0.0] * self.num_planes
+        for bucket, weight in vector.items():
+            bits = _stable_hash(f"{table}:{bucket}")
+            for plane in range(self.num_planes):
+                projections[plane] += weight if (bits >> plane) & 1 else -weight
+        signature = 0
+        for plane, projection in enumerate(projections):
+            if projection >= 0:
+                signature |= 1 << plane
+        return signature
+
+    def _idf(self, bucket: int) -> float:
+        total = len(self.documents)
+        return math.log((1 + total) / (1 + self.doc_frequency.get(bucket, 0))) + 1.0
+
+    def _cosine(self, query: Dict[int, float], vector: Dict[int, float]) -> float:
+        dot = 0.0
+        for bucket, weight in query.items():
+            if bucket in vector:
+                dot += weight * vector[bucket] * self._idf(bucket) ** 2
+        if dot == 0.0:
+            return 0.0
+        q_norm = math.sqrt(sum((w * self._idf(b)) ** 2 for b, w in query.items()))
+        d_norm = math.sqrt(sum((w * self._idf(b)) ** 2 for b, w in vector.items()))
+        return dot / (q_norm * d_norm) if q_norm and d_norm else 0.0
+
+    # ---------------------------------------------------------------- indexing
+    def add_turn(self, speaker: str, text: str, topic: str, stance: str,
+                 round_type: str, debate_id: int, timestamp: str = ""):
+        """Add a single debate turn to the index."""
+        if not text or not text.strip():
+            return
+        vector = self._vectorize(text, topic)
+        doc_id = len(self.documents)
+        self.documents.append({
+            "speaker": speaker,
+            "text": text.strip(),
+            "topic": topic,
+            "stance": stance,
+            "round": round_type,
+            "debate_id": debate_id,
+            "timestamp": timestamp,
+            "vector": vector,
+        })
+        for bucket in vector:
+            self.doc_frequency[bucket] += 1
+        for table in range(self.num_tables):
+            self.tables[table][self._signature(vector, table)].append(doc_id)
+
+    def add_debate(self, debate: Dict):
+        """Index every transcript turn of a stored debate record."""
+        participants = debate.get("participants", {})
+        transcript = debate.get("transcript", {}) or {}
+        for key, (slot, round_type) in SEGMENT_OWNERS.items():
+            participant = participants.get(slot)
+            if not participant:
+                continue
+            self.add_turn(
+                speaker=participant.get("name", ""),
+                text=str(transcript.get(key, "")),
+                topic=debate.get("topic", ""),
+                stance=participant.get("stance", ""),
+                round_type=round_type,
+                debate_id=debate.get("id", 0),
+                timestamp=debate.get("timestamp", ""),
+            )
+
+    def refresh(self):
+        """Index debates saved since the last refresh (the debate list is append-only)."""
+        with self._refresh_lock:
+            if self.memory is None:
+                self.memory = get_debate_memory()
+            debates = self.memory.get_all_debates()
+            if len(debates) < self._indexed_debates:
+                # Store was reset or replaced; rebuild from scratch
+                self._reset()
+            for debate in debates[self._indexed_debates:]:
+                self.add_debate(debate)
+            self._indexed_debates = len(debates)
+
+    # ---------------------------------------------------------------- search
+    def _candidates(self, vector: Dict[int, float]) -> set:
+        """Union of LSH buckets at Hamming distance <= 1 across all tables."""
+        candidates = set()
+        for table in range(self.num_tables):
+            signature = self._signature(vector, table)
+            probes = [signature] + [signature ^ (1 << bit) for bit in range(self.num_planes)]
+            for probe in probes:
+                candidates.update(self.tables[table].get(probe, ()))
+        return candidates
+
+    def search(self, query: str, top_k: int = 4, speaker: Optional[str] = None,
+               exclude_debate_ids: Optional[set] = None) -> List[Tuple[float, Dict]]:
+        """Return up to top_k (score, turn) pairs ranked by cosine similarity."""
+        self.refresh()
+        if not self.documents:
+            return []
+
+        vector = self._vectorize("", query)
+        candidates = self._candidates(vector)
+
+        def eligible(doc_id):
+            doc = self.documents[doc_id]
+            if speaker and doc["speaker"] != speaker:
+                return False
+            return not (exclude_debate_ids and doc["debate_id"] in exclude_debate_ids)
+
+        pool = [d for d in candidates if eligible(d)]
+        if len(pool) < top_k:
+            # Small or sparse corpus: fall back to an exact scan
+            pool = [d for d in range(len(self.documents)) if eligible(d)]
+
+        scored = []
+        for doc_id in pool:
+            score = self._cosine(vector, self.documents[doc_id]["vector"])
+            if score > 0:
+                scored.append((score, self.documents[doc_id]))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return scored[:top_k]
+
+    def get_relevant_arguments(self, name: str, topic: str, top_k: int = 4,
+                               token_budget: int = 600) -> str:
+        """
+        Build a prompt section with a debater's most relevant past turns.
+
+        Args:
+            name: Debater whose prior arguments and rebuttals are retrieved
+            topic: Current debate topic used as the query
+            top_k: Maximum number of turns to include
+            token_budget: Approximate token ceiling for the whole section
+
+        Returns:
+            Formatted context string, or "" when nothing relevant exists
+        """
+        results = self.search(topic, top_k=top_k, speaker=name)
+        if not results:
+            return ""
+
+        lines = []
+        remaining = token_budget
+        for _, doc in results:
+            header = f"- On \"{doc['topic']}\" ({doc['stance'].upper()}, {doc['round']}): "
+            cost = estimate_tokens(header + doc["text"])
+            if cost <= remaining:
+                lines.append(header + doc["text"])
+                remaining -= cost
+                continue
+            # Truncate the last passage to fit if a meaningful portion remains
+            room = (remaining - estimate_tokens(header)) * 4
+            if room >= 200:
+                lines.append(header + doc["text"][:room].rsplit(" ", 1)[0] + " ...")
+            break
+
+        return "\n".join(lines)
+
+
+# Shared argument index, created on first use
+_argument_index = None
+_argument_index_lock = threading.Lock()
+
+
+def get_argument_index() -> ArgumentIndex:
+    """Return the shared ArgumentIndex over the global debate store."""
+    global _argument_index
+    if _argument_index is None:
+        with _argument_index_lock:
+            if _argument_index is None:
+                _argument_index = ArgumentIndex()
+    return _argument_index
+
+
+def __getattr__(name):
+    if name == "argument_index":
+        return get_argument_index()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
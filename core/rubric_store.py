@@ -0,0 +1,133 @@
+"""
+Rubric Score Store for Debate Agents
+Persists the judge's per-criterion scores in a columnar SQLite side store so
+rubric breakdowns can be aggregated without re-parsing judge output.
+"""
+
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from core.rating_system import CRITERIA
+
+
+GROUP_COLUMNS = ("debater", "judge", "stance", "topic")
+
+
+class RubricStore:
+    """One row per (debate, debater) with one integer column per rubric criterion."""
+
+    def __init__(self, db_path: str = "debate_rubric.db"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            criterion_columns = ", ".join(f"{c} INTEGER" for c in CRITERIA)
+            conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS rubric_scores (
+                    debate_id INTEGER NOT NULL,
+                    debater TEXT NOT NULL,
+                    judge TEXT NOT NULL,
+                    stance TEXT NOT NULL,
+                    topic TEXT NOT NULL,
+                    timestamp TEXT,
+                    overall INTEGER,
+                    {criterion_columns},
+                    differentiation_reason TEXT,
+                    PRIMARY KEY (debate_id, debater)
+                )"""
+            )
+            for column in GROUP_COLUMNS:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_rubric_{column} ON rubric_scores({column})")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def record_debate(self, debate_id: int, judge: str, topic: str, timestamp: str,
+                      participants: List[Dict], differentiation_reason: str = ""):
+        """
+        Store rubric scores for both debaters of a debate.
+
+        Args:
+            debate_id: ID of the debate record in DebateMemory
+            judge: Judge who produced the scores
+            topic: Debate topic
+            timestamp: Debate timestamp (ISO format)
+            participants: Dicts with "name", "stance", "overall" and "criteria"
+            differentiation_reason: Judge's explanation of the score gap
+        """
+        rows = []
+        for p in participants:
+            criteria = p.get("criteria") or {}
+            rows.append(
+                (debate_id, p["name"], judge, p["stance"], topic, timestamp, p.get("overall"))
+                + tuple(criteria.get(c) for c in CRITERIA)
+                + (differentiation_reason,)
+            )
+        placeholders = ", ".join("?" * (8 + len(CRITERIA)))
+        with self._lock:
+            self.conn.executemany(f"INSERT OR REPLACE INTO rubric_scores VALUES ({placeholders})", rows)
+            self.conn.commit()
+
+    def _where(self, filters: Dict[str, Optional[str]]):
+        clauses, params = [], []
+        for column, value in filters.items():
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def aggregate(self, group_by: Optional[str] = None, debater: Optional[str] = None,
+                  judge: Optional[str] = None, stance: Optional[str] = None,
+                  topic: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Average overall and per-criterion scores, optionally grouped and filtered.
+
+        Args:
+            group_by: One of "debater", "judge", "stance", "topic", or None for a single total
+            debater, judge, stance, topic: Optional equality filters
+
+        Returns:
+            {group value (or "all"): {"count": n, "overall": avg, "<criterion>": avg, ...}}
+        """
+        if group_by is not None and group_by not in GROUP_COLUMNS:
+            raise ValueError(f"group_by must be one of {GROUP_COLUMNS}")
+
+        where, params = self._where({"debater": debater, "judge": judge, "stance": stance, "topic": topic})
+        key_expr = group_by or "'all'"
+        averages = ", ".join(f"AVG({c})" for c in ("overall",) + CRITERIA)
+        sql = f"SELECT {key_expr}, COUNT(*), {averages} FROM rubric_scores{where}"
+        if group_by:
+            sql += f" GROUP BY {group_by} ORDER BY {group_by}"
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        result = {}
+        for row in rows:
+            if not row[1]:
+                continue
+            stats = {"count": row[1]}
+            for column, value in zip(("overall",) + CRITERIA, row[2:]):
+                stats[column] = value
+            result[row[0]] = stats
+        return result
+
+    def get_debate_scores(self, debate_id: int) -> List[Dict]:
+        """Per-criterion rows for a single debate."""
+        columns = ("debater", "judge", "stance", "topic", "overall") + CRITERIA + ("differentiation_reason",)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(columns)} FROM rubric_scores WHERE debate_id = ?", (debate_id,)
+            ).fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
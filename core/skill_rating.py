@@ -0,0 +1,141 @@
+"""
+Skill Rating Engine for Debaters
+Elo-style skill estimates that account for opponent strength, updated
+incrementally after each debate and recomputable in bulk from history.
+"""
+
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_RATING = 1500.0
+K_FACTOR = 32.0
+ELO_SCALE = 400.0
+
+WINNER_PATTERN = re.compile(r"winner\s*:\s*\**\s*([^\n*\"]+)", re.IGNORECASE)
+
+
+def new_skill_entry() -> Dict:
+    """Initial skill record for a debater with no rated debates."""
+    return {"elo": DEFAULT_RATING, "debates": 0, "wins": 0, "losses": 0, "draws": 0}
+
+
+def parse_winner(verdict: str, debater1_name: str, debater2_name: str) -> Optional[str]:
+    """Extract the declared winner from the verdict's 'Winner: Name' line, if any."""
+    matches = WINNER_PATTERN.findall(verdict or "")
+    if not matches:
+        return None
+    declared = matches[-1].strip().strip("[]").lower()
+    for name in (debater1_name, debater2_name):
+        if name.lower() in declared:
+            return name
+    return None
+
+
+def match_result(debate: Dict) -> Tuple[float, float]:
+    """
+    Outcome of a stored debate from debater1's point of view.
+
+    The judge's declared winner decides the result; the rating margin only
+    scales how much the result counts. Without a declared winner the higher
+    rating wins, and equal ratings are a draw.
+
+    Returns:
+        (score for debater1 in {0, 0.5, 1}, rating margin in favour of the winner)
+    """
+    d1 = debate["participants"]["debater1"]
+    d2 = debate["participants"]["debater2"]
+    r1, r2 = int(d1["rating"]), int(d2["rating"])
+    winner = parse_winner(debate.get("verdict", ""), d1["name"], d2["name"])
+
+    if winner == d1["name"]:
+        return 1.0, max(0, r1 - r2)
+    if winner == d2["name"]:
+        return 0.0, max(0, r2 - r1)
+    if r1 == r2:
+        return 0.5, 0
+    return (1.0 if r1 > r2 else 0.0), abs(r1 - r2)
+
+
+def margin_multiplier(margin: float) -> float:
+    """Scale the K-factor up for decisive wins (margin 0 -> 1.0, margin 4 -> ~2.6)."""
+    return 1.0 + math.log1p(margin)
+
+
+def expected_score(rating_a: float, rating_b: float) -> float:
+    """Probability that a player rated rating_a beats one rated rating_b."""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / ELO_SCALE))
+
+
+def apply_result(skill_ratings: Dict[str, Dict], debate: Dict, k_factor: float = K_FACTOR):
+    """Update both debaters' skill entries in place from one stored debate."""
+    name1 = debate["participants"]["debater1"]["name"]
+    name2 = debate["participants"]["debater2"]["name"]
+    entry1 = skill_ratings.setdefault(name1, new_skill_entry())
+    entry2 = skill_ratings.setdefault(name2, new_skill_entry())
+
+    score1, margin = match_result(debate)
+    delta = k_factor * margin_multiplier(margin) * (score1 - expected_score(entry1["elo"], entry2["elo"]))
+    entry1["elo"] += delta
+    entry2["elo"] -= delta
+
+    for entry, score in ((entry1, score1), (entry2, 1.0 - score1)):
+        entry["debates"] += 1
+        if score == 1.0:
+            entry["wins"] += 1
+        elif score == 0.0:
+            entry["losses"] += 1
+        else:
+            entry["draws"] += 1
+
+
+def recompute_skill_ratings(debates: List[Dict], k_factor: float = K_FACTOR) -> Dict[str, Dict]:
+    """
+    Rebuild every debater's skill entry from the full debate history.
+
+    Match outcomes, K multipliers and win/loss tallies are computed as NumPy
+    arrays in one pass; only the Elo replay itself is sequential because each
+    update depends on the ratings produced by the previous debate.
+    """
+    import numpy as np
+
+    if not debates:
+        return {}
+
+    names = sorted({d["participants"][slot]["name"] for d in debates for slot in ("debater1", "debater2")})
+    position = {name: i for i, name in enumerate(names)}
+    idx1 = np.array([position[d["participants"]["debater1"]["name"]] for d in debates], dtype=np.intp)
+    idx2 = np.array([position[d["participants"]["debater2"]["name"]] for d in debates], dtype=np.intp)
+    results = np.array([match_result(d) for d in debates], dtype=np.float64)
+    score1, margins = results[:, 0], results[:, 1]
+    k_values = k_factor * (1.0 + np.log1p(margins))
+
+    elo = np.full(len(names), DEFAULT_RATING, dtype=np.float64)
+    for a, b, s, k in zip(idx1.tolist(), idx2.tolist(), score1.tolist(), k_values.tolist()):
+        delta = k * (s - 1.0 / (1.0 + 10 ** ((elo[b] - elo[a]) / ELO_SCALE)))
+        elo[a] += delta
+        elo[b] -= delta
+
+    both = np.concatenate([idx1, idx2])
+    scores = np.concatenate([score1, 1.0 - score1])
+    played = np.bincount(both, minlength=len(names))
+    wins = np.bincount(both, weights=(scores == 1.0), minlength=len(names))
+    losses = np.bincount(both, weights=(scores == 0.0), minlength=len(names))
+
+    return {
+        name: {
+            "elo": float(elo[i]),
+            "debates": int(played[i]),
+            "wins": int(wins[i]),
+            "losses": int(losses[i]),
+            "draws": int(played[i] - wins[i] - losses[i]),
+        }
+        for i, name in enumerate(names)
+    }
+
+
+def build_leaderboard(skill_ratings: Dict[str, Dict]) -> List[Dict]:
+    """Debaters ranked by Elo, highest first, with rank numbers."""
+    ranked = sorted(skill_ratings.items(), key=lambda item: item[1]["elo"], reverse=True)
+    return [dict(entry, name=name, rank=rank) for rank, (name, entry) in enumerate(ranked, start=1)]
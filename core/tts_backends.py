@@ -0,0 +1,118 @@
+"""
+Text-to-Speech Backends
+Pluggable speech engines behind a common interface: gTTS (online), a local
+espeak engine (offline) and a deterministic silent stub for tests and
+load benchmarks.
+"""
+
+import shutil
+import subprocess
+import time
+from abc import ABC, abstractmethod
+from typing import Dict
+
+from core.mp3_utils import silence
+
+
+class TTSBackend(ABC):
+    """Interface every TTS engine implements."""
+
+    name = "base"
+    # File extension of the audio this backend writes
+    extension = ".mp3"
+
+    @abstractmethod
+    def synthesize(self, text: str, output_path: str, voice: Dict):
+        """
+        Write speech for `text` to `output_path`.
+
+        Args:
+            text: Text to speak
+            output_path: Destination file (written in full before returning)
+            voice: Voice configuration from TTSManager.voice_configs
+
+        Raises:
+            Exception: If synthesis fails; the caller logs and skips the clip
+        """
+
+
+class GTTSBackend(TTSBackend):
+    """Google Text-to-Speech; needs network access."""
+
+    name = "gtts"
+    extension = ".mp3"
+
+    def synthesize(self, text: str, output_path: str, voice: Dict):
+        # Imported here so the module loads without gTTS installed
+        from gtts import gTTS
+
+        tts = gTTS(
+            text=text,
+            lang=voice.get("lang", "en"),
+            tld=voice.get("tld", "com"),
+            slow=voice.get("slow", False),
+        )
+        tts.save(output_path)
+
+
+class EspeakBackend(TTSBackend):
+    """Offline synthesis through the espeak-ng / espeak command-line engine."""
+
+    name = "espeak"
+    extension = ".wav"
+
+    # gTTS accent domains mapped to the closest espeak voices
+    TLD_VOICES = {"co.uk": "en-gb", "com.au": "en-gb-x-rp", "com": "en-us", "ca": "en-us", "co.in": "en-gb"}
+
+    def __init__(self, executable: str = None, words_per_minute: int = 175):
+        self.executable = executable or shutil.which("espeak-ng") or shutil.which("espeak")
+        self.words_per_minute = words_per_minute
+
+    def synthesize(self, text: str, output_path: str, voice: Dict):
+        if not self.executable:
+            raise RuntimeError("espeak-ng/espeak not found on PATH")
+        espeak_voice = voice.get("espeak_voice") or self.TLD_VOICES.get(voice.get("tld"), voice.get("lang", "en"))
+        speed = self.words_per_minute // 2 if voice.get("slow") else self.words_per_minute
+        subprocess.run(
+            [self.executable, "-v", espeak_voice, "-s", str(speed), "-w", output_path, "--stdin"],
+            input=text.encode("utf-8"),
+            check=True,
+            capture_output=True,
+        )
+
+
+class SilentBackend(TTSBackend):
+    """Deterministic stand-in that writes silent MP3 audio.
+
+    Clip length follows the text length (about 150 words per minute), and an
+    optional artificial latency imitates a remote engine for load tests.
+    """
+
+    name = "silent"
+    extension = ".mp3"
+
+    def __init__(self, latency_seconds: float = 0.0, words_per_minute: int = 150):
+        self.latency_seconds = latency_seconds
+        self.words_per_minute = words_per_minute
+
+    def synthesize(self, text: str, output_path: str, voice: Dict):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        seconds = len(text.split()) * 60.0 / self.words_per_minute
+        with open(output_path, "wb") as f:
+            f.write(silence(seconds))
+
+
+BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    EspeakBackend.name: EspeakBackend,
+    SilentBackend.name: SilentBackend,
+}
+
+
+def create_backend(name: str, **options) -> TTSBackend:
+    """Instantiate a backend by name ("gtts", "espeak" or "silent")."""
+    try:
+        return BACKENDS[name](**options)
+    except KeyError:
+        raise ValueError(f"Unknown TTS backend '{name}'. Available: {', '.join(BACKENDS)}")
@@ -1,93 +1,213 @@
 """
 Text-to-Speech System for Debate Agents
-Generates audio files using gTTS for agent speeches.
+Generates audio files for agent speeches through a pluggable backend
+(gTTS by default; see core/tts_backends.py).
 """
 
 import os
-from gtts import gTTS
+import re
 from pathlib import Path
-import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set
+
+from core.audio_cache import DEFAULT_MAX_BYTES, AudioCache, audio_cache_key
+from core.audio_export import DEFAULT_PAUSE_SECONDS, export_cache_key, segment_title, stitch_mp3
+from core.tts_backends import TTSBackend, create_backend
+
+
+# Sentence end: terminal punctuation (optionally followed by a closing quote)
+# and whitespace before the next sentence.
+SENTENCE_BOUNDARY = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\u201d\')]))\s+')
+
+# Sentences shorter than this are merged into the next chunk to avoid tiny clips
+MIN_CHUNK_CHARS = 40
+
+
+def split_sentences(text: str, min_chars: int = MIN_CHUNK_CHARS) -> List[str]:
+    """Split text into sentence chunks, merging very short sentences forward."""
+    chunks = []
+    pending = ""
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        pending = f"{pending} {sentence}" if pending else sentence
+        if len(pending) >= min_chars:
+            chunks.append(pending)
+            pending = ""
+    if pending:
+        if chunks and len(pending) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+# Voice used for agents without their own entry in voice_configs
+DEFAULT_VOICE = {"lang": "en", "tld": "com", "slow": False, "backend": "gtts"}
+
+
+def _remove_partial(path: str):
+    """Delete a temp file left by a failed write, if it exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 class TTSManager:
     """Manages text-to-speech generation and audio file caching."""
     
-    def __init__(self, audio_dir: str = "audio_files"):
+    def __init__(self, audio_dir: str = "audio_files", backend: str = None,
+                 max_cache_bytes: int = None, chunk_workers: int = 4):
+        """
+        Args:
+            audio_dir: Directory for generated audio files
+            backend: Force every voice onto this backend ("gtts", "espeak",
+                "silent"); defaults to the TTS_BACKEND environment variable,
+                else each voice's own "backend" setting
+            max_cache_bytes: Disk budget for cached audio; defaults to the
+                AUDIO_CACHE_MAX_MB environment variable, else 200 MB
+            chunk_workers: Simultaneous TTS requests for sentence chunks,
+                shared by every generate_speech_chunks call
+        """
         self.audio_dir = Path(audio_dir)
         self.audio_dir.mkdir(exist_ok=True)
+        if max_cache_bytes is None:
+            max_mb = os.getenv("AUDIO_CACHE_MAX_MB")
+            max_cache_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        self.cache = AudioCache(str(self.audio_dir), max_cache_bytes)
+        self.backend_override = backend or os.getenv("TTS_BACKEND") or None
+        self._backends: Dict[str, TTSBackend] = {}
+        self._backends_lock = threading.Lock()
+        # One pool for all chunked speech, instead of one per message and rerun
+        self._chunk_pool = ThreadPoolExecutor(max_workers=max(1, chunk_workers), thread_name_prefix="tts-chunk")
         
         # Voice configurations for different agent personalities
-        # gTTS supports different accents/languages
+        # gTTS supports different accents/languages; "backend" picks the engine
         self.voice_configs = {
             # Debaters
-            "Athena": {"lang": "en", "tld": "co.uk", "slow": False},      # British - calm, analytical
-            "Hermes": {"lang": "en", "tld": "com.au", "slow": False},     # Australian - witty, energetic
-            "Daedalus": {"lang": "en", "tld": "com", "slow": False},      # American - strategic
-            "Artemis": {"lang": "en", "tld": "ca", "slow": False},        # Canadian - empathetic
-            "Zephyr": {"lang": "en", "tld": "co.in", "slow": False},      # Indian - charismatic
+            "Athena": {"lang": "en", "tld": "co.uk", "slow": False, "backend": "gtts"},      # British - calm, analytical
+            "Hermes": {"lang": "en", "tld": "com.au", "slow": False, "backend": "gtts"},     # Australian - witty, energetic
+            "Daedalus": {"lang": "en", "tld": "com", "slow": False, "backend": "gtts"},      # American - strategic
+            "Artemis": {"lang": "en", "tld": "ca", "slow": False, "backend": "gtts"},        # Canadian - empathetic
+            "Zephyr": {"lang": "en", "tld": "co.in", "slow": False, "backend": "gtts"},      # Indian - charismatic
             
             # Judges
-            "Solon": {"lang": "en", "tld": "co.uk", "slow": False},       # British - wise
-            "Themis": {"lang": "en", "tld": "com", "slow": False},        # American - precise
-            "Minerva": {"lang": "en", "tld": "co.uk", "slow": False},     # British - academic
-            "Apollo": {"lang": "en", "tld": "com.au", "slow": False},     # Australian - expressive
-            "Atharva": {"lang": "en", "tld": "co.in", "slow": False},     # Indian - modern
+            "Solon": {"lang": "en", "tld": "co.uk", "slow": False, "backend": "gtts"},       # British - wise
+            "Themis": {"lang": "en", "tld": "com", "slow": False, "backend": "gtts"},        # American - precise
+            "Minerva": {"lang": "en", "tld": "co.uk", "slow": False, "backend": "gtts"},     # British - academic
+            "Apollo": {"lang": "en", "tld": "com.au", "slow": False, "backend": "gtts"},     # Australian - expressive
+            "Atharva": {"lang": "en", "tld": "co.in", "slow": False, "backend": "gtts"},     # Indian - modern
         }
     
-    def _generate_audio_filename(self, agent_name: str, text: str) -> str:
-        """Generate a unique filename based on agent and text content."""
-        # Create hash of text for unique identification
-        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-        filename = f"{agent_name}_{text_hash}.mp3"
-        return str(self.audio_dir / filename)
+    def get_voice_config(self, agent_name: str) -> dict:
+        """Voice settings for an agent, with the backend override applied."""
+        voice_config = dict(self.voice_configs.get(agent_name, DEFAULT_VOICE))
+        voice_config.setdefault("backend", DEFAULT_VOICE["backend"])
+        if self.backend_override:
+            voice_config["backend"] = self.backend_override
+        return voice_config
+    
+    def register_backend(self, backend: TTSBackend):
+        """Use a pre-configured backend instance (e.g. a SilentBackend with latency)."""
+        with self._backends_lock:
+            self._backends[backend.name] = backend
     
-    def generate_speech(self, agent_name: str, text: str) -> str:
+    def get_backend(self, name: str) -> TTSBackend:
+        """Return the backend instance for a name, creating it on first use."""
+        with self._backends_lock:
+            if name not in self._backends:
+                self._backends[name] = create_backend(name)
+            return self._backends[name]
+    
+    def generate_speech(self, agent_name: str, text: str, pins: Optional[Set[str]] = None) -> str:
         """
         Generate speech audio for the given text.
         
         Args:
             agent_name: Name of the agent speaking
             text: Text to convert to speech
+            pins: Pin set from cache.pinned(); keeps the clip from being evicted
+                while the caller still uses the path
             
         Returns:
             Path to the generated audio file
         """
-        # Check cache first
-        audio_path = self._generate_audio_filename(agent_name, text)
-        
-        if os.path.exists(audio_path):
-            # Audio already generated, return cached version
-            return audio_path
-        
-        # Get voice configuration for this agent
-        voice_config = self.voice_configs.get(
-            agent_name, 
-            {"lang": "en", "tld": "com", "slow": False}  # Default
-        )
+        # Get voice configuration (and engine) for this agent
+        voice_config = self.get_voice_config(agent_name)
         
         try:
-            # Generate speech
-            tts = gTTS(
-                text=text,
-                lang=voice_config["lang"],
-                tld=voice_config["tld"],
-                slow=voice_config["slow"]
-            )
+            backend = self.get_backend(voice_config["backend"])
+            
+            # Check cache first; the key covers the text and the whole voice config
+            cache_key = audio_cache_key(text, voice_config)
+            audio_path = self.cache.get(cache_key, pins)
+            if audio_path:
+                # Audio already generated, return cached version
+                return audio_path
             
-            # Save to file
-            tts.save(audio_path)
-            return audio_path
+            # Save to a temp file first so concurrent readers never see a partial file
+            tmp_path = f"{self.cache.path_for(cache_key, backend.extension)}.{threading.get_ident()}.part"
+            try:
+                backend.synthesize(text, tmp_path, voice_config)
+                return self.cache.put(cache_key, tmp_path, backend.extension, agent_name, pins)
+            except Exception:
+                _remove_partial(tmp_path)
+                raise
             
         except Exception as e:
             print(f"Error generating speech for {agent_name}: {e}")
             return None
     
-    def generate_debate_audio(self, debate_data: dict) -> dict:
+    def generate_speech_chunks(self, agent_name: str, text: str,
+                               pins: Optional[Set[str]] = None) -> Iterator[str]:
+        """
+        Generate speech sentence by sentence and yield audio files in order.
+        
+        All chunks are synthesized in parallel on the manager's chunk pool,
+        but paths are yielded in text order as soon as each one (and every
+        chunk before it) is ready, so playback can start after the first
+        sentence. Each chunk is cached on its own, so sentences repeated
+        across speeches are reused.
+        
+        Args:
+            agent_name: Name of the agent speaking
+            text: Text to convert to speech
+            pins: Pin set from cache.pinned(); keeps yielded chunks from being
+                evicted before the caller has read them
+            
+        Yields:
+            Paths to the generated chunk audio files (failed chunks are skipped)
+        """
+        chunks = split_sentences(str(text))
+        if not chunks:
+            return
+        
+        futures = [self._chunk_pool.submit(self.generate_speech, agent_name, chunk, pins) for chunk in chunks]
+        try:
+            for future in futures:
+                audio_path = future.result()
+                if audio_path:
+                    yield audio_path
+        finally:
+            # Consumer may stop early (e.g. page rerun); drop chunks not yet started
+            for future in futures:
+                future.cancel()
+    
+    def generate_debate_audio(self, debate_data: dict, concurrent: bool = True,
+                              max_workers: int = 7, pins: Optional[Set[str]] = None) -> dict:
         """
         Generate audio files for all parts of a debate.
         
         Args:
             debate_data: Dictionary containing debate transcript
+            concurrent: Synthesize all segments at once on a thread pool, so the
+                total time is roughly that of the slowest segment
+            max_workers: Upper bound on simultaneous TTS requests
+            pins: Pin set from cache.pinned(); without it, earlier segments may be
+                evicted while later ones are generated if the budget is small
             
         Returns:
             Dictionary mapping segment IDs to audio file paths
@@ -105,37 +225,116 @@ class TTSManager:
             ("verdict", debate_data.get("judge_name"), debate_data.get("verdict")),
         ]
         
+        # Convert text to string if it's a CrewOutput object; identical
+        # (agent, text) pairs are synthesized once and shared.
+        requests = {}
+        for segment_id, agent_name, text in segments:
+            if agent_name and text:
+                requests.setdefault((agent_name, str(text)), []).append(segment_id)
+        
+        if not concurrent or len(requests) <= 1:
+            results = {key: self.generate_speech(*key, pins=pins) for key in requests}
+        else:
+            workers = max(1, min(max_workers, len(requests)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {key: pool.submit(self.generate_speech, *key, pins=pins) for key in requests}
+                results = {key: future.result() for key, future in futures.items()}
+        
+        # Preserve the original segment order in the returned mapping
         for segment_id, agent_name, text in segments:
             if agent_name and text:
-                # Convert text to string if it's a CrewOutput object
-                text_str = str(text)
-                audio_path = self.generate_speech(agent_name, text_str)
+                audio_path = results.get((agent_name, str(text)))
                 if audio_path:
                     audio_files[segment_id] = audio_path
         
         return audio_files
     
-    def cleanup_old_audio(self, keep_recent: int = 50):
+    def export_debate_audio(self, debate_data: dict, title: str = "",
+                            pause_seconds: float = DEFAULT_PAUSE_SECONDS) -> Optional[str]:
+        """
+        Build a single MP3 of the whole debate with chapter markers.
+        
+        Segments are synthesized (or taken from the cache) as usual, then
+        joined without re-encoding. The combined file is cached under the
+        segment hashes, so exporting the same debate again is a lookup.
+        
+        Args:
+            debate_data: Same shape as for generate_debate_audio
+            title: Title tag for the file
+            pause_seconds: Silence between turns
+            
+        Returns:
+            Path to the combined MP3, or None if no MP3 segments are available
+        """
+        # Hold the segments until they are stitched, so a small cache budget
+        # cannot evict one clip while later ones are generated or read
+        with self.cache.pinned() as pins:
+            audio_files = self.generate_debate_audio(debate_data, pins=pins)
+            segments = []
+            for segment_id, audio_path in audio_files.items():
+                if audio_path.endswith(".mp3"):
+                    segments.append((segment_title(segment_id, debate_data), audio_path))
+                else:
+                    print(f"Skipping {segment_id} in debate export: not an MP3 clip")
+            if not segments:
+                return None
+            
+            cache_key = export_cache_key(segments, pause_seconds, title)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return cached_path
+            
+            tmp_path = f"{self.cache.path_for(cache_key, '.mp3')}.{threading.get_ident()}.part"
+            try:
+                stitch_mp3(segments, tmp_path, pause_seconds, title)
+            except Exception as e:
+                print(f"Error exporting debate audio: {e}")
+                _remove_partial(tmp_path)
+                return None
+        
+        # Added once the segments are released, so they are evicted before it
+        try:
+            return self.cache.put(cache_key, tmp_path, ".mp3", "debate-export")
+        except Exception as e:
+            print(f"Error exporting debate audio: {e}")
+            _remove_partial(tmp_path)
+            return None
+    
+    def cleanup_old_audio(self, keep_recent: Optional[int] = None, *, max_bytes: int = None):
         """
         Clean up old audio files to save disk space.
         
+        Evicts least recently used clips until the cache fits its byte budget
+        (and `keep_recent`, if given) and removes files the cache index does
+        not track.
+        
         Args:
-            keep_recent: Number of most recent files to keep
+            keep_recent: Number of most recently used clips to keep
+            max_bytes: New byte budget (default: keep the configured one)
         """
         try:
-            audio_files = sorted(
-                self.audio_dir.glob("*.mp3"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
-            
-            # Delete old files beyond keep_recent
-            for old_file in audio_files[keep_recent:]:
-                old_file.unlink()
-                
+            self.cache.remove_untracked()
+            self.cache.enforce_budget(max_bytes, max_entries=keep_recent)
         except Exception as e:
             print(f"Error cleaning up audio files: {e}")
 
 
-# Global TTS manager instance
-tts_manager = TTSManager()
+# Shared TTS manager, created on first use (creating it makes the audio directory)
+_tts_manager = None
+_tts_manager_lock = threading.Lock()
+
+
+def get_tts_manager() -> TTSManager:
+    """Return the shared TTSManager."""
+    global _tts_manager
+    if _tts_manager is None:
+        with _tts_manager_lock:
+            if _tts_manager is None:
+                _tts_manager = TTSManager()
+    return _tts_manager
+
+
+def __getattr__(name):
+    if name == "tts_manager":
+        return get_tts_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,241 @@
+"""
+LLM Usage Metering
+Records prompt/completion tokens and latency for each LLM call of a debate,
+rolls them up per agent and round type with an estimated cost, and enforces
+an optional per-debate token budget.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.prompts import estimate_tokens
+
+
+# USD per million (prompt, completion) tokens. LLM_PRICE_PER_MTOK="in,out"
+# overrides the table, e.g. for other providers or updated prices.
+MODEL_PRICES_PER_MTOK = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+# Model CrewAI agents use when OPENAI_MODEL_NAME is not set
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# Rounds whose calls are made by the judge rather than a debater
+JUDGE_ROUNDS = ("verdict", "rating")
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """Raised when a debate's LLM calls go over its token budget; `usage` holds the summary so far."""
+
+    def __init__(self, message: str, usage: Dict):
+        super().__init__(message)
+        self.usage = usage
+
+
+def model_prices(model: str) -> Optional[Tuple[float, float]]:
+    """(prompt, completion) USD per million tokens for a model, or None if unknown."""
+    override = os.getenv("LLM_PRICE_PER_MTOK")
+    if override:
+        try:
+            prompt_price, completion_price = (float(v) for v in override.split(","))
+            return prompt_price, completion_price
+        except ValueError:
+            print(f"Ignoring malformed LLM_PRICE_PER_MTOK={override!r} (expected 'prompt,completion')")
+    return MODEL_PRICES_PER_MTOK.get(model)
+
+
+def usage_from_output(output, prompt: str) -> Dict:
+    """
+    Token counts for one call.
+
+    CrewAI reports them on the CrewOutput (`token_usage`); outputs without
+    them (plain strings from fake runners, older CrewAI versions) are
+    estimated from the prompt and response text and flagged as such.
+    """
+    metrics = getattr(output, "token_usage", None)
+    prompt_tokens = getattr(metrics, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(metrics, "completion_tokens", 0) or 0
+    if prompt_tokens or completion_tokens:
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_prompt_tokens": getattr(metrics, "cached_prompt_tokens", 0) or 0,
+            "estimated": False,
+        }
+    return {
+        "prompt_tokens": estimate_tokens(prompt),
+        "completion_tokens": estimate_tokens(str(output)),
+        "cached_prompt_tokens": 0,
+        "estimated": True,
+    }
+
+
+def _rollup(calls: Iterable[Dict], prices: Optional[Tuple[float, float]]) -> Dict:
+    """Sum tokens and latency over calls, priced when the model's rates are known."""
+    total = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "latency_s": 0.0}
+    for call in calls:
+        total["calls"] += 1
+        total["prompt_tokens"] += call["prompt_tokens"]
+        total["completion_tokens"] += call["completion_tokens"]
+        total["total_tokens"] += call["prompt_tokens"] + call["completion_tokens"]
+        total["latency_s"] += call["latency_s"]
+    total["latency_s"] = round(total["latency_s"], 3)
+    total["cost_usd"] = (
+        round((total["prompt_tokens"] * prices[0] + total["completion_tokens"] * prices[1]) / 1e6, 6)
+        if prices else None
+    )
+    return total
+
+
+class UsageMeter:
+    """Per-debate record of LLM calls.
+
+    Task runners are wrapped (see call/track) so every call is timed and its
+    token usage recorded under the speaking agent and the round type.
+    """
+
+    def __init__(self, token_budget: Optional[int] = None, model: Optional[str] = None,
+                 on_exceeded: Optional[Callable[[Dict], None]] = None):
+        """
+        Args:
+            token_budget: Maximum prompt + completion tokens for the debate;
+                defaults to the DEBATE_TOKEN_BUDGET env var (unset or 0: no limit)
+            model: Model name used for pricing; defaults to OPENAI_MODEL_NAME
+            on_exceeded: Called with the usage summary (including "aborted")
+                just before TokenBudgetExceeded is raised, so the spend of an
+                aborted debate can be kept
+        """
+        budget = token_budget if token_budget is not None else os.getenv("DEBATE_TOKEN_BUDGET")
+        self.token_budget = int(budget) if budget else None
+        self.model = model or os.getenv("OPENAI_MODEL_NAME") or DEFAULT_MODEL
+        self.on_exceeded = on_exceeded
+        self.calls: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @property
+    def total_tokens(self) -> int:
+        with self._lock:
+            return sum(call["prompt_tokens"] + call["completion_tokens"] for call in self.calls)
+
+    def record(self, agent_name: str, round_type: str, usage: Dict, latency_s: float):
+        """
+        Add one call's usage.
+
+        Raises:
+            TokenBudgetExceeded: If the debate is now over its token budget
+        """
+        call = dict(
+            usage,
+            agent=agent_name,
+            role="judge" if round_type in JUDGE_ROUNDS else "debater",
+            round=round_type,
+            latency_s=round(latency_s, 3),
+        )
+        with self._lock:
+            self.calls.append(call)
+        used = self.total_tokens
+        if self.token_budget is not None and used > self.token_budget:
+            self._exceeded(f"Debate used {used} tokens, over its budget of {self.token_budget} "
+                           f"(stopped after {round_type})")
+
+    def check_budget(self, round_type: str, prompt: str):
+        """
+        Refuse a call whose prompt alone would not fit in the remaining budget.
+
+        Raises:
+            TokenBudgetExceeded: If the debate cannot afford the call
+        """
+        if self.token_budget is None:
+            return
+        used = self.total_tokens
+        needed = estimate_tokens(prompt)
+        if used + needed > self.token_budget:
+            self._exceeded(f"Debate has {max(0, self.token_budget - used)} of its {self.token_budget} tokens "
+                           f"left, not enough for the {round_type} prompt (~{needed} tokens)")
+
+    def _exceeded(self, message: str):
+        usage = dict(self.summary(), aborted=message)
+        if self.on_exceeded:
+            try:
+                self.on_exceeded(usage)
+            except Exception as e:
+                print(f"Error recording usage of an aborted debate: {e}")
+        raise TokenBudgetExceeded(message, usage)
+
+    def call(self, round_type: str, runner: Callable, agent, prompt: str, *args):
+        """Run `runner(agent, prompt, *args)` if the budget allows and record its usage; returns the runner's output."""
+        self.check_budget(round_type, prompt)
+        start = time.perf_counter()
+        output = runner(agent, prompt, *args)
+        self.record(agent.name, round_type, usage_from_output(output, prompt), time.perf_counter() - start)
+        return output
+
+    def track(self, round_type: str, runner: Callable) -> Callable:
+        """`runner` with the same signature, recording every call under `round_type`."""
+        return lambda agent, prompt, *args: self.call(round_type, runner, agent, prompt, *args)
+
+    def summary(self, include_calls: bool = True) -> Dict:
+        """
+        Usage totals for the debate.
+
+        Returns:
+            {"model", "token_budget", "estimated", "total", "by_agent", "by_round"[, "calls"]}
+            (plus "aborted" with the reason when passed to on_exceeded),
+            where each total has calls, prompt/completion/total tokens, latency_s and
+            cost_usd (None when the model's price is unknown)
+        """
+        with self._lock:
+            calls = list(self.calls)
+        prices = model_prices(self.model)
+        by_agent = {}
+        for name in dict.fromkeys(call["agent"] for call in calls):
+            agent_calls = [call for call in calls if call["agent"] == name]
+            by_agent[name] = dict(_rollup(agent_calls, prices), role=agent_calls[0]["role"])
+        summary = {
+            "model": self.model,
+            "token_budget": self.token_budget,
+            "estimated": any(call["estimated"] for call in calls),
+            "total": _rollup(calls, prices),
+            "by_agent": by_agent,
+            "by_round": {
+                round_type: _rollup((call for call in calls if call["round"] == round_type), prices)
+                for round_type in dict.fromkeys(call["round"] for call in calls)
+            },
+        }
+        if include_calls:
+            summary["calls"] = calls
+        return summary
+
+
+def aggregate_usage(debates: Iterable[Dict], group_by: str = "round") -> Dict[str, Dict]:
+    """
+    Roll stored per-call usage up across debates.
+
+    Args:
+        debates: Debate records (those without a "usage" entry are skipped)
+        group_by: "round", "agent" or "role"
+
+    Returns:
+        {group: totals} like UsageMeter.summary's, plus "debates" per group
+    """
+    groups: Dict[str, Dict] = {}
+    for debate in debates:
+        usage = debate.get("usage")
+        if not usage:
+            continue
+        prices = model_prices(usage.get("model", DEFAULT_MODEL))
+        for key in dict.fromkeys(call[group_by] for call in usage.get("calls", [])):
+            totals = _rollup((call for call in usage["calls"] if call[group_by] == key), prices)
+            group = groups.setdefault(key, {"debates": 0, "calls": 0, "prompt_tokens": 0,
+                                            "completion_tokens": 0, "total_tokens": 0,
+                                            "latency_s": 0.0, "cost_usd": None})
+            group["debates"] += 1
+            for field in ("calls", "prompt_tokens", "completion_tokens", "total_tokens", "latency_s"):
+                group[field] += totals[field]
+            if totals["cost_usd"] is not None:
+                group["cost_usd"] = (group["cost_usd"] or 0.0) + totals["cost_usd"]
+    return dict(sorted(groups.items(), key=lambda item: item[1]["total_tokens"], reverse=True))
@@ -0,0 +1,85 @@
+"""AudioCache eviction while clips are pinned by a request."""
+
+import os
+
+from core.audio_cache import AudioCache
+from core.tts_system import TTSManager
+
+
+def put(cache, tmp_path, key, size, pins=None):
+    source = tmp_path / f"{key}.part"
+    source.write_bytes(b"x" * size)
+    return cache.put(key, str(source), ".mp3", "test", pins)
+
+
+def test_lru_eviction(tmp_path):
+    cache = AudioCache(str(tmp_path / "cache"), max_bytes=250)
+    first = put(cache, tmp_path, "a", 100)
+    put(cache, tmp_path, "b", 100)
+    cache.get("a")
+    put(cache, tmp_path, "c", 100)
+    # "b" was least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == first and os.path.exists(first)
+
+
+def test_pinned_clips_survive_until_released(tmp_path):
+    cache = AudioCache(str(tmp_path / "cache"), max_bytes=150)
+    with cache.pinned() as pins:
+        paths = [put(cache, tmp_path, key, 100, pins) for key in "abc"]
+        assert all(os.path.exists(path) for path in paths)
+        assert cache.total_bytes == 300
+        # Unpinned clips are still evicted as usual
+        put(cache, tmp_path, "d", 100)
+        put(cache, tmp_path, "e", 100)
+        assert cache.get("d") is None
+    assert cache.total_bytes <= 150
+    assert cache.get("e") is not None
+
+
+def test_export_with_cache_smaller_than_debate(tmp_path):
+    manager = TTSManager(audio_dir=str(tmp_path / "audio"), backend="silent", max_cache_bytes=20000)
+    speech = " ".join(["argument"] * 150)
+    debate = {"debater1_name": "Athena", "debater2_name": "Blaze", "judge_name": "Solon", "verdict": speech}
+    for key in ("opening_for", "opening_against", "rebuttal_for", "rebuttal_against",
+                "closing_for", "closing_against"):
+        debate[key] = f"{speech} {key}"
+
+    path = manager.export_debate_audio(debate, title="Debate")
+    assert path and os.path.getsize(path) > 7 * 200000
+    assert manager.cache.total_bytes == os.path.getsize(path)
+
+
+def test_failed_export_leaves_no_partial_file(tmp_path, monkeypatch):
+    import core.tts_system
+
+    def broken_stitch(segments, output_path, *args):
+        with open(output_path, "wb") as f:
+            f.write(b"half")
+        raise ValueError("disk full")
+
+    monkeypatch.setattr(core.tts_system, "stitch_mp3", broken_stitch)
+    manager = TTSManager(audio_dir=str(tmp_path / "audio"), backend="silent")
+    debate = {"debater1_name": "Athena", "opening_for": "Hello there.", "judge_name": "Solon", "verdict": "Done."}
+
+    assert manager.export_debate_audio(debate) is None
+    assert not [name for name in os.listdir(tmp_path / "audio") if name.endswith(".part")]
+
+
+def test_chunks_stay_readable_with_a_tiny_budget(tmp_path):
+    manager = TTSManager(audio_dir=str(tmp_path / "audio"), backend="silent", max_cache_bytes=1000)
+    text = " ".join(f"Sentence number {index} makes a point about the motion." for index in range(6))
+    with manager.cache.pinned() as pins:
+        paths = list(manager.generate_speech_chunks("Athena", text, pins=pins))
+        assert len(paths) > 1 and all(os.path.exists(path) for path in paths)
+    assert manager.cache.total_bytes <= 1000
+
+
+def test_cleanup_keeps_recent_clips(tmp_path):
+    manager = TTSManager(audio_dir=str(tmp_path / "audio"), backend="silent")
+    paths = [manager.generate_speech("Athena", f"Point number {index}.") for index in range(5)]
+    manager.cleanup_old_audio(3)
+    assert [os.path.exists(path) for path in paths] == [False, False, True, True, True]
+    assert manager.cache.max_bytes > 1000
+    manager.cleanup_old_audio(max_bytes=0)
+    assert not any(os.path.exists(path) for path in paths)
@@ -0,0 +1,53 @@
+"""Keyword scoring and negation in FeedbackAnalyzer."""
+
+import pytest
+
+from core.feedback_analyzer import FeedbackAnalyzer, feedback_analyzer
+
+
+def test_plain_terms_and_prefix_matches():
+    result = feedback_analyzer.analyze("Strong, logically sound and well-structured, but weakness in rebuttal.")
+    assert result["positive"] == {"strong": 1.0, "logical": 1.0, "well-structured": 1.2}
+    assert result["negative"] == {"weak": 1.0}
+
+
+def test_negated_positive_becomes_weakness():
+    result = feedback_analyzer.analyze("The case was not convincing.")
+    assert result["positive"] == {}
+    assert result["negative"] == {"not convincing": pytest.approx(0.8)}
+
+
+def test_negated_negative_is_ignored():
+    result = feedback_analyzer.analyze("The delivery was never weak or unclear.")
+    assert result == {"positive": {}, "negative": {}}
+
+
+@pytest.mark.parametrize("feedback", [
+    "Not bad. Persuasive overall.",                   # punctuation ends the scope
+    "Not flashy, but persuasive.",                    # so does a comma
+    "Hardly any jokes but persuasive.",               # and a contrast word
+    "Not the kind of speaker who is usually persuasive.",  # beyond the window
+])
+def test_negation_scope_ends(feedback):
+    assert feedback_analyzer.analyze(feedback)["positive"] == {"persuasive": 1.0}
+
+
+def test_contractions_negate():
+    result = feedback_analyzer.analyze("Her rebuttal wasn't effective")
+    assert result["negative"] == {"not effective": pytest.approx(0.8)}
+
+
+def test_repeated_terms_accumulate():
+    result = feedback_analyzer.analyze("Strong opening. Strong close.")
+    assert result["positive"] == {"strong": 2.0}
+
+
+def test_custom_lexicon_and_window():
+    analyzer = FeedbackAnalyzer(lexicon={"clear": ("positive", 2.0)}, negation_window=1, negated_weight=0.5)
+    assert analyzer.analyze("not very clear")["positive"] == {"clear": 2.0}
+    assert analyzer.analyze("not clear")["negative"] == {"not clear": 1.0}
+
+
+def test_empty_feedback():
+    assert feedback_analyzer.analyze("") == {"positive": {}, "negative": {}}
+    assert feedback_analyzer.analyze(None) == {"positive": {}, "negative": {}}
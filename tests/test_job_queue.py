@@ -0,0 +1,55 @@
+"""Retention of finished debate jobs."""
+
+import json
+import os
+
+from core.job_queue import COMPLETED, INTERRUPTED, DebateJobQueue
+
+
+def runner(**params):
+    params["on_turn"]({"type": "turn", "text": params["topic"]})
+
+
+def submit(queue, topic):
+    return queue.submit("Athena", "Blaze", "for", "Solon", topic)
+
+
+def test_only_recent_finished_jobs_are_kept(tmp_path):
+    queue = DebateJobQueue(str(tmp_path), max_workers=1, runner=runner, keep_finished=3)
+    job_ids = []
+    for index in range(5):
+        job_ids.append(submit(queue, f"Topic {index}"))
+        # One at a time, so finish times follow submission order
+        list(queue.events(job_ids[-1]))
+    queue.shutdown()
+
+    kept = [job["id"] for job in queue.list_jobs()]
+    assert sorted(kept) == sorted(job_ids[2:])
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{job_id}.json" for job_id in job_ids[2:])
+    assert queue.get(job_ids[0]) is None
+    assert all(job["status"] == COMPLETED for job in queue.list_jobs())
+
+
+def test_startup_prunes_and_interrupts(tmp_path):
+    for index in range(4):
+        job = {"id": f"old{index}", "status": COMPLETED, "params": {}, "stage": None, "events": [],
+               "created": f"2026-01-0{index + 1}T00:00:00", "finished": f"2026-01-0{index + 1}T01:00:00"}
+        (tmp_path / f"old{index}.json").write_text(json.dumps(job))
+    running = {"id": "live", "status": "running", "params": {}, "stage": "opening", "events": [],
+               "created": "2025-12-01T00:00:00", "finished": None}
+    (tmp_path / "live.json").write_text(json.dumps(running))
+
+    queue = DebateJobQueue(str(tmp_path), runner=runner, keep_finished=2)
+    queue.shutdown()
+    # The interrupted job just finished, so it is the newest
+    assert queue.get("live")["status"] == INTERRUPTED
+    assert sorted(job["id"] for job in queue.list_jobs()) == ["live", "old3"]
+    assert not (tmp_path / "old0.json").exists()
+
+
+def test_keep_everything(tmp_path):
+    queue = DebateJobQueue(str(tmp_path), runner=runner, keep_finished=None)
+    for index in range(3):
+        list(queue.events(submit(queue, f"Topic {index}")))
+    queue.shutdown()
+    assert len(queue.list_jobs()) == 3
@@ -0,0 +1,51 @@
+"""Repair of malformed judge JSON (_scan_json_object / extract_json_object)."""
+
+import json
+
+import pytest
+
+from core.rating_system import _scan_json_object, extract_json_object
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Prose and code fences around the object
+    ('Here are the scores:\n```json\n{"a": 1, "b": "x"}\n```\nThanks!', {"a": 1, "b": "x"}),
+    # Trailing commas before closers
+    ('{"a": [1, 2,], "b": {"c": 3,},}', {"a": [1, 2], "b": {"c": 3}}),
+    # Braces and quotes inside strings do not end the object
+    ('{"a": "has } and \\" inside", "b": 2} trailing {"c": 3}', {"a": 'has } and " inside', "b": 2}),
+    # Truncated in the middle of a string value
+    ('{"a": 1, "b": {"c": "cut of', {"a": 1, "b": {"c": "cut of"}}),
+    # Truncated after a key, with or without its colon
+    ('{"a": 1, "b": {"c": 2}, "d"', {"a": 1, "b": {"c": 2}}),
+    ('{"a": 1, "d": ', {"a": 1}),
+    # Truncated after a comma
+    ('{"a": [1, 2,', {"a": [1, 2]}),
+])
+def test_extract_repairs(text, expected):
+    assert extract_json_object(text) == expected
+
+
+def test_scanned_candidate_is_valid_json():
+    candidate = _scan_json_object('noise {"debater1": {"overall": 4, "criteria": {"logic": 5,')
+    assert json.loads(candidate) == {"debater1": {"overall": 4, "criteria": {"logic": 5}}}
+
+
+def test_escape_at_truncation_point():
+    # The dangling backslash would escape the closing quote added by the repair
+    assert extract_json_object('{"a": "line\\') == {"a": "line"}
+
+
+def test_cut_back_to_last_complete_member():
+    # A bare word value cannot be closed into valid JSON; the member is dropped
+    assert extract_json_object('{"a": 1, "b": tru') == {"a": 1}
+
+
+@pytest.mark.parametrize("text", ["", None, "no json here", "[1, 2, 3]", '{"a": }'])
+def test_unrecoverable_returns_none(text):
+    assert extract_json_object(text) is None
+
+
+def test_backticks_inside_strings_are_kept():
+    text = '```json\n{"feedback": "Quoted ```python print()``` and `x`"}\n```'
+    assert extract_json_object(text) == {"feedback": "Quoted ```python print()``` and `x`"}
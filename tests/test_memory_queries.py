@@ -0,0 +1,116 @@
+"""Cursor pagination of DebateMemory.query_debates."""
+
+import threading
+
+import pytest
+
+from core.memory_system import DebateMemory
+
+
+DEBATERS = ["Athena", "Blaze", "Cipher"]
+JUDGES = ["Justice", "Wisdom"]
+
+
+def save(memory, index):
+    debater1 = DEBATERS[index % 3]
+    debater2 = DEBATERS[(index + 1) % 3]
+    return memory.save_debate(
+        topic=f"Topic {index}" + (" about energy" if index % 4 == 0 else ""),
+        debater1_name=debater1,
+        debater2_name=debater2,
+        debater1_stance="for",
+        debater2_stance="against",
+        judge_name=JUDGES[index % 2],
+        debate_transcript={"opening_for": "yes", "opening_against": "no"},
+        verdict=f"Winner: {debater1}",
+        debater1_rating=4,
+        debater2_rating=3,
+        debater1_feedback="Strong and logical.",
+        debater2_feedback="Weak rebuttal.",
+    )
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = DebateMemory(str(tmp_path / "debate_history.json"))
+    with memory.bulk():
+        for index in range(23):
+            save(memory, index)
+    yield memory
+    memory.rubric_store.close()
+
+
+def walk(memory, **query):
+    """IDs of every page, following next_cursor until the last page."""
+    pages = []
+    cursor = None
+    while True:
+        page = memory.query_debates(cursor=cursor, **query)
+        pages.append([debate["id"] for debate in page["debates"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_every_debate_newest_first(memory):
+    pages = walk(memory, limit=10)
+    assert [len(page) for page in pages] == [10, 10, 3]
+    assert sum(pages, []) == list(range(23, 0, -1))
+
+
+def test_oldest_first(memory):
+    pages = walk(memory, limit=10, newest_first=False)
+    assert sum(pages, []) == list(range(1, 24))
+
+
+def test_filters_and_total(memory):
+    page = memory.query_debates(limit=5, debater="Athena", judge="Justice")
+    expected = [
+        debate["id"] for debate in memory.get_all_debates()
+        if debate["judge"] == "Justice"
+        and "Athena" in (debate["participants"]["debater1"]["name"], debate["participants"]["debater2"]["name"])
+    ]
+    assert page["total"] == len(expected)
+    assert sum(walk(memory, limit=5, debater="Athena", judge="Justice"), []) == expected[::-1]
+
+    topic_ids = sum(walk(memory, limit=2, topic="ENERGY"), [])
+    assert topic_ids == [debate["id"] for debate in memory.get_all_debates()
+                         if "energy" in debate["topic"]][::-1]
+
+
+def test_cursor_is_stable_when_debates_are_added(memory):
+    first = memory.query_debates(limit=10)
+    save(memory, 23)
+    second = memory.query_debates(cursor=first["next_cursor"], limit=10)
+    # New debates appear on page one only; the next page continues where the old one stopped
+    assert [debate["id"] for debate in second["debates"]] == list(range(13, 3, -1))
+    assert second["total"] == 24
+
+
+def test_unknown_debater_is_empty(memory):
+    assert memory.query_debates(debater="Nobody") == {"debates": [], "next_cursor": None, "total": 0}
+
+
+def test_index_built_while_debates_are_saved(tmp_path):
+    memory = DebateMemory(str(tmp_path / "debate_history.json"))
+    with memory.bulk():
+        for index in range(200):
+            save(memory, index)
+    memory._debater_index = memory._judge_index = None
+
+    def writer():
+        with memory.bulk():
+            for index in range(200, 400):
+                save(memory, index)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while thread.is_alive():
+        memory.query_debates(debater="Athena")
+    thread.join()
+
+    # Every debate is indexed exactly once
+    assert memory.query_debates(limit=1000)["total"] == 400
+    positions = sum(memory._debater_index.values(), [])
+    assert len(positions) == 2 * 400 and len(set(positions)) == 400
+    memory.rubric_store.close()
@@ -0,0 +1,88 @@
+"""MP3 frame parsing, ID3 chapter tags and stitching without re-encoding."""
+
+import pytest
+
+from core.audio_export import stitch_mp3
+from core.mp3_utils import (audio_frames, chapter_tag, frame_duration, frame_length, id3v2_size,
+                            iter_frames, parse_frame_header, silence, silent_frame)
+
+
+def test_frame_length_and_duration():
+    # MPEG-2 Layer III: 72 * bitrate / sample rate bytes, 576 samples per frame
+    assert frame_length(2, 24000, 32) == 96
+    assert frame_length(2, 24000, 32, padding=1) == 97
+    assert frame_length(1, 44100, 128) == 417
+    assert frame_duration(2, 24000) == pytest.approx(0.024)
+
+
+@pytest.mark.parametrize("version, sample_rate, bitrate", [(2, 24000, 32), (1, 44100, 128), (2.5, 8000, 8)])
+def test_silent_frame_round_trips(version, sample_rate, bitrate):
+    frame = silent_frame(version, sample_rate, bitrate)
+    header = parse_frame_header(frame)
+    assert header["version"] == version
+    assert header["sample_rate"] == sample_rate
+    assert header["bitrate_kbps"] == bitrate
+    assert header["length"] == len(frame)
+    assert header["mono"]
+
+
+def test_silence_covers_duration():
+    _, duration, fmt = audio_frames(silence(1.0))
+    assert duration == pytest.approx(1.0, abs=frame_duration(2, 24000))
+    assert fmt["sample_rate"] == 24000
+
+
+def test_iter_frames_skips_tags_info_frame_and_junk():
+    frame = silent_frame()
+    info = bytearray(frame)
+    info[10:14] = b"Info"
+    id3 = chapter_tag([("Intro", 0.0, 1.0)])
+    id3v1 = b"TAG" + bytes(125)
+    data = id3 + bytes(info) + frame + b"\x00junk\xff" + frame * 2 + id3v1
+
+    offsets = [offset for offset, _ in iter_frames(data)]
+    assert len(offsets) == 3
+    assert offsets[:2] == [len(id3) + len(frame), len(id3) + len(frame) * 2 + 6]
+    assert audio_frames(data)[0] == frame * 3
+
+
+def test_chapter_tag_layout():
+    tag = chapter_tag([("Athena — Opening", 0.0, 1.5), ("Verdict", 2.0, 3.25)], title="Debate #1")
+    assert tag[:5] == b"ID3\x03\x00"
+    assert id3v2_size(tag) == len(tag)
+    assert tag.count(b"CHAP") == 2 and tag.count(b"CTOC") == 1
+    assert b"toc\x00\x03\x02chp0\x00chp1\x00" in tag
+
+    second = tag.index(b"chp1\x00", tag.index(b"CHAP"))
+    times = tag[second + 5:second + 13]
+    assert int.from_bytes(times[:4], "big") == 2000
+    assert int.from_bytes(times[4:], "big") == 3250
+    assert "Athena — Opening".encode("utf-16")[2:] in tag
+
+
+def test_stitch_mp3_writes_frames_pauses_and_chapters(tmp_path):
+    paths = []
+    for index, seconds in enumerate((1.0, 0.5)):
+        path = tmp_path / f"clip{index}.mp3"
+        path.write_bytes(chapter_tag([("old", 0.0, 1.0)]) + silence(seconds))
+        paths.append(str(path))
+    output = tmp_path / "debate.mp3"
+
+    chapters = stitch_mp3([("First", paths[0]), ("Second", paths[1])], str(output),
+                          pause_seconds=0.24, title="Debate")
+
+    data = output.read_bytes()
+    frames, duration, _ = audio_frames(data)
+    assert frames == silence(1.0) + silence(0.24) + silence(0.5)
+    assert chapters[0] == ("First", 0.0, pytest.approx(1.0, abs=0.03))
+    assert chapters[1][1] == pytest.approx(chapters[0][2] + 0.24)
+    assert chapters[1][2] == pytest.approx(duration)
+    # Segment tags are replaced by a single chapter tag for the whole file
+    assert data.count(b"ID3") == 1 and "old".encode("utf-16")[2:] not in data
+
+
+def test_stitch_rejects_non_mp3(tmp_path):
+    wav = tmp_path / "clip.wav"
+    wav.write_bytes(b"RIFF" + bytes(100))
+    with pytest.raises(ValueError):
+        stitch_mp3([("Clip", str(wav))], str(tmp_path / "out.mp3"))
@@ -0,0 +1,42 @@
+"""Rubric rows written by DebateMemory.save_debate."""
+
+import pytest
+
+from core.memory_system import DebateMemory
+from core.rating_system import CRITERIA, extract_rubric_details
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = DebateMemory(str(tmp_path / "debate_history.json"))
+    yield memory
+    memory.rubric_store.close()
+
+
+def save(memory, rubric):
+    return memory.save_debate(
+        topic="Should AI have legal rights?", debater1_name="Athena", debater2_name="Blaze",
+        debater1_stance="for", debater2_stance="against", judge_name="Solon",
+        debate_transcript={"opening_for": "yes"}, verdict="Winner: Athena",
+        debater1_rating=4, debater2_rating=2,
+        debater1_feedback="Strong.", debater2_feedback="Weak.", rubric=rubric,
+    )
+
+
+def test_unscored_rubric_writes_no_rows(memory):
+    # Legacy / unparseable ratings produce an all-None rubric
+    debate_id = save(memory, extract_rubric_details({}))
+    assert memory.rubric_store.get_debate_scores(debate_id) == []
+    assert memory.get_rubric_breakdown() == {}
+
+
+def test_missing_overall_falls_back_to_rating(memory):
+    rubric = extract_rubric_details({
+        "debater1": {"criteria": {CRITERIA[0]: 5}},
+        "debater2": {"overall": 3, "criteria": {}},
+    })
+    debate_id = save(memory, rubric)
+    rows = {row["debater"]: row for row in memory.rubric_store.get_debate_scores(debate_id)}
+    assert rows["Athena"]["overall"] == 4 and rows["Athena"][CRITERIA[0]] == 5
+    assert rows["Blaze"]["overall"] == 3
+    assert memory.get_rubric_breakdown()["all"]["count"] == 2
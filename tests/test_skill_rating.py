@@ -0,0 +1,72 @@
+"""Incremental Elo updates against a full recompute from history."""
+
+import random
+
+import pytest
+
+from core.skill_rating import (DEFAULT_RATING, apply_result, expected_score, match_result,
+                               recompute_skill_ratings)
+
+
+NAMES = ["Athena", "Blaze", "Cipher", "Delta"]
+
+
+def debate(name1, name2, rating1, rating2, winner=None):
+    return {
+        "participants": {
+            "debater1": {"name": name1, "rating": rating1},
+            "debater2": {"name": name2, "rating": rating2},
+        },
+        "verdict": f"Reasoning...\nWinner: **{winner}**" if winner else "A close debate.",
+    }
+
+
+def random_history(count, seed=0):
+    rng = random.Random(seed)
+    history = []
+    for _ in range(count):
+        name1, name2 = rng.sample(NAMES, 2)
+        winner = rng.choice([name1, name2, None])
+        history.append(debate(name1, name2, rng.randint(1, 5), rng.randint(1, 5), winner))
+    return history
+
+
+def test_incremental_matches_recompute():
+    history = random_history(200)
+    incremental = {}
+    for record in history:
+        apply_result(incremental, record)
+    recomputed = recompute_skill_ratings(history)
+
+    assert incremental.keys() == recomputed.keys()
+    for name, entry in recomputed.items():
+        assert incremental[name]["elo"] == pytest.approx(entry["elo"])
+        for field in ("debates", "wins", "losses", "draws"):
+            assert incremental[name][field] == entry[field]
+
+
+def test_ratings_are_zero_sum():
+    ratings = recompute_skill_ratings(random_history(50, seed=1))
+    assert sum(entry["elo"] for entry in ratings.values()) == pytest.approx(DEFAULT_RATING * len(ratings))
+
+
+def test_declared_winner_beats_rating_margin():
+    # Judge named Blaze the winner although Athena got the higher rating
+    assert match_result(debate("Athena", "Blaze", 5, 3, winner="Blaze")) == (0.0, 0)
+    assert match_result(debate("Athena", "Blaze", 4, 4)) == (0.5, 0)
+    assert match_result(debate("Athena", "Blaze", 2, 5)) == (0.0, 3)
+
+
+def test_upset_moves_ratings_more():
+    ratings = {"Athena": {"elo": 1700.0, "debates": 0, "wins": 0, "losses": 0, "draws": 0}}
+    apply_result(ratings, debate("Athena", "Blaze", 3, 4, winner="Blaze"))
+    upset_gain = ratings["Blaze"]["elo"] - DEFAULT_RATING
+
+    even = {}
+    apply_result(even, debate("Athena", "Blaze", 3, 4, winner="Blaze"))
+    assert upset_gain > even["Blaze"]["elo"] - DEFAULT_RATING > 0
+    assert expected_score(1700.0, DEFAULT_RATING) > 0.5
+
+
+def test_empty_history():
+    assert recompute_skill_ratings([]) == {}
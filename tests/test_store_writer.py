@@ -0,0 +1,43 @@
+"""Single-writer claim on a debate store."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from core import memory_system
+from core.memory_system import DebateMemory, StoreInUseError
+
+pytestmark = pytest.mark.skipif(memory_system.fcntl is None, reason="needs fcntl file locks")
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLAIM = "import sys; from core.memory_system import DebateMemory; DebateMemory(sys.argv[1]).claim_writer()"
+
+
+def claim_in_subprocess(path):
+    return subprocess.run([sys.executable, "-c", CLAIM, path], cwd=PROJECT_ROOT, capture_output=True, text=True)
+
+
+def test_second_process_is_refused(tmp_path):
+    path = str(tmp_path / "debate_history.json")
+    memory = DebateMemory(path)
+    memory.claim_writer()
+    memory.claim_writer()  # claiming again is a no-op
+
+    result = claim_in_subprocess(path)
+    assert result.returncode != 0 and "StoreInUseError" in result.stderr
+    # A separate store is fine
+    assert claim_in_subprocess(str(tmp_path / "api_history.json")).returncode == 0
+    memory.rubric_store.close()
+
+
+def test_claim_is_released_with_the_holder(tmp_path):
+    path = str(tmp_path / "debate_history.json")
+    assert claim_in_subprocess(path).returncode == 0
+    memory = DebateMemory(path)
+    memory.claim_writer()
+    with pytest.raises(StoreInUseError):
+        DebateMemory(path).claim_writer()
+    memory.rubric_store.close()
@@ -0,0 +1,110 @@
+"""UsageMeter recording, pricing and token budget."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.prompts import estimate_tokens
+from core.usage_meter import TokenBudgetExceeded, UsageMeter, aggregate_usage
+
+
+class Output(str):
+    """Runner output reporting token counts the way a CrewOutput does."""
+
+    def __new__(cls, text, prompt_tokens=0, completion_tokens=0):
+        output = super().__new__(cls, text)
+        output.token_usage = SimpleNamespace(prompt_tokens=prompt_tokens,
+                                             completion_tokens=completion_tokens, cached_prompt_tokens=0)
+        return output
+
+
+def runner(tokens=(100, 50)):
+    calls = []
+
+    def run(agent, prompt, *args):
+        calls.append(prompt)
+        return Output("answer", *tokens)
+    run.calls = calls
+    return run
+
+
+ATHENA = SimpleNamespace(name="Athena")
+JUSTICE = SimpleNamespace(name="Justice")
+
+
+@pytest.fixture(autouse=True)
+def no_env_overrides(monkeypatch):
+    for name in ("DEBATE_TOKEN_BUDGET", "OPENAI_MODEL_NAME", "LLM_PRICE_PER_MTOK"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_summary_rolls_up_by_agent_and_round():
+    meter = UsageMeter(model="gpt-4o-mini")
+    meter.track("opening", runner())(ATHENA, "prompt")
+    meter.track("rebuttal", runner())(ATHENA, "prompt")
+    meter.track("verdict", runner((200, 100)))(JUSTICE, "prompt")
+
+    summary = meter.summary()
+    assert summary["total"]["total_tokens"] == 600
+    assert summary["by_agent"]["Athena"]["calls"] == 2
+    assert summary["by_agent"]["Justice"]["role"] == "judge"
+    assert summary["by_round"]["verdict"]["prompt_tokens"] == 200
+    # 400 prompt tokens at $0.15/M and 200 completion tokens at $0.60/M
+    assert summary["total"]["cost_usd"] == pytest.approx(0.00018)
+    assert not summary["estimated"]
+
+
+def test_outputs_without_counts_are_estimated():
+    meter = UsageMeter(model="unknown-model")
+    meter.call("opening", lambda agent, prompt: "a reply", ATHENA, "some prompt text")
+    summary = meter.summary(include_calls=False)
+    assert summary["estimated"]
+    assert summary["total"]["prompt_tokens"] == estimate_tokens("some prompt text")
+    assert summary["total"]["cost_usd"] is None
+    assert "calls" not in summary
+
+
+def test_budget_raises_after_the_call_that_goes_over():
+    meter = UsageMeter(token_budget=200)
+    run = meter.track("opening", runner())
+    run(ATHENA, "prompt")
+    with pytest.raises(TokenBudgetExceeded) as raised:
+        run(ATHENA, "prompt")
+    assert raised.value.usage["total"]["total_tokens"] == 300
+    assert "aborted" in raised.value.usage
+
+
+def test_budget_refuses_a_call_that_cannot_fit():
+    seen = []
+    meter = UsageMeter(token_budget=200, on_exceeded=seen.append)
+    run = runner()
+    meter.call("opening", run, ATHENA, "short")
+    with pytest.raises(TokenBudgetExceeded):
+        meter.call("rebuttal", run, ATHENA, "word " * 400)
+    # Refused before running; the spend so far is handed to on_exceeded
+    assert len(run.calls) == 1
+    assert seen[0]["total"]["total_tokens"] == 150 and "rebuttal" in seen[0]["aborted"]
+
+
+def test_budget_from_environment(monkeypatch):
+    monkeypatch.setenv("DEBATE_TOKEN_BUDGET", "1000")
+    monkeypatch.setenv("OPENAI_MODEL_NAME", "gpt-4o")
+    meter = UsageMeter()
+    assert meter.token_budget == 1000 and meter.model == "gpt-4o"
+    # 0 turns the limit off, e.g. to override the environment for one debate
+    assert UsageMeter(token_budget=0).token_budget is None
+
+
+def test_aggregate_usage_across_debates():
+    debates = []
+    for tokens in ((100, 50), (10, 5)):
+        meter = UsageMeter()
+        meter.track("opening", runner(tokens))(ATHENA, "prompt")
+        meter.track("verdict", runner(tokens))(JUSTICE, "prompt")
+        debates.append({"usage": meter.summary()})
+    debates.append({})
+
+    by_role = aggregate_usage(debates, group_by="role")
+    assert set(by_role) == {"debater", "judge"}
+    assert by_role["debater"]["debates"] == 2
+    assert by_role["debater"]["total_tokens"] == 165